@@ -0,0 +1,240 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: ColumnarValueStore
+## Description: Columnar (array-backed) Verification Value Store of a Descriptor Field
+########################################################################
+
+from array import array
+
+from FieldFormatEnum import FieldFormatEnum
+from VerificationValue import VerificationValue
+from VerificationLevelEnum import VerificationLevelEnum
+from VerificationOperatorEnum import VerificationOperatorEnum
+
+class ColumnarValueStore:
+
+    ####################################
+    ## Columnar Value Store Constants ##
+    ####################################
+
+    # Operator Codes (Operator Enum <-> Code)
+    OPERATORS = list(VerificationOperatorEnum)
+    OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS)}
+
+    # Flag Bits
+    FLAG_MANDATORY = 0x01
+    FLAG_HEX_UPPERCASE = 0x02
+    FLAG_HEX_TEXT = 0x04
+
+    # String Pool Encoding
+    STRING_ENCODING = "utf-8"
+
+    # Range Value Packing (Between Operator: High Bound on upper Bits, Low Bound on lower Bits)
+    RANGE_VALUE_SHIFT = 32
+    RANGE_LENGTH_SHIFT = 8
+
+    ####################################
+    ## Columnar Value Store Variables ##
+    ####################################
+
+    # Field Value Format
+    valueFormat = None
+
+    # Operator Codes (1 byte per Value)
+    operators = None
+
+    # Flags: Verification Level, Hex Case & mixed Case Hex Text (1 byte per Value)
+    flags = None
+
+    # Numeric Value (Number & Hex Format) or String Pool Offset (String Format & mixed Case Hex Format)
+    values = None
+
+    # Number/Hex Digit Count or String Byte Length
+    lengths = None
+
+    # String Pool (all String Values & mixed Case Hex Values, UTF-8 encoded)
+    stringPool = None
+
+    #########################################
+    ## Public Columnar Value Store Methods ##
+    #########################################
+
+    ### Constructor (Empty Store of a Field Format) ###
+    def __init__(self, valueFormat):
+        self.valueFormat = valueFormat
+        self.operators = array('B')
+        self.flags = array('B')
+        self.values = array('Q')
+        self.lengths = array('H')
+        self.stringPool = bytearray()
+
+    ### Number of Values ###
+    def __len__(self):
+        return len(self.operators)
+
+    ### Get Value at Index (as Verification Value) ###
+    def __getitem__(self, index):
+        return self.__getVerificationValue(range(len(self.operators))[index])
+
+    ### Iterate on Values (as Verification Values) ###
+    def __iter__(self):
+        for i in range(len(self.operators)):
+            yield self.__getVerificationValue(i)
+
+    ### Append Verification Value ###
+    def append(self, verificationValue):
+        self.insert(len(self.operators), verificationValue)
+
+    ### Insert Verification Value at Index ###
+    def insert(self, index, verificationValue):
+        (operatorCode, flags, value, length) = self.__encodeVerificationValue(verificationValue)
+        self.operators.insert(index, operatorCode)
+        self.flags.insert(index, flags)
+        self.values.insert(index, value)
+        self.lengths.insert(index, length)
+
+    ### Append Verification Values ###
+    def extend(self, verificationValues):
+        self[len(self.operators):] = verificationValues
+
+    ### Replace Slice with Verification Values (Single Move per Column) ###
+    def __setitem__(self, index, verificationValues):
+
+        # Only Contiguous Slices are supported
+        if (not isinstance(index, slice)) or (index.step not in (None, 1)):
+            raise Exception("Columnar Value Store only supports contiguous slice assignment !")
+
+        # Encode New Values
+        operators = array('B')
+        flags = array('B')
+        values = array('Q')
+        lengths = array('H')
+        for el in verificationValues:
+            (operatorCode, flag, value, length) = self.__encodeVerificationValue(el)
+            operators.append(operatorCode)
+            flags.append(flag)
+            values.append(value)
+            lengths.append(length)
+
+        # Replace Columns
+        self.operators[index] = operators
+        self.flags[index] = flags
+        self.values[index] = values
+        self.lengths[index] = lengths
+
+    ### Copy Store (Copy-on-Write Snapshots) ###
+    def copy(self):
+        store = ColumnarValueStore(self.valueFormat)
+        store.operators = array('B', self.operators)
+        store.flags = array('B', self.flags)
+        store.values = array('Q', self.values)
+        store.lengths = array('H', self.lengths)
+        store.stringPool = bytearray(self.stringPool)
+        return store
+
+    ### Get Memory Footprint (in Bytes) ###
+    def getMemoryFootprint(self):
+        return \
+            self.operators.itemsize * len(self.operators) + \
+            self.flags.itemsize * len(self.flags) + \
+            self.values.itemsize * len(self.values) + \
+            self.lengths.itemsize * len(self.lengths) + \
+            len(self.stringPool)
+
+    ##########################################
+    ## Private Columnar Value Store Methods ##
+    ##########################################
+
+    ### Encode Verification Value to Columns ###
+    ### Return: (Operator Code, Flags, Numeric Value or String Offset, Length)
+    def __encodeVerificationValue(self, verificationValue):
+
+        # Operator Code
+        operatorCode = self.OPERATOR_CODES[verificationValue.operator]
+
+        # Verification Level Flag
+        flags = 0
+        if (VerificationLevelEnum.MANDATORY == verificationValue.verificationLevel):
+            flags |= self.FLAG_MANDATORY
+
+        # Value Format
+        match self.valueFormat:
+            case FieldFormatEnum.NUMBER:
+                return (operatorCode, flags) + self.__encodeNumericValue(verificationValue, 10)
+
+            case FieldFormatEnum.HEX:
+
+                # Lower Case Hex
+                if (verificationValue.value == verificationValue.value.lower()):
+                    return (operatorCode, flags) + self.__encodeNumericValue(verificationValue, 16)
+
+                # Upper Case Hex
+                if (verificationValue.value == verificationValue.value.upper()):
+                    return (operatorCode, flags | self.FLAG_HEX_UPPERCASE) + self.__encodeNumericValue(verificationValue, 16)
+
+                # Mixed Case Hex (original Text kept in the String Pool)
+                return (operatorCode, flags | self.FLAG_HEX_TEXT) + self.__encodeStringValue(verificationValue)
+
+            case FieldFormatEnum.STRING:
+                return (operatorCode, flags) + self.__encodeStringValue(verificationValue)
+
+            case _:
+                raise Exception("Unknown Field Format !")
+
+    ### Encode String Value (appended to the String Pool) ###
+    ### Return: (String Pool Offset, Byte Length)
+    def __encodeStringValue(self, verificationValue):
+        encodedValue = verificationValue.value.encode(self.STRING_ENCODING)
+        offset = len(self.stringPool)
+        self.stringPool += encodedValue
+        return (offset, len(encodedValue))
+
+    ### Decode String Value (from the String Pool) ###
+    def __decodeStringValue(self, index):
+        offset = self.values[index]
+        return self.stringPool[offset:offset + self.lengths[index]].decode(self.STRING_ENCODING)
+
+    ### Encode Number/Hex Value (Range Value: High & Low Bounds packed) ###
+    ### Return: (Numeric Value, Length)
+    def __encodeNumericValue(self, verificationValue, base):
+        if (verificationValue.operator == VerificationOperatorEnum.BETWEEN):
+            (lowValue, highValue) = verificationValue.value.split(VerificationValue.RANGE_SEPARATOR)
+            return ((int(highValue, base) << self.RANGE_VALUE_SHIFT) | int(lowValue, base), (len(highValue) << self.RANGE_LENGTH_SHIFT) | len(lowValue))
+        return (int(verificationValue.value, base), len(verificationValue.value))
+
+    ### Decode Number/Hex Value (Range Value: High & Low Bounds unpacked) ###
+    def __decodeNumericValue(self, index, operator, valueFormat):
+        if (operator == VerificationOperatorEnum.BETWEEN):
+            lowValue = format(self.values[index] & ((1 << self.RANGE_VALUE_SHIFT) - 1), '0' + str(self.lengths[index] & ((1 << self.RANGE_LENGTH_SHIFT) - 1)) + valueFormat)
+            highValue = format(self.values[index] >> self.RANGE_VALUE_SHIFT, '0' + str(self.lengths[index] >> self.RANGE_LENGTH_SHIFT) + valueFormat)
+            return lowValue + VerificationValue.RANGE_SEPARATOR + highValue
+        return format(self.values[index], '0' + str(self.lengths[index]) + valueFormat)
+
+    ### Decode Columns to Verification Value ###
+    def __getVerificationValue(self, index):
+
+        # Operator & Verification Level
+        operator = self.OPERATORS[self.operators[index]]
+        if (self.flags[index] & self.FLAG_MANDATORY):
+            verificationLevel = VerificationLevelEnum.MANDATORY
+        else:
+            verificationLevel = VerificationLevelEnum.OPTIONAL
+
+        # Value Format
+        match self.valueFormat:
+            case FieldFormatEnum.NUMBER:
+                value = self.__decodeNumericValue(index, operator, 'd')
+
+            case FieldFormatEnum.HEX:
+                if (self.flags[index] & self.FLAG_HEX_TEXT):
+                    value = self.__decodeStringValue(index)
+                elif (self.flags[index] & self.FLAG_HEX_UPPERCASE):
+                    value = self.__decodeNumericValue(index, operator, 'X')
+                else:
+                    value = self.__decodeNumericValue(index, operator, 'x')
+
+            case _:
+                value = self.__decodeStringValue(index)
+
+        return VerificationValue.fromVerifiedValue(value, self.valueFormat, verificationLevel, operator)
@@ -0,0 +1,312 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: CommandParser
+## Description: USB Verification Command Language Parser
+##              add usb_descriptor usb_field operator value [and/or] [operator value [and/or]] ...
+##              remove usb_descriptor usb_field value [operator]
+##              import path_to_file_or_glob [path_to_file_or_glob] ... [continue/failfast] [cache]
+##              import-inventory path_to_file_or_glob [path_to_file_or_glob] ... [continue/failfast]
+##              include path_to_file_or_glob [path_to_file_or_glob] ... (Import File only, Paths relative to the Import File)
+##              export [directory_path]
+##              summary [usb_descriptor [usb_field]]
+##              snapshot/rollback/diff [snapshot_name]
+##              help
+##              quit
+########################################################################
+
+import re
+
+# USB Descriptors
+from DeviceDescriptor import DeviceDescriptor
+from ConfigurationDescriptor import ConfigurationDescriptor
+from InterfaceDescriptor import InterfaceDescriptor
+from HIDDescriptor import HIDDescriptor
+from EndpointDescriptor import EndpointDescriptor
+from DeviceQualifierDescriptor import DeviceQualifierDescriptor
+from OtherSpeedDescriptor import OtherSpeedDescriptor
+
+# Verification Order, Operator, Level, Value & Command
+from VerificationOrderEnum import VerificationOrderEnum, VERIFICATION_ORDER_ALIASES
+from VerificationOperatorEnum import VerificationOperatorEnum, VERIFICATION_OPERATOR_ALIASES
+from VerificationLevelEnum import VerificationLevelEnum, VERIFICATION_LEVEL_ALIASES
+from ImportModeEnum import ImportModeEnum, IMPORT_MODE_ALIASES
+from VerificationValue import VerificationValue
+from VerificationCommand import VerificationCommand
+
+class CommandParser:
+
+    ##############################
+    ## Command Parser Constants ##
+    ##############################
+
+    # Token Pattern (any non-space characters)
+    TOKEN_PATTERN = re.compile(r'\S+')
+
+    # USB Descriptor Classes {Casefolded Descriptor Type: Descriptor Class} (built once at import)
+    DESCRIPTOR_CLASSES = {descriptorClass.DESCRIPTOR_TYPE.casefold(): descriptorClass for descriptorClass in (
+        DeviceDescriptor,
+        ConfigurationDescriptor,
+        InterfaceDescriptor,
+        HIDDescriptor,
+        EndpointDescriptor,
+        DeviceQualifierDescriptor,
+        OtherSpeedDescriptor
+    )}
+
+    # Import Policy Cache Option (Import Order only, last Token)
+    IMPORT_CACHE_OPTION = "cache"
+
+    ##########################################
+    ## Public Static Command Parser Methods ##
+    ##########################################
+
+    ### Parse Command Line ###
+    ### Return: Verification Command
+    def parseCommand(line):
+
+        # Tokens: List[(Token, Column)]
+        tokens = [(match.group(), match.start() + 1) for match in CommandParser.TOKEN_PATTERN.finditer(line)]
+
+        # End of Line Column (for Missing elements)
+        endColumn = len(line.rstrip()) + 1
+
+        # Verification Order
+        order = CommandParser.__parseAlias(tokens, 0, endColumn, VERIFICATION_ORDER_ALIASES, "Order", VerificationOrderEnum.getVerificationOrderEnumDetails)
+
+        # Order Grammar
+        match order:
+            case VerificationOrderEnum.ADD:
+                return CommandParser.__parseAddCommand(tokens, endColumn)
+
+            case VerificationOrderEnum.REMOVE:
+                return CommandParser.__parseRemoveCommand(tokens, endColumn)
+
+            case VerificationOrderEnum.IMPORT | VerificationOrderEnum.IMPORT_INVENTORY | VerificationOrderEnum.INCLUDE:
+                return CommandParser.__parseImportCommand(tokens, endColumn, order)
+
+            case VerificationOrderEnum.SUMMARY:
+                return CommandParser.__parseSummaryCommand(tokens)
+
+            case VerificationOrderEnum.HELP | VerificationOrderEnum.QUIT:
+                CommandParser.__parseEndOfLine(tokens, 1)
+                return VerificationCommand(order)
+
+            # Optional Argument (Export Directory or Snapshot Name)
+            case _:
+                CommandParser.__parseEndOfLine(tokens, 2)
+                return VerificationCommand(order, arguments=[token for (token, column) in tokens[1:]])
+
+    ### Get Column Error ###
+    def columnError(column, error):
+        return Exception("Column " + str(column) + ": " + str(error))
+
+    ### Pack Verification Command (plain JSON Lists: Enums & Descriptor Field by Name) ###
+    ### Return: [Order, Descriptor Type, Field Name, Values, Value Columns, Arguments]
+    def packCommand(command):
+        values = command.values
+        arguments = command.arguments
+        match command.order:
+            case VerificationOrderEnum.ADD:
+                values = [[value, verificationLevel.name if (verificationLevel != None) else None, operator.name] for (value, verificationLevel, operator) in values]
+
+            case VerificationOrderEnum.REMOVE:
+                values = [[value, operator.name if (operator != None) else None] for (value, operator) in values]
+
+            case VerificationOrderEnum.IMPORT | VerificationOrderEnum.IMPORT_INVENTORY | VerificationOrderEnum.INCLUDE:
+                arguments = arguments[:-2] + [arguments[-2].name, arguments[-1]]
+
+        return [command.order.name, command.descriptorType, command.field.name if (command.field != None) else None, values, command.valueColumns, arguments]
+
+    ### Unpack Verification Command (packed with packCommand, malformed Command raises an Exception) ###
+    ### Return: Verification Command
+    def unpackCommand(packedCommand):
+        (order, descriptorType, fieldName, values, valueColumns, arguments) = packedCommand
+        order = VerificationOrderEnum[order]
+
+        # USB Descriptor & Field
+        field = None
+        if (descriptorType != None):
+            descriptorClass = CommandParser.DESCRIPTOR_CLASSES[descriptorType.casefold()]
+            descriptorType = descriptorClass.DESCRIPTOR_TYPE
+            if (fieldName != None):
+                field = descriptorClass.FIELD_REGISTRY[fieldName.casefold()]
+
+        match order:
+            case VerificationOrderEnum.ADD:
+                values = [(str(value), VerificationLevelEnum[verificationLevel] if (verificationLevel != None) else None, VerificationOperatorEnum[operator]) for (value, verificationLevel, operator) in values]
+
+            case VerificationOrderEnum.REMOVE:
+                values = [(str(value), VerificationOperatorEnum[operator] if (operator != None) else None) for (value, operator) in values]
+
+            case VerificationOrderEnum.IMPORT | VerificationOrderEnum.IMPORT_INVENTORY | VerificationOrderEnum.INCLUDE:
+                arguments = [str(argument) for argument in arguments[:-2]] + [ImportModeEnum[arguments[-2]], arguments[-1] == True]
+
+        return VerificationCommand(order, descriptorType, field, values, [int(column) for column in valueColumns], arguments)
+
+    ###########################################
+    ## Private Static Command Parser Methods ##
+    ###########################################
+
+    ### Parse Add Command ###
+    ### add usb_descriptor usb_field operator value [and/or] [operator value [and/or]] ...
+    def __parseAddCommand(tokens, endColumn):
+
+        # USB Descriptor & Field
+        (descriptorClass, field) = CommandParser.__parseDescriptorField(tokens, endColumn)
+
+        # Verification Values (at least one)
+        CommandParser.__parseMissing(tokens, 3, endColumn)
+        values = []
+        valueColumns = []
+        verificationLevel = None
+        i = 3
+        while (i < len(tokens)):
+
+            # Operator (on one or two Tokens)
+            (operator, i) = CommandParser.__parseOperator(tokens, i, endColumn)
+
+            # Value
+            CommandParser.__parseMissing(tokens, i, endColumn)
+            (value, valueColumn) = tokens[i]
+            try:
+                VerificationValue.checkValue(value, field.length, field.valueFormat, operator)
+            except Exception as e:
+                raise CommandParser.columnError(valueColumn, e)
+            i += 1
+
+            # Verification Level (optional, same as previous Value when missing)
+            if (i < len(tokens)) and (tokens[i][0].casefold() in VERIFICATION_LEVEL_ALIASES):
+                verificationLevel = VERIFICATION_LEVEL_ALIASES[tokens[i][0].casefold()]
+                i += 1
+
+            values.append((value, verificationLevel, operator))
+            valueColumns.append(valueColumn)
+
+        return VerificationCommand(VerificationOrderEnum.ADD, descriptorClass.DESCRIPTOR_TYPE, field, values, valueColumns)
+
+    ### Parse Remove Command ###
+    ### remove usb_descriptor usb_field value [operator]
+    def __parseRemoveCommand(tokens, endColumn):
+
+        # USB Descriptor & Field
+        (descriptorClass, field) = CommandParser.__parseDescriptorField(tokens, endColumn)
+
+        # Value
+        CommandParser.__parseMissing(tokens, 3, endColumn)
+        (value, valueColumn) = tokens[3]
+
+        # Operator (optional, on one or two Tokens)
+        operator = None
+        i = 4
+        if (i < len(tokens)):
+            (operator, i) = CommandParser.__parseOperator(tokens, i, endColumn)
+        CommandParser.__parseEndOfLine(tokens, i)
+
+        return VerificationCommand(VerificationOrderEnum.REMOVE, descriptorClass.DESCRIPTOR_TYPE, field, [(value, operator)], [valueColumn])
+
+    ### Parse Import Command (Import, Import Inventory & Include Orders) ###
+    ### import path_to_file_or_glob [path_to_file_or_glob] ... [continue/failfast] [cache]
+    ### Arguments: [Import File, ..., Import Mode, Policy Cache]
+    def __parseImportCommand(tokens, endColumn, order):
+
+        # Policy Cache Option (optional, last Token, Import Order only)
+        policyCache = False
+        if (order == VerificationOrderEnum.IMPORT) and (len(tokens) > 2) and (tokens[-1][0].casefold() == CommandParser.IMPORT_CACHE_OPTION):
+            policyCache = True
+            tokens = tokens[:-1]
+
+        # Import Mode (optional, last Token)
+        importMode = ImportModeEnum.CONTINUE
+        if (len(tokens) > 2) and (tokens[-1][0].casefold() in IMPORT_MODE_ALIASES):
+            importMode = IMPORT_MODE_ALIASES[tokens[-1][0].casefold()]
+            tokens = tokens[:-1]
+
+        # Import Files (at least one)
+        CommandParser.__parseMissing(tokens, 1, endColumn)
+
+        return VerificationCommand(order, arguments=[token for (token, column) in tokens[1:]] + [importMode, policyCache])
+
+    ### Parse Summary Command ###
+    ### summary [usb_descriptor [usb_field]]
+    def __parseSummaryCommand(tokens):
+
+        # Summary of All Verification Values
+        if (len(tokens) == 1):
+            return VerificationCommand(VerificationOrderEnum.SUMMARY)
+
+        # Summary of Descriptor
+        descriptorClass = CommandParser.__parseDescriptor(tokens, 1)
+        if (len(tokens) == 2):
+            return VerificationCommand(VerificationOrderEnum.SUMMARY, descriptorClass.DESCRIPTOR_TYPE)
+
+        # Summary of Specific Descriptor USB Field
+        field = CommandParser.__parseField(tokens, 2, descriptorClass)
+        CommandParser.__parseEndOfLine(tokens, 3)
+        return VerificationCommand(VerificationOrderEnum.SUMMARY, descriptorClass.DESCRIPTOR_TYPE, field)
+
+    ### Parse USB Descriptor & Field Tokens ###
+    ### Return: (Descriptor Class, Descriptor Field)
+    def __parseDescriptorField(tokens, endColumn):
+        CommandParser.__parseMissing(tokens, 1, endColumn)
+        descriptorClass = CommandParser.__parseDescriptor(tokens, 1)
+        CommandParser.__parseMissing(tokens, 2, endColumn)
+        return (descriptorClass, CommandParser.__parseField(tokens, 2, descriptorClass))
+
+    ### Parse USB Descriptor Token ###
+    ### Return: Descriptor Class
+    def __parseDescriptor(tokens, index):
+        (token, column) = tokens[index]
+        descriptorClass = CommandParser.DESCRIPTOR_CLASSES.get(token.casefold())
+
+        if (descriptorClass == None):
+            raise CommandParser.columnError(column, "Unkown USB Descriptor with name " + token)
+
+        return descriptorClass
+
+    ### Parse USB Descriptor Field Token ###
+    ### Return: Descriptor Field
+    def __parseField(tokens, index, descriptorClass):
+        (token, column) = tokens[index]
+        field = descriptorClass.FIELD_REGISTRY.get(token.casefold())
+
+        if (field == None):
+            raise CommandParser.columnError(column, "Unkown " + descriptorClass.DESCRIPTOR_NAME + " Field: " + token)
+
+        return field
+
+    ### Parse Operator Token (Two Tokens Aliases first, e.g. "greater equals") ###
+    ### Return: (Operator, Next Token Index)
+    def __parseOperator(tokens, index, endColumn):
+
+        # Two Tokens Alias
+        if (index + 1 < len(tokens)):
+            operator = VERIFICATION_OPERATOR_ALIASES.get((tokens[index][0] + " " + tokens[index+1][0]).casefold())
+            if (operator != None):
+                return (operator, index + 2)
+
+        # One Token Alias
+        operator = CommandParser.__parseAlias(tokens, index, endColumn, VERIFICATION_OPERATOR_ALIASES, "Operator", VerificationOperatorEnum.getVerificationOperatorEnumDetails)
+        return (operator, index + 1)
+
+    ### Parse Alias Token ###
+    ### Return: Enum of the Alias
+    def __parseAlias(tokens, index, endColumn, aliases, aliasName, getAliasDetails):
+        CommandParser.__parseMissing(tokens, index, endColumn)
+        (token, column) = tokens[index]
+        result = aliases.get(token.casefold())
+
+        if (result == None):
+            raise CommandParser.columnError(column, "Wrong " + aliasName + " " + token + " ! Must be one of: " + getAliasDetails())
+
+        return result
+
+    ### Check Token is present ###
+    def __parseMissing(tokens, index, endColumn):
+        if (index >= len(tokens)):
+            raise CommandParser.columnError(endColumn, "Missing element !")
+
+    ### Check no Token remains ###
+    def __parseEndOfLine(tokens, index):
+        if (index < len(tokens)):
+            raise CommandParser.columnError(tokens[index][1], "Unexpected element " + tokens[index][0] + " !")
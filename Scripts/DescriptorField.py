@@ -0,0 +1,50 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: DescriptorField
+## Description: USB Descriptor Field Schema Class
+########################################################################
+
+class DescriptorField:
+
+    ################################
+    ## Descriptor Field Variables ##
+    ################################
+
+    # Field Name
+    name = ""
+
+    # Field Match Name (casefolded Field Name)
+    match = ""
+
+    # Field Max Value Length
+    length = 0
+
+    # Field Value Format
+    valueFormat = None
+
+    # VHDL Source Index & Count Patterns
+    sourceIndexPattern = ""
+    sourceCountPattern = ""
+
+    #####################################
+    ## Public Descriptor Field Methods ##
+    #####################################
+
+    ### Constructor (All Args) ###
+    def __init__(self, name, length, valueFormat, sourceIndexPattern, sourceCountPattern):
+        self.name = name
+        self.match = name.casefold()
+        self.length = length
+        self.valueFormat = valueFormat
+        self.sourceIndexPattern = sourceIndexPattern
+        self.sourceCountPattern = sourceCountPattern
+
+    ############################################
+    ## Public Static Descriptor Field Methods ##
+    ############################################
+
+    ### Build Field Registry from Descriptor Fields ###
+    ### Return: Dict {Field Match Name: Descriptor Field}
+    def buildFieldRegistry(descriptorFields):
+        return {field.match: field for field in descriptorFields}
@@ -0,0 +1,48 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: ImportModeEnum
+## Description: Import Error Handling Mode Enum
+########################################################################
+
+from enum import Enum
+
+class ImportModeEnum(Enum):
+    CONTINUE = ["continue", "cont"]
+    FAIL_FAST = ["failfast", "ff"]
+
+    ################################
+    ## Public Import Mode Methods ##
+    ################################
+
+    ### Get Import Mode Details ###
+    def getImportModeEnumDetails():
+        i = 1
+        details = ""
+        for el in ImportModeEnum:
+            details += el.name + "(" + ','.join(el.value) + ")"
+            if i < len(ImportModeEnum):
+                details += ", "
+                i += 1
+        return details
+
+    ### Get Import Mode Enum from User Value ###
+    def getImportModeEnum(userValue):
+
+        # Already an Import Mode
+        if (isinstance(userValue, ImportModeEnum)):
+            return userValue
+
+        # Alias Lookup (Alias Table built once)
+        selectedMode = IMPORT_MODE_ALIASES.get(userValue.casefold())
+
+        if (selectedMode == None):
+            raise Exception("Wrong Import Mode " + str(userValue) + " ! Must be one of: " + ImportModeEnum.getImportModeEnumDetails())
+
+        return selectedMode
+
+# Import Mode Aliases {Casefolded Alias: Import Mode} (built once at import)
+IMPORT_MODE_ALIASES = {}
+for el in ImportModeEnum:
+    for alias in el.value:
+        IMPORT_MODE_ALIASES.setdefault(alias.casefold(), el)
@@ -0,0 +1,183 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: InventoryCompiler
+## Description: Compiler of Fleet Inventory CSV files into Device Descriptor Allow-Lists
+##              vid,pid,manufacturer,product,serial (optional Header Row, empty Cell: any Value)
+##              One csv.reader Pass, Values deduplicated per Field, ROM Depth estimated before Insertion
+########################################################################
+
+import math
+
+from FieldFormatEnum import FieldFormatEnum
+from VerificationLevelEnum import VerificationLevelEnum
+from VerificationOperatorEnum import VerificationOperatorEnum
+from VerificationValue import VerificationValue
+from DeviceDescriptor import DeviceDescriptor
+
+class InventoryCompiler:
+
+    ##################################
+    ## Inventory Compiler Constants ##
+    ##################################
+
+    # Inventory Columns (default Column order) {Column Name: Device Descriptor Field Name}
+    INVENTORY_COLUMNS = {
+        "vid": "idVendor",
+        "pid": "idProduct",
+        "manufacturer": "iManufacturer",
+        "product": "iProduct",
+        "serial": "iSerialNumber"
+    }
+
+    # Hex Value Prefix (optional in Inventory Cells)
+    INVENTORY_HEX_PREFIX = "0x"
+
+    # Verification Level & Operator of Inventory Values (Allow-List: any listed Value)
+    INVENTORY_VERIF_LEVEL = VerificationLevelEnum.OPTIONAL
+    INVENTORY_OPERATOR = VerificationOperatorEnum.EQUALS
+
+    ##################################
+    ## Inventory Compiler Variables ##
+    ##################################
+
+    # Inventory Field Values (deduplicated, first Occurrence kept) {Field Name: {Value: (Import File, Line Number)}}
+    fieldValues = None
+
+    # Inventory Cells already read (raw Cells) {Field Name: {Cell}}
+    seenCells = None
+
+    # Inventory Counters
+    rowCount = 0
+    duplicateCellCount = 0
+
+    #######################################
+    ## Public Inventory Compiler Methods ##
+    #######################################
+
+    ### Constructor (Empty Inventory) ###
+    def __init__(self):
+        self.fieldValues = {fieldName: {} for fieldName in self.INVENTORY_COLUMNS.values()}
+        self.seenCells = {fieldName: set() for fieldName in self.INVENTORY_COLUMNS.values()}
+        self.rowCount = 0
+        self.duplicateCellCount = 0
+
+    ### Read Inventory Rows (csv.reader of one Inventory File, streamed) ###
+    ### Return: Generator of (Line Number, Error) for wrong Rows
+    def readInventory(self, importFile, fileReader):
+        fields = [DeviceDescriptor.FIELD_REGISTRY[fieldName.casefold()] for fieldName in self.INVENTORY_COLUMNS.values()]
+        firstRow = True
+
+        for row in fileReader:
+
+            # Empty Row
+            if (any(row) == False):
+                continue
+
+            # Header Row (Column order of the File)
+            if (firstRow == True):
+                firstRow = False
+                header = [cell.strip().casefold() for cell in row]
+                if (set(header) <= self.INVENTORY_COLUMNS.keys()):
+                    fields = [DeviceDescriptor.FIELD_REGISTRY[self.INVENTORY_COLUMNS[column].casefold()] for column in header]
+                    continue
+
+            self.rowCount += 1
+
+            if (len(row) != len(fields)):
+                yield (fileReader.line_num, "Wrong column number " + str(len(row)) + " ! Must be: " + ", ".join(self.INVENTORY_COLUMNS.keys()))
+                continue
+
+            # Field Values (Hash Set per Field, first Occurrence Location kept, Cells already seen are not normalized again)
+            for (field, cell) in zip(fields, row):
+                cells = self.seenCells[field.name]
+                if (cell in cells):
+                    self.duplicateCellCount += 1
+                    continue
+                cells.add(cell)
+
+                value = InventoryCompiler.__normalizeValue(field, cell)
+                if (value == ""):
+                    continue
+
+                values = self.fieldValues[field.name]
+                if (value in values):
+                    self.duplicateCellCount += 1
+                else:
+                    values[value] = (importFile, fileReader.line_num)
+
+    ### Check Inventory Values Format & Length (one Batch per Field, invalid Values removed) ###
+    ### Return: List of (Import File, Line Number, Error)
+    def checkValues(self):
+        errors = []
+
+        for (fieldName, values) in self.fieldValues.items():
+            field = DeviceDescriptor.FIELD_REGISTRY[fieldName.casefold()]
+            valueList = list(values)
+
+            for (position, error) in VerificationValue.checkValues(valueList, field.length, field.valueFormat):
+                (importFile, lineNumber) = values.pop(valueList[position])
+                errors.append((importFile, lineNumber, field.name + ": " + str(error)))
+
+        return errors
+
+    ### Estimate ROM Depth per Operator after Insertion (Values already in the Policy counted as new) ###
+    ### Return: Dict {Operator: (Current Memory Rows, Estimated Memory Rows, Estimated Memory Address Bit Length)}
+    def estimateMemoryDepths(self, session):
+        estimate = {}
+
+        # Inventory Memory Rows (same Rows as Verification Values)
+        inventoryRows = 0
+        for (fieldName, values) in self.fieldValues.items():
+            valueFormat = DeviceDescriptor.FIELD_REGISTRY[fieldName.casefold()].valueFormat
+            if (valueFormat == FieldFormatEnum.STRING):
+                inventoryRows += sum(VerificationValue.fromVerifiedValue(value, valueFormat, self.INVENTORY_VERIF_LEVEL, self.INVENTORY_OPERATOR).getMemoryUsage() for value in values)
+            else:
+                inventoryRows += len(values)
+
+        for op in VerificationOperatorEnum:
+
+            # Current Memory Rows of all Descriptors
+            currentRows = sum(sum(row[1] for row in descriptor.countPerOperator(op)) for descriptor in session.getDescriptors())
+            estimatedRows = currentRows + (inventoryRows if (op == self.INVENTORY_OPERATOR) else 0)
+
+            # Memory Address Bit Length (same as exported Operator Memory Configuration)
+            if (estimatedRows <= 2):
+                memAddrBitLength = 1
+            else:
+                memAddrBitLength = math.ceil(math.log2(estimatedRows))
+
+            estimate.update({op: (currentRows, estimatedRows, memAddrBitLength)})
+
+        return estimate
+
+    ### Display ROM Depth Estimate (Operators in Use only) ###
+    def displayMemoryDepths(self, estimate):
+        print("Inventory ROM Depth Estimate: " + str(self.rowCount) + " rows, " + str(sum(len(values) for values in self.fieldValues.values())) + " unique values, " + str(self.duplicateCellCount) + " duplicate cells")
+
+        for (op, (currentRows, estimatedRows, memAddrBitLength)) in estimate.items():
+            if (estimatedRows > 0):
+                print("\t", op.name, "\t", currentRows, "->", estimatedRows, "memory rows (" + str(memAddrBitLength) + " address bits)")
+
+    ### Get Inventory Values of each Field ###
+    ### Return: Generator of (USB Field Name, List[(Value, Verification Level, Operator)], List[(Import File, Line Number)])
+    def iterateValues(self):
+        for (fieldName, values) in self.fieldValues.items():
+            if (len(values) > 0):
+                yield (fieldName, [(value, self.INVENTORY_VERIF_LEVEL, self.INVENTORY_OPERATOR) for value in values], list(values.values()))
+
+    ###############################################
+    ## Private Static Inventory Compiler Methods ##
+    ###############################################
+
+    ### Normalize Inventory Cell (Hex Fields: optional 0x Prefix removed, lowercase & zero-padded) ###
+    ### Return: Value, empty String for any Value
+    def __normalizeValue(field, cell):
+        value = cell.strip()
+
+        if (field.valueFormat == FieldFormatEnum.HEX) and (value != ""):
+            if (value[:2].casefold() == InventoryCompiler.INVENTORY_HEX_PREFIX):
+                value = value[2:]
+            value = value.lower().zfill(field.length)
+
+        return value
@@ -0,0 +1,189 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: JsonPolicyDecoder
+## Description: Streaming Decoder of JSON Verification Policy files
+##              {"usb_descriptor": {"usb_field": [{"operator": ..., "value": ..., "level": ...}, ...], ...}, ...}
+##              Only one Buffer & one Rule are held in Memory at a time
+########################################################################
+
+import re
+import json
+
+class JsonPolicyDecoder:
+
+    ###################################
+    ## JSON Policy Decoder Constants ##
+    ###################################
+
+    # File Read Size (in Characters)
+    JSON_BUFFER_SIZE = 1024 * 1024
+
+    # JSON Whitespace Pattern
+    JSON_WHITESPACE_PATTERN = re.compile(r'[ \t\n\r]*')
+
+    ###################################
+    ## JSON Policy Decoder Variables ##
+    ###################################
+
+    # Policy File
+    file = None
+
+    # Buffer (unconsumed Policy File part) & Current Position in Buffer
+    buffer = None
+    position = 0
+
+    # End of Policy File reached
+    endOfFile = False
+
+    # Line Number of Buffer Start & Position up to which Lines are counted
+    lineNumber = 1
+    countedPosition = 0
+
+    # JSON Value Decoder
+    decoder = None
+
+    ########################################
+    ## Public JSON Policy Decoder Methods ##
+    ########################################
+
+    ### Constructor (opened Policy File) ###
+    def __init__(self, file):
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.endOfFile = False
+        self.lineNumber = 1
+        self.countedPosition = 0
+        self.decoder = json.JSONDecoder()
+
+    ### Iterate Policy Rules (in File order) ###
+    ### Return: Generator of (Descriptor Key, Field Key, Rule, Line Number)
+    def iterateRules(self):
+
+        # Descriptors Object
+        self.__expect("{")
+        for descriptorKey in self.__iterateObjectKeys():
+
+            # Fields Object
+            self.__expect("{")
+            for fieldKey in self.__iterateObjectKeys():
+
+                # Rules Array
+                self.__expect("[")
+                for (rule, lineNumber) in self.__iterateArrayValues():
+                    yield (descriptorKey, fieldKey, rule, lineNumber)
+
+        # Nothing after Descriptors Object
+        if (self.__skipWhitespace() == True):
+            raise Exception("Unexpected element after Policy object !")
+
+    ### Get Line Number of Current Position ###
+    def getLineNumber(self):
+        self.lineNumber += self.buffer.count("\n", self.countedPosition, self.position)
+        self.countedPosition = self.position
+        return self.lineNumber
+
+    #########################################
+    ## Private JSON Policy Decoder Methods ##
+    #########################################
+
+    ### Iterate Object Keys (Caller decodes the Value of each Key) ###
+    ### Return: Generator of Keys
+    def __iterateObjectKeys(self):
+
+        # Empty Object
+        if (self.__accept("}") == True):
+            return
+
+        while (True):
+
+            # Key
+            key = self.__decodeValue()
+            if (isinstance(key, str) == False):
+                raise Exception("Object key must be a string !")
+            self.__expect(":")
+            yield key
+
+            # Next Key or End of Object
+            if (self.__accept(",") == False):
+                self.__expect("}")
+                return
+
+    ### Iterate Array Values ###
+    ### Return: Generator of (Value, Line Number)
+    def __iterateArrayValues(self):
+
+        # Empty Array
+        if (self.__accept("]") == True):
+            return
+
+        while (True):
+
+            # Value
+            self.__skipWhitespace()
+            lineNumber = self.getLineNumber()
+            yield (self.__decodeValue(), lineNumber)
+
+            # Next Value or End of Array
+            if (self.__accept(",") == False):
+                self.__expect("]")
+                return
+
+    ### Decode one JSON Value (Buffer refilled until the Value is complete) ###
+    ### Return: Decoded Value
+    def __decodeValue(self):
+        self.__skipWhitespace()
+
+        while (True):
+            try:
+                (value, end) = self.decoder.raw_decode(self.buffer, self.position)
+
+                # Value may continue in the next Read (e.g. Number)
+                if (end < len(self.buffer)) or (self.endOfFile == True):
+                    self.position = end
+                    return value
+
+            except json.JSONDecodeError as e:
+                if (self.endOfFile == True):
+                    raise Exception(e.msg + " !")
+
+            self.__fillBuffer()
+
+    ### Consume expected Character ###
+    def __expect(self, character):
+        if (self.__accept(character) == False):
+            if (self.position < len(self.buffer)):
+                raise Exception("Expecting '" + character + "' instead of '" + self.buffer[self.position] + "' !")
+            raise Exception("Expecting '" + character + "' instead of end of file !")
+
+    ### Consume Character if present ###
+    ### Return: True if consumed
+    def __accept(self, character):
+        if (self.__skipWhitespace() == True) and (self.buffer[self.position] == character):
+            self.position += 1
+            return True
+        return False
+
+    ### Skip Whitespaces (Buffer refilled when consumed) ###
+    ### Return: True if a Character remains
+    def __skipWhitespace(self):
+        while (True):
+            self.position = self.JSON_WHITESPACE_PATTERN.match(self.buffer, self.position).end()
+            if (self.position < len(self.buffer)):
+                return True
+            if (self.endOfFile == True):
+                return False
+            self.__fillBuffer()
+
+    ### Read next File part (consumed Buffer part dropped) ###
+    def __fillBuffer(self):
+        self.getLineNumber()
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        self.countedPosition = 0
+
+        data = self.file.read(self.JSON_BUFFER_SIZE)
+        if (data == ""):
+            self.endOfFile = True
+        self.buffer += data
@@ -0,0 +1,164 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: LsusbDumpParser
+## Description: Streaming Parser of "lsusb -v" Inventory Dumps (one Line at a time)
+##              Bus 001 Device 002: ID 046d:c52b ...
+##              Device Descriptor: / Configuration Descriptor: / Interface Descriptor: / HID Device Descriptor: / Endpoint Descriptor: ...
+##                field_name    value [description]
+########################################################################
+
+import re
+
+from FieldFormatEnum import FieldFormatEnum
+
+# USB Descriptors
+from DeviceDescriptor import DeviceDescriptor
+from ConfigurationDescriptor import ConfigurationDescriptor
+from InterfaceDescriptor import InterfaceDescriptor
+from HIDDescriptor import HIDDescriptor
+from EndpointDescriptor import EndpointDescriptor
+from DeviceQualifierDescriptor import DeviceQualifierDescriptor
+from OtherSpeedDescriptor import OtherSpeedDescriptor
+
+class LsusbDumpParser:
+
+    #################################
+    ## Lsusb Dump Parser Constants ##
+    #################################
+
+    # Device Line Pattern (start of a Device)
+    LSUSB_DEVICE_PATTERN = re.compile(r'Bus \d+ Device \d+: ID [0-9a-fA-F]{4}:[0-9a-fA-F]{4}')
+
+    # Field Line Pattern (Field Name, Value, Description)
+    LSUSB_FIELD_PATTERN = re.compile(r'\s+(\w+)\s+(\S+)(?:\s+(.*?))?\s*')
+
+    # Section Headers {Section Header: Descriptor Class} (other Sections are skipped)
+    LSUSB_SECTION_HEADERS = {
+        "Device Descriptor:": DeviceDescriptor,
+        "Configuration Descriptor:": ConfigurationDescriptor,
+        "Interface Descriptor:": InterfaceDescriptor,
+        "HID Device Descriptor:": HIDDescriptor,
+        "Endpoint Descriptor:": EndpointDescriptor,
+        "Device Qualifier (for other device speed):": DeviceQualifierDescriptor,
+        "Other Speed Configuration Descriptor:": OtherSpeedDescriptor
+    }
+
+    # Field Name Aliases {Casefolded lsusb Field Name: USB Field Name}
+    LSUSB_FIELD_ALIASES = {
+        "iserial": "iSerialNumber",
+        "maxpower": "bMaxPower"
+    }
+
+    # Descriptor Type Field (first one of a Section is the Section Descriptor Type, not verified)
+    LSUSB_DESCRIPTOR_TYPE_FIELD = "bdescriptortype"
+
+    # MaxPower Unit (in mA) below & from USB 3.0 (bcdUSB)
+    LSUSB_MAX_POWER_UNIT = 2
+    LSUSB_MAX_POWER_SUPERSPEED_UNIT = 8
+    LSUSB_SUPERSPEED_BCD_USB = 0x0300
+
+    #############################################
+    ## Public Static Lsusb Dump Parser Methods ##
+    #############################################
+
+    ### Check if a File is a lsusb Dump (first non-empty Line is a Device Line) ###
+    ### Return: True/False
+    def isDump(path):
+        try:
+            with open(path, 'r', encoding='UTF8') as file:
+                for line in file:
+                    if (line.strip() != ""):
+                        return LsusbDumpParser.LSUSB_DEVICE_PATTERN.match(line) != None
+        except (OSError, UnicodeDecodeError):
+            return False
+        return False
+
+    ### Parse Dump Lines (streamed, one Line in Memory) ###
+    ### Return: Generator of (Line Number, Descriptor Class, USB Field Name, Value, Error)
+    def parseDump(lines):
+        descriptorClass = None
+        descriptorTypeSeen = False
+        bcdUsb = 0
+
+        for (lineNumber, line) in enumerate(lines, 1):
+
+            # New Device
+            if (LsusbDumpParser.LSUSB_DEVICE_PATTERN.match(line) != None):
+                descriptorClass = None
+                bcdUsb = 0
+                continue
+
+            # Section Header (unknown Sections skipped)
+            header = line.strip()
+            if (header.endswith(":")):
+                descriptorClass = LsusbDumpParser.LSUSB_SECTION_HEADERS.get(header)
+                descriptorTypeSeen = False
+                continue
+
+            # Field Line of a verified Section
+            match = LsusbDumpParser.LSUSB_FIELD_PATTERN.fullmatch(line.rstrip("\n"))
+            if (descriptorClass == None) or (match == None):
+                continue
+            (fieldName, token, description) = match.groups()
+            fieldMatch = fieldName.casefold()
+
+            # Section Descriptor Type
+            if (fieldMatch == LsusbDumpParser.LSUSB_DESCRIPTOR_TYPE_FIELD) and (descriptorTypeSeen == False):
+                descriptorTypeSeen = True
+                continue
+
+            # USB Field
+            field = descriptorClass.FIELD_REGISTRY.get(LsusbDumpParser.LSUSB_FIELD_ALIASES.get(fieldMatch, fieldMatch).casefold())
+            if (field == None):
+                continue
+
+            try:
+                value = LsusbDumpParser.__parseValue(field, token, description, bcdUsb)
+            except Exception as e:
+                yield (lineNumber, descriptorClass, field.name, None, field.name + ": " + str(e))
+                continue
+
+            # Missing String (String Index 0 or unreadable Device)
+            if (value == None):
+                continue
+
+            # Device USB Version (MaxPower Unit)
+            if (descriptorClass == DeviceDescriptor) and (field.name == "bcdUsb"):
+                bcdUsb = int(value, 16)
+
+            yield (lineNumber, descriptorClass, field.name, value, None)
+
+    ##############################################
+    ## Private Static Lsusb Dump Parser Methods ##
+    ##############################################
+
+    ### Parse Field Value (lsusb Display to Field Format) ###
+    ### Return: Value, None for a missing String
+    def __parseValue(field, token, description, bcdUsb):
+
+        # String: Index then String (missing when Index is 0)
+        if (field.valueFormat == FieldFormatEnum.STRING):
+            if (token == "0") or (description == None):
+                return None
+            return description
+
+        # MaxPower in mA (Field in Power Units)
+        if (token.endswith("mA")):
+            unit = LsusbDumpParser.LSUSB_MAX_POWER_SUPERSPEED_UNIT if (bcdUsb >= LsusbDumpParser.LSUSB_SUPERSPEED_BCD_USB) else LsusbDumpParser.LSUSB_MAX_POWER_UNIT
+            item = int(token[:-2]) // unit
+
+        # BCD Version (e.g. 2.00, 12.03)
+        elif ("." in token):
+            (major, minor) = token.split(".")
+            item = int(major + minor.zfill(2), 16)
+
+        # Hex or Decimal Number
+        elif (token.startswith("0x")):
+            item = int(token, 16)
+        else:
+            item = int(token)
+
+        if (field.valueFormat == FieldFormatEnum.HEX):
+            return format(item, '0' + str(field.length) + 'x')
+        return str(item)
@@ -5,13 +5,13 @@
 ## Description: USB Configuration Descriptor Class containing fields to verify
 ########################################################################
 
-import statistics
+import struct
 
 from FieldFormatEnum import FieldFormatEnum
-from VerificationValue import VerificationValue
-from VerificationLevelEnum import VerificationLevelEnum
+from DescriptorField import DescriptorField
+from USBDescriptor import USBDescriptor
 
-class OtherSpeedDescriptor:
+class OtherSpeedDescriptor(USBDescriptor):
 
     ######################################
     ## Other Speed Descriptor Constants ##
@@ -23,777 +23,39 @@ class OtherSpeedDescriptor:
     # Descriptor Name
     DESCRIPTOR_NAME = "Other Speed Descriptor"
 
-    ######################################
-    ## Other Speed Descriptor Variables ##
-    ######################################
-
-    # bLength (1 byte)
-    bLength = []
-    bLengthLength = 255
-    bLengthFormat = FieldFormatEnum.NUMBER
-    bLengthName = "bLength"
-    bLengthMatch = bLengthName.casefold()
-    bLengthLastMandatoryValueIndex = 0
-    bLengthSourceIndexPattern = "OTHER_SPEED_BLENGTH_INDEX => "
-    bLengthSourceCountPattern = "OTHER_SPEED_BLENGTH_COUNT => "
-
-    # wTotalLength (2 bytes)
-    wTotalLength = []
-    wTotalLengthLength = 65535
-    wTotalLengthFormat = FieldFormatEnum.NUMBER
-    wTotalLengthName = "wTotalLength"
-    wTotalLengthMatch = wTotalLengthName.casefold()
-    wTotalLengthLastMandatoryValueIndex = 0
-    wTotalLengthSourceIndexPattern = "OTHER_SPEED_WTOTALLENGTH_INDEX => "
-    wTotalLengthSourceCountPattern = "OTHER_SPEED_WTOTALLENGTH_COUNT => "
-    
-    # bNumInterfaces (1 byte)
-    bNumInterfaces = []
-    bNumInterfacesLength = 255
-    bNumInterfacesFormat = FieldFormatEnum.NUMBER
-    bNumInterfacesName = "bNumInterfaces"
-    bNumInterfacesMatch = bNumInterfacesName.casefold()
-    bNumInterfacesLastMandatoryValueIndex = 0
-    bNumInterfacesSourceIndexPattern = "OTHER_SPEED_BNUMINTERFACES_INDEX => "
-    bNumInterfacesSourceCountPattern = "OTHER_SPEED_BNUMINTERFACES_COUNT => "
-
-    # bConfigurationValue (1 bytes)
-    bConfigurationValue = []
-    bConfigurationValueLength = 255
-    bConfigurationValueFormat = FieldFormatEnum.NUMBER
-    bConfigurationValueName = "bConfigurationValue"
-    bConfigurationValueMatch = bConfigurationValueName.casefold()
-    bConfigurationValueLastMandatoryValueIndex = 0
-    bConfigurationValueSourceIndexPattern = "OTHER_SPEED_BCONFIGURATIONVALUE_INDEX => "
-    bConfigurationValueSourceCountPattern = "OTHER_SPEED_BCONFIGURATIONVALUE_COUNT => "
-
-    # Other Speed String Special Field
-    # iConfigurationbLength (1 byte)
-    iConfigurationbLength = []
-    iConfigurationbLengthLength = 255
-    iConfigurationbLengthFormat = FieldFormatEnum.NUMBER
-    iConfigurationbLengthName = "iConfigurationbLength"
-    iConfigurationbLengthMatch = iConfigurationbLengthName.casefold()
-    iConfigurationbLengthLastMandatoryValueIndex = 0
-    iConfigurationbLengthSourceIndexPattern = "OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX => "
-    iConfigurationbLengthSourceCountPattern = "OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT => "
-
-    # Other Speed String Special Field
-    # iConfiguration (253 bytes)
-    iConfiguration = []
-    iConfigurationLength = 253
-    iConfigurationFormat = FieldFormatEnum.STRING
-    iConfigurationName = "iConfiguration"
-    iConfigurationMatch = iConfigurationName.casefold()
-    iConfigurationLastMandatoryValueIndex = 0
-    iConfigurationSourceIndexPattern = "OTHER_SPEED_ICONFIGURATION_INDEX => "
-    iConfigurationSourceCountPattern = "OTHER_SPEED_ICONFIGURATION_COUNT => "
-
-    # bmAttributes (1 byte)
-    bmAttributes = []
-    bmAttributesLength = 2
-    bmAttributesFormat = FieldFormatEnum.HEX
-    bmAttributesName = "bmAttributes"
-    bmAttributesMatch = bmAttributesName.casefold()
-    bmAttributesLastMandatoryValueIndex = 0
-    bmAttributesSourceIndexPattern = "OTHER_SPEED_BMATTRIBUTES_INDEX => "
-    bmAttributesSourceCountPattern = "OTHER_SPEED_BMATTRIBUTES_COUNT => "
-
-    # bMaxPower (1 byte)
-    bMaxPower = []
-    bMaxPowerLength = 255
-    bMaxPowerFormat = FieldFormatEnum.NUMBER
-    bMaxPowerName = "bMaxPower"
-    bMaxPowerMatch = bMaxPowerName.casefold()
-    bMaxPowerLastMandatoryValueIndex = 0
-    bMaxPowerSourceIndexPattern = "OTHER_SPEED_BMAXPOWER_INDEX => "
-    bMaxPowerSourceCountPattern = "OTHER_SPEED_BMAXPOWER_COUNT => "
-
-    ###########################################
-    ## Public Other Speed Descriptor Methods ##
-    ###########################################
-
-    ### is Other Speed Descriptor Requested ###
-    def isRequestedDescriptor(self, userDescriptor):
-        return userDescriptor.casefold() == self.DESCRIPTOR_TYPE.casefold()
-
-    ### Add Verification Value ###
-    def addVerificationValue(self, fieldName, value, verificationLevel, operator):
-        match fieldName.casefold():
-
-            # bLength
-            case self.bLengthMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.bLengthLength, self.bLengthFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.bLength.insert(self.bLengthLastMandatoryValueIndex, newValue)
-                    self.bLengthLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.bLength.append(newValue)
-
-            # wTotalLength
-            case self.wTotalLengthMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.wTotalLengthLength, self.wTotalLengthFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.wTotalLength.insert(self.wTotalLengthLastMandatoryValueIndex, newValue)
-                    self.wTotalLengthLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.wTotalLength.append(newValue)
-
-            # bNumInterfaces
-            case self.bNumInterfacesMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.bNumInterfacesLength, self.bNumInterfacesFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.bNumInterfaces.insert(self.bNumInterfacesLastMandatoryValueIndex, newValue)
-                    self.bNumInterfacesLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.bNumInterfaces.append(newValue)
-
-            # bConfigurationValue
-            case self.bConfigurationValueMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.bConfigurationValueLength, self.bConfigurationValueFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.bConfigurationValue.insert(self.bConfigurationValueLastMandatoryValueIndex, newValue)
-                    self.bConfigurationValueLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.bConfigurationValue.append(newValue)
-
-            # iConfiguration bLength
-            case self.iConfigurationbLengthMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.iConfigurationbLengthLength, self.iConfigurationbLengthFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.iConfigurationbLength.insert(self.iConfigurationbLengthLastMandatoryValueIndex, newValue)
-                    self.iConfigurationbLengthLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.iConfigurationbLength.append(newValue)
-
-            # iConfiguration
-            case self.iConfigurationMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.iConfigurationLength, self.iConfigurationFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.iConfiguration.insert(self.iConfigurationLastMandatoryValueIndex, newValue)
-                    self.iConfigurationLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.iConfiguration.append(newValue)
-
-            # bmAttributes
-            case self.bmAttributesMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.bmAttributesLength, self.bmAttributesFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.bmAttributes.insert(self.bmAttributesLastMandatoryValueIndex, newValue)
-                    self.bmAttributesLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.bmAttributes.append(newValue)
-
-            # bMaxPower
-            case self.bMaxPowerMatch:
-                # New Value to Add
-                newValue = VerificationValue(value, self.bMaxPowerLength, self.bMaxPowerFormat, verificationLevel, operator)
-
-                # Handle Verification Level Priority (Mandatory First)
-                if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
-                    # Add New Mandatory Value
-                    self.bMaxPower.insert(self.bMaxPowerLastMandatoryValueIndex, newValue)
-                    self.bMaxPowerLastMandatoryValueIndex += 1
-
-                # Optional New Value (add the end of the list)
-                else:
-                    self.bMaxPower.append(newValue)
-
-            # Unknown Field
-            case _:
-                raise Exception("Unkown " + self.DESCRIPTOR_NAME + " Field: " + fieldName)
-
-    ### Delete Verification Value ###
-    def deleteVerificationValue(self, fieldName, value, operator):
-        match fieldName.casefold():
-
-            # bLength
-            case self.bLengthMatch:
-                if (operator == None):
-                    self.bLength = [el for el in self.bLength if el.value != value]
-                else:
-                    self.bLength = [el for el in self.bLength if el.value != value and el.operator != operator]
-
-            # wTotalLength
-            case self.wTotalLengthMatch:
-                if (operator == None):
-                    self.wTotalLength = [el for el in self.wTotalLength if el.value != value]
-                else:
-                    self.wTotalLength = [el for el in self.wTotalLength if el.value != value and el.operator != operator]
-
-            # bNumInterfaces
-            case self.bNumInterfacesMatch:
-                if (operator == None):
-                    self.bNumInterfaces = [el for el in self.bNumInterfaces if el.value != value]
-                else:
-                    self.bNumInterfaces = [el for el in self.bNumInterfaces if el.value != value and el.operator != operator]
-
-            # bConfigurationValue
-            case self.bConfigurationValueMatch:
-                if (operator == None):
-                    self.bConfigurationValue = [el for el in self.bConfigurationValue if el.value != value]
-                else:
-                    self.bConfigurationValue = [el for el in self.bConfigurationValue if el.value != value and el.operator != operator]
-
-            # iConfiguration bLength
-            case self.iConfigurationbLengthMatch:
-                if (operator == None):
-                    self.iConfigurationbLength = [el for el in self.iConfigurationbLength if el.value != value]
-                else:
-                    self.iConfigurationbLength = [el for el in self.iConfigurationbLength if el.value != value and el.operator != operator]
-
-            # iConfiguration
-            case self.iConfigurationMatch:
-                if (operator == None):
-                    self.iConfiguration = [el for el in self.iConfiguration if el.value != value]
-                else:
-                    self.iConfiguration = [el for el in self.iConfiguration if el.value != value and el.operator != operator]
-
-            # bmAttributes
-            case self.bmAttributesMatch:
-                if (operator == None):
-                    self.bmAttributes = [el for el in self.bmAttributes if el.value != value]
-                else:
-                    self.bmAttributes = [el for el in self.bmAttributes if el.value != value and el.operator != operator]
-
-            # bMaxPower
-            case self.bMaxPowerMatch:
-                if (operator == None):
-                    self.bMaxPower = [el for el in self.bMaxPowerName if el.value != value]
-                else:
-                    self.bMaxPower = [el for el in self.bMaxPowerName if el.value != value and el.operator != operator]
-
-            # Unknown Field
-            case _:
-                raise Exception("Unkown " + self.DESCRIPTOR_NAME + " Field: " + fieldName)
-
-    ### Display Descriptor Field Values ###
-    def displayVerificationValues(self, fieldName):
-        match fieldName.casefold():
-
-            # bLength
-            case self.bLengthMatch:
-                print(self.bLengthName + ":\n")
-                for el in self.bLength: el.showDetails()
-
-            # wTotalLength
-            case self.wTotalLengthMatch:
-                print(self.wTotalLengthName + ":\n")
-                for el in self.wTotalLength: el.showDetails()
-
-            # bNumInterfaces
-            case self.bNumInterfacesMatch:
-                print(self.bNumInterfacesName + ":\n")
-                for el in self.bNumInterfaces: el.showDetails()
-
-            # bConfigurationValue
-            case self.bConfigurationValueMatch:
-                print(self.bConfigurationValueName + ":\n")
-                for el in self.bConfigurationValue: el.showDetails()
-
-            # iConfiguration bLength
-            case self.iConfigurationbLengthMatch:
-                print(self.iConfigurationbLengthName + ":\n")
-                for el in self.iConfigurationbLength: el.showDetails()
-
-            # iConfiguration
-            case self.iConfigurationMatch:
-                print(self.iConfigurationName + ":\n")
-                for el in self.iConfiguration: el.showDetails()
-
-            # bmAttributes
-            case self.bmAttributesMatch:
-                print(self.bmAttributesName + ":\n")
-                for el in self.bmAttributes: el.showDetails()
-
-            # bMaxPower
-            case self.bMaxPowerMatch:
-                print(self.bMaxPowerName + ":\n")
-                for el in self.bMaxPower: el.showDetails()
-
-            # Unknown Field
-            case _:
-                raise Exception("Unkown " + self.DESCRIPTOR_NAME + " Field: " + fieldName)
-
-    ### Print All Device Descriptor Field Values ###
-    def displayAllVerificationValues(self):
-        print("---", self.DESCRIPTOR_NAME, "---")
-
-        # bLength
-        self.displayVerificationValues(self.bLengthName)
-
-        # wTotalLength
-        self.displayVerificationValues(self.wTotalLengthName)
-
-        # bNumInterfaces
-        self.displayVerificationValues(self.bNumInterfacesName)
-
-        # bConfigurationValue
-        self.displayVerificationValues(self.bConfigurationValueName)
-
-        # iConfiguration bLength
-        self.displayVerificationValues(self.iConfigurationbLengthName)
-
-        # iConfiguration
-        self.displayVerificationValues(self.iConfigurationName)
-
-        # bmAttributes
-        self.displayVerificationValues(self.bmAttributesName)
-
-        # bMaxPower
-        self.displayVerificationValues(self.bMaxPowerName)
-
-    ### Get Verification Values ###
-    ### Return: [ [USB Field, Operator, Value, Verification Level] ]
-    def getVerificationValues(self):
-        valueList = []
-
-        # bength
-        for el in self.bLength:
-            valueList.append([self.bLengthName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # wTotalLength
-        for el in self.wTotalLength:
-            valueList.append([self.wTotalLengthName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # bNumInterfaces
-        for el in self.bNumInterfaces:
-            valueList.append([self.bNumInterfacesName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # bConfigurationValue
-        for el in self.bConfigurationValue:
-            valueList.append([self.bConfigurationValueName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # iConfiguration bLength
-        for el in self.iConfigurationbLength:
-            valueList.append([self.iConfigurationbLengthName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # iConfiguration
-        for el in self.iConfiguration:
-            valueList.append([self.iConfigurationName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # bmAttributes
-        for el in self.bmAttributes:
-            valueList.append([self.bmAttributesName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        # bMaxPower
-        for el in self.bMaxPower:
-            valueList.append([self.bMaxPowerName, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
-
-        return valueList
-
-    ### Count Descriptor Field by Name & Operator ###
-    ### Return: [USB Field, Counter of Operator Value]
-    def countPerOperator(self, operator):
-        count = 0
-        result = []
-
-        # bLength
-        for el in self.bLength:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.bLengthName, count])
-        count = 0
-
-        # wTotalLength
-        for el in self.wTotalLength:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.wTotalLengthName, count])
-        count = 0
-
-        # bNumInterfaces
-        for el in self.bNumInterfaces:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.bNumInterfacesName, count])
-        count = 0
-
-        # bConfigurationValue
-        for el in self.bConfigurationValue:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.bConfigurationValueName, count])
-        count = 0
-
-        # iConfiguration bLength
-        for el in self.iConfigurationbLength:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.iConfigurationbLengthName, count])
-        count = 0
-
-        # iConfiguration
-        for el in self.iConfiguration:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.iConfigurationName, count])
-        count = 0
-
-        # bmAttributes
-        for el in self.bmAttributes:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.bmAttributesName, count])
-        count = 0
-
-        # bMaxPower
-        for el in self.bMaxPower:
-            if (operator == el.operator):
-                count += el.getMemoryUsage()
-
-        # Add Result & Reset Counter
-        result.append([self.bMaxPowerName, count])
-    
-        # End of Process
-        return result
-
-    ### Check if Operator is used by the Descriptor (at least once) ###
-    ### Return: True/False
-    def isOperatorInUse(self, operator):
-
-        # bLength
-        for el in self.bLength:
-            if (operator == el.operator):
-                return True
-
-        # wTotalLength
-        for el in self.wTotalLength:
-            if (operator == el.operator):
-                return True
-
-        # bNumInterfaces
-        for el in self.bNumInterfaces:
-            if (operator == el.operator):
-                return True
-
-        # bConfigurationValue
-        for el in self.bConfigurationValue:
-            if (operator == el.operator):
-                return True
-
-        # iConfiguration bLength
-        for el in self.iConfigurationbLength:
-            if (operator == el.operator):
-                return True
-
-        # iConfiguration
-        for el in self.iConfiguration:
-            if (operator == el.operator):
-                return True
-
-        # bmAttributes
-        for el in self.bmAttributes:
-            if (operator == el.operator):
-                return True
-
-        # bMaxPower
-        for el in self.bMaxPower:
-            if (operator == el.operator):
-                return True
-    
-        # Operator not used
-        return False
-
-    ### Get Converted Verification Values per Operator ###
-    def getConvertedVerificationValues(self, operator):
-        result = []
-
-        # bLength
-        memoryValueConfig = []
-        for el in self.bLength:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # wTotalLength
-        memoryValueConfig = []
-        for el in self.wTotalLength:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # bNumInterfaces
-        memoryValueConfig = []
-        for el in self.bNumInterfaces:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # bConfigurationValue
-        memoryValueConfig = []
-        for el in self.bConfigurationValue:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # iConfiguration bLength
-        memoryValueConfig = []
-        for el in self.iConfigurationbLength:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # iConfiguration
-        memoryValueConfig = []
-        for el in self.iConfiguration:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # bmAttributes
-        memoryValueConfig = []
-        for el in self.bmAttributes:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-
-        # bMaxPower
-        memoryValueConfig = []
-        for el in self.bMaxPower:
-            if (operator == el.operator):
-                # Convert Memory Configurations
-                for e in el.convertToMemConfig():
-                    memoryValueConfig.append(e)
-
-        # Order & Add Memory Values
-        for el in VerificationValue.generateMemoryValues(memoryValueConfig):
-            result.append(el)
-    
-        # End of Process
-        return result
-            
-    ### Get Largest Verification Number per Value Part ###
-    ### Return Largest Verification Number
-    def getLargestVerificationNumber(self, currentLargestVerificationNumber=1):
-
-        # bLength
-        largestPartVerif = self.__getLargestVerificationNumber(self.bLength, currentLargestVerificationNumber)
-
-        # wTotalLength
-        largestPartVerif = self.__getLargestVerificationNumber(self.wTotalLength, largestPartVerif)
-
-        # bNumInterfaces
-        largestPartVerif = self.__getLargestVerificationNumber(self.bNumInterfaces, largestPartVerif)
-
-        # bConfigurationValue
-        largestPartVerif = self.__getLargestVerificationNumber(self.bConfigurationValue, largestPartVerif)
-
-        # iConfiguration bLength
-        largestPartVerif = self.__getLargestVerificationNumber(self.iConfigurationbLength, largestPartVerif)
-
-        # iConfiguration
-        largestPartVerif = self.__getLargestVerificationNumber(self.iConfiguration, largestPartVerif)
-
-        # bmAttributes
-        largestPartVerif = self.__getLargestVerificationNumber(self.bmAttributes, largestPartVerif)
-
-        # bMaxPower
-        largestPartVerif = self.__getLargestVerificationNumber(self.bMaxPower, largestPartVerif)
-        return largestPartVerif
-
-    ### Check if the Descriptor is InUse (at least on Value) ###
-    ### Return True/False
-    def isDescriptorInUse(self):
-
-        # bLength
-        for el in self.bLength:
-            return True
-
-        # wTotalLength
-        for el in self.wTotalLength:
-            return True
-
-        # bNumInterfaces
-        for el in self.bNumInterfaces:
-            return True
-
-        # bConfigurationValue
-        for el in self.bConfigurationValue:
-            return True
-
-        # iConfiguration bLength
-        for el in self.iConfigurationbLength:
-            return True
-
-        # iConfiguration
-        for el in self.iConfiguration:
-            return True
-
-        # bmAttributes
-        for el in self.bmAttributes:
-            return True
-
-        # bMaxPower
-        for el in self.bMaxPower:
-            return True
-    
-        # Descriptor not used
-        return False
-
-    ##################################################
-    ## Public Static Other Speed Descriptor Methods ##
-    ##################################################
-
-    ### Get Source File Index & Count Pattern for specific Device Descriptor field ###
-    ### Return (Index Pattern, Count Pattern)
-    @staticmethod
-    def getSourceIndexCountPattern(fieldName):
-        match fieldName:
-
-            # bLength
-            case OtherSpeedDescriptor.bLengthName:
-                return (OtherSpeedDescriptor.bLengthSourceIndexPattern, OtherSpeedDescriptor.bLengthSourceCountPattern)
-
-            # wTotalLength
-            case OtherSpeedDescriptor.wTotalLengthName:
-                return (OtherSpeedDescriptor.wTotalLengthSourceIndexPattern, OtherSpeedDescriptor.wTotalLengthSourceCountPattern)
-
-            # bNumInterfaces
-            case OtherSpeedDescriptor.bNumInterfacesName:
-                return (OtherSpeedDescriptor.bNumInterfacesSourceIndexPattern, OtherSpeedDescriptor.bNumInterfacesSourceCountPattern)
-
-            # bConfigurationValue
-            case OtherSpeedDescriptor.bConfigurationValueName:
-                return (OtherSpeedDescriptor.bConfigurationValueSourceIndexPattern, OtherSpeedDescriptor.bConfigurationValueSourceCountPattern)
-
-            # iConfiguration bLength
-            case OtherSpeedDescriptor.iConfigurationbLengthName:
-                return (OtherSpeedDescriptor.iConfigurationbLengthSourceIndexPattern, OtherSpeedDescriptor.iConfigurationbLengthSourceCountPattern)
-
-            # iConfiguration
-            case OtherSpeedDescriptor.iConfigurationName:
-                return (OtherSpeedDescriptor.iConfigurationSourceIndexPattern, OtherSpeedDescriptor.iConfigurationSourceCountPattern)
+    # Descriptor Fields (Name, Max Value Length, Format, VHDL Index Pattern, VHDL Count Pattern)
+    DESCRIPTOR_FIELDS = (
+        # bLength (1 byte)
+        DescriptorField("bLength", 255, FieldFormatEnum.NUMBER, "OTHER_SPEED_BLENGTH_INDEX => ", "OTHER_SPEED_BLENGTH_COUNT => "),
 
-            # bmAttributes
-            case OtherSpeedDescriptor.bmAttributesName:
-                return (OtherSpeedDescriptor.bmAttributesSourceIndexPattern, OtherSpeedDescriptor.bmAttributesSourceCountPattern)
+        # wTotalLength (2 bytes)
+        DescriptorField("wTotalLength", 65535, FieldFormatEnum.NUMBER, "OTHER_SPEED_WTOTALLENGTH_INDEX => ", "OTHER_SPEED_WTOTALLENGTH_COUNT => "),
 
-            # bMaxPower
-            case OtherSpeedDescriptor.bMaxPowerName:
-                return (OtherSpeedDescriptor.bMaxPowerSourceIndexPattern, OtherSpeedDescriptor.bMaxPowerSourceCountPattern)
+        # bNumInterfaces (1 byte)
+        DescriptorField("bNumInterfaces", 255, FieldFormatEnum.NUMBER, "OTHER_SPEED_BNUMINTERFACES_INDEX => ", "OTHER_SPEED_BNUMINTERFACES_COUNT => "),
 
-            # Unknown Field
-            case _:
-                raise("Unkown", OtherSpeedDescriptor.DESCRIPTOR_NAME, "Field:", fieldName)
+        # bConfigurationValue (1 bytes)
+        DescriptorField("bConfigurationValue", 255, FieldFormatEnum.NUMBER, "OTHER_SPEED_BCONFIGURATIONVALUE_INDEX => ", "OTHER_SPEED_BCONFIGURATIONVALUE_COUNT => "),
 
-    ############################################
-    ## Private Other Speed Descriptor Methods ##
-    ############################################
+        # Other Speed String Special Field
+        # iConfigurationbLength (1 byte)
+        DescriptorField("iConfigurationbLength", 255, FieldFormatEnum.NUMBER, "OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX => ", "OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT => "),
 
-    ### Get Largest Verification Number per Value Part per Operator ###
-    def __getLargestVerificationNumber(self, field, currentMaxCount=1):
+        # Other Speed String Special Field
+        # iConfiguration (253 bytes)
+        DescriptorField("iConfiguration", 253, FieldFormatEnum.STRING, "OTHER_SPEED_ICONFIGURATION_INDEX => ", "OTHER_SPEED_ICONFIGURATION_COUNT => "),
 
-        # Init Operator & Value Part Number List [(Operator - Value Part Number)]
-        operatorValuePart = []
+        # bmAttributes (1 byte)
+        DescriptorField("bmAttributes", 2, FieldFormatEnum.HEX, "OTHER_SPEED_BMATTRIBUTES_INDEX => ", "OTHER_SPEED_BMATTRIBUTES_COUNT => "),
 
-        # Loop on each Field
-        for el in field:
-            # Convert to Memory Config: [(Value Part Number, Verification Level, Converted Data Value, Quartet Enable)]
-            for e in el.convertToMemConfig():
-                operatorValuePart.append((el.operator.name, e[0]))
+        # bMaxPower (1 byte)
+        DescriptorField("bMaxPower", 255, FieldFormatEnum.NUMBER, "OTHER_SPEED_BMAXPOWER_INDEX => ", "OTHER_SPEED_BMAXPOWER_COUNT => "),
+    )
 
-        # Empty Field
-        if (len(operatorValuePart) == 0):
-            return currentMaxCount
+    # Descriptor Field Registry {Field Match Name: Descriptor Field}
+    FIELD_REGISTRY = DescriptorField.buildFieldRegistry(DESCRIPTOR_FIELDS)
 
-        else:
-            # Compute Largest Verification Number per Value Part per Operator
-            maxCount = operatorValuePart.count(statistics.mode(operatorValuePart))
-            
-            # Update new Largest Verification Number per Value Part per Operator
-            if (maxCount > currentMaxCount):
-                return maxCount
-            else:
-                return currentMaxCount
\ No newline at end of file
+    # Binary Descriptor (bDescriptorType Code, little-endian Layout & Field Name of each Layout Item, None: not verified)
+    BINARY_DESCRIPTOR_TYPE = 0x07
+    BINARY_LAYOUT = struct.Struct("<BBHBBBBB")
+    BINARY_FIELDS = ("bLength", None, "wTotalLength", "bNumInterfaces", "bConfigurationValue", None, "bmAttributes", "bMaxPower")
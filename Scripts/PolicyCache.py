@@ -0,0 +1,224 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: PolicyCache
+## Description: Content-Hash keyed Cache of imported & validated Policies (user-private Directory, JSON only)
+##              Parsed File Entries reused on each Import, Cache Entries on "import ... cache" only
+##              Cache Key: SHA-256 of Configurer Sources, Session Options, Import Mode & Import File Contents
+##              Dependency Entry: Paths of the Files & Glob Patterns read by an Import (no Hash)
+##              Cache Entry: JSON Snapshot of Descriptor State & Import Summary, named after the Cache Key and the Hashes
+##                           of its Dependencies recomputed on each Load (an Entry never vouches for its own Inputs)
+##              Parsed File Entry: Parsed Commands of one Command File, named after the File Content Hash
+########################################################################
+
+import os
+import glob
+import json
+import stat
+import hashlib
+
+from CommandParser import CommandParser
+
+class PolicyCache:
+
+    ############################
+    ## Policy Cache Constants ##
+    ############################
+
+    # Cache Entry Format Version (part of the Cache Key)
+    POLICY_CACHE_VERSION = 2
+
+    # Default Cache Directory Name (in the User Cache Directory)
+    POLICY_CACHE_DIRECTORY_NAME = "USBVerificationConfigurer"
+
+    # Cache Directory Mode (Owner only)
+    POLICY_CACHE_DIRECTORY_MODE = 0o700
+
+    # Dependency Entry, Cache Entry & Parsed File Entry File Extensions
+    POLICY_CACHE_DEPENDENCY_FILE_EXTENSION = ".deps.json"
+    POLICY_CACHE_FILE_EXTENSION = ".cache.json"
+    POLICY_CACHE_PARSED_FILE_EXTENSION = ".parsed.json"
+
+    # File Hash Read Size (in Bytes)
+    POLICY_CACHE_HASH_BLOCK_SIZE = 1024 * 1024
+
+    ############################
+    ## Policy Cache Variables ##
+    ############################
+
+    # Cache Directory
+    cacheDirectory = None
+
+    # Configurer Version (SHA-256 of Configurer Sources, any Code or Schema change invalidates the Cache)
+    configurerVersion = None
+
+    # Store Error reported (first Store Error only)
+    storeErrorReported = False
+
+    #################################
+    ## Public Policy Cache Methods ##
+    #################################
+
+    ### Constructor (Cache Directory, default: User Cache Directory) ###
+    def __init__(self, cacheDirectory=None):
+        self.cacheDirectory = cacheDirectory if (cacheDirectory != None) else PolicyCache.getDefaultDirectory()
+        self.configurerVersion = PolicyCache.__getConfigurerVersion()
+        self.storeErrorReported = False
+
+    ### Get Cache Key of an Import ###
+    ### Return: Cache Key (Hex SHA-256)
+    def getKey(self, session, importFiles, importMode):
+        digest = hashlib.sha256()
+        digest.update(repr((self.POLICY_CACHE_VERSION, self.configurerVersion, importMode.name)).encode())
+
+        # Session Options
+        descriptor = session.getDescriptors()[0]
+        digest.update(repr((descriptor.columnarStore, descriptor.rejectDuplicates)).encode())
+
+        # Import File Names & Contents
+        for importFile in importFiles:
+            digest.update(repr((importFile, PolicyCache.__getFileHash(importFile))).encode())
+
+        return digest.hexdigest()
+
+    ### Load Cache Entry (Entry named after the current Contents of the nested Import Files & Glob Pattern Matches) ###
+    ### Return: (Packed Descriptor State, Import Summary), None on Cache Miss
+    def load(self, key):
+        try:
+            self.__checkDirectory()
+            (readFiles, readPatterns) = PolicyCache.__readEntry(self.__getEntryPath(key, self.POLICY_CACHE_DEPENDENCY_FILE_EXTENSION))
+            entry = PolicyCache.__readEntry(self.__getEntryPath(self.__getEntryKey(key, readFiles, readPatterns), self.POLICY_CACHE_FILE_EXTENSION))
+            (lineCount, addedValueCount, removedValueCount, duplicateValueCount, errors) = entry["summary"]
+            summary = (int(lineCount), int(addedValueCount), int(removedValueCount), int(duplicateValueCount), [(str(importFile), int(lineNumber), str(error)) for (importFile, lineNumber, error) in errors])
+            return (entry["state"], summary)
+
+        # Missing, unreadable or malformed Cache Entry
+        except Exception:
+            return None
+
+    ### Store Cache Entry (atomic Replace) ###
+    ### Read Files: List of read Import Files, Read Patterns: List of (Glob Pattern, Matches) (including nested Imports)
+    def store(self, key, readFiles, readPatterns, state, summary):
+        readFiles = list(dict.fromkeys(readFiles))
+        readPatterns = list(dict.fromkeys(pattern for (pattern, matches) in readPatterns))
+
+        try:
+            self.__checkDirectory()
+            self.__writeEntry(self.__getEntryPath(self.__getEntryKey(key, readFiles, readPatterns), self.POLICY_CACHE_FILE_EXTENSION), {"state": state, "summary": summary})
+            self.__writeEntry(self.__getEntryPath(key, self.POLICY_CACHE_DEPENDENCY_FILE_EXTENSION), [readFiles, readPatterns])
+
+        # Cache is optional
+        except (OSError, ValueError, TypeError) as e:
+            self.__reportStoreError("Policy Cache not stored: " + str(e))
+
+    ### Load Parsed Command File (Entry named after the File Content Hash) ###
+    ### Return: (File Hash, Parse Results), Parse Results None on Cache Miss (File Hash None when the File can not be read)
+    def loadParsedFile(self, importFile):
+        fileHash = PolicyCache.__getFileHash(importFile)
+        if (fileHash == None):
+            return (None, None)
+
+        try:
+            self.__checkDirectory()
+            results = [(int(lineNumber), CommandParser.unpackCommand(command) if (command != None) else None, str(error) if (error != None) else None)
+                       for (lineNumber, command, error) in PolicyCache.__readEntry(self.__getParsedFilePath(fileHash))]
+            return (fileHash, results)
+
+        # Missing, unreadable or malformed Parsed File Entry
+        except Exception:
+            return (fileHash, None)
+
+    ### Store Parsed Command File (File Hash taken before Parsing, atomic Replace) ###
+    ### Parse Results: List of (Line Number, Command, Error)
+    def storeParsedFile(self, importFile, fileHash, results):
+        try:
+            self.__checkDirectory()
+            self.__writeEntry(self.__getParsedFilePath(fileHash), [[lineNumber, CommandParser.packCommand(command) if (command != None) else None, error] for (lineNumber, command, error) in results])
+
+        # Cache is optional
+        except (OSError, ValueError, TypeError) as e:
+            self.__reportStoreError("Parsed File Cache not stored: " + str(e))
+
+    ########################################
+    ## Public Static Policy Cache Methods ##
+    ########################################
+
+    ### Hash File Content ###
+    ### Return: Hex SHA-256
+    def hashFile(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(PolicyCache.POLICY_CACHE_HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    ### Get Default Cache Directory (XDG Cache Directory, ~/.cache otherwise) ###
+    def getDefaultDirectory():
+        userCacheDirectory = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(userCacheDirectory, PolicyCache.POLICY_CACHE_DIRECTORY_NAME)
+
+    ##################################
+    ## Private Policy Cache Methods ##
+    ##################################
+
+    ### Check Cache Directory (created Owner only, must be owned by the User & not writable by others) ###
+    def __checkDirectory(self):
+        os.makedirs(self.cacheDirectory, mode=self.POLICY_CACHE_DIRECTORY_MODE, exist_ok=True)
+        directoryStat = os.stat(self.cacheDirectory)
+
+        if (hasattr(os, "getuid")) and (directoryStat.st_uid != os.getuid()):
+            raise OSError("Cache directory " + self.cacheDirectory + " not owned by the current user !")
+
+        if (directoryStat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)) != 0:
+            raise OSError("Cache directory " + self.cacheDirectory + " writable by other users !")
+
+    ### Report Store Error (first Store Error only) ###
+    def __reportStoreError(self, error):
+        if (self.storeErrorReported == False):
+            print(error)
+            self.storeErrorReported = True
+
+    ### Get Cache Entry Key (Cache Key, current Contents of the Read Files & current Matches of the Read Patterns) ###
+    def __getEntryKey(self, key, readFiles, readPatterns):
+        digest = hashlib.sha256(key.encode())
+        for importFile in readFiles:
+            digest.update(repr((str(importFile), PolicyCache.__getFileHash(importFile))).encode())
+        for pattern in readPatterns:
+            digest.update(repr((str(pattern), sorted(glob.glob(pattern)))).encode())
+        return digest.hexdigest()
+
+    ### Get Entry Path ###
+    def __getEntryPath(self, key, extension):
+        return os.path.join(self.cacheDirectory, key + extension)
+
+    ### Get Parsed File Entry Path (Configurer Version & File Content Hash) ###
+    def __getParsedFilePath(self, fileHash):
+        key = hashlib.sha256(repr((self.POLICY_CACHE_VERSION, self.configurerVersion, fileHash)).encode()).hexdigest()
+        return self.__getEntryPath(key, self.POLICY_CACHE_PARSED_FILE_EXTENSION)
+
+    ### Write JSON Entry (Owner only, atomic Replace) ###
+    def __writeEntry(self, entryPath, entry):
+        temporaryPath = entryPath + ".tmp"
+        with os.fdopen(os.open(temporaryPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as file:
+            json.dump(entry, file, separators=(',', ':'))
+        os.replace(temporaryPath, entryPath)
+
+    ### Read JSON Entry ###
+    def __readEntry(entryPath):
+        with open(entryPath, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    ### Get File Hash (None when the File can not be read) ###
+    def __getFileHash(path):
+        try:
+            return PolicyCache.hashFile(path)
+        except OSError:
+            return None
+
+    ### Get Configurer Version (SHA-256 of all Configurer Sources) ###
+    def __getConfigurerVersion():
+        digest = hashlib.sha256()
+        for source in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.py"))):
+            digest.update(os.path.basename(source).encode())
+            digest.update(PolicyCache.hashFile(source).encode())
+        return digest.hexdigest()
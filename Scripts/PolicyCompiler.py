@@ -0,0 +1,565 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: PolicyCompiler
+## Description: Compile Passes of the Export Pipeline (Policy rewritten to an equivalent Policy with less Memory Rows & Watchdog Cycles)
+##              Length Guards: String Descriptor bLength Values derived from String Values (Devices rejected on the Length Byte)
+##              Threshold Collapsing: Greater, GreaterEquals, Less & LessEquals Values of a Field reduced to the tightest Bound
+##              Constant Folding: Values always succeeding removed, Fields never succeeding reduced to their conflicting Values & reported
+##              String Subsumption: StartsWith, EndsWith, Contains & NotContains Values implied by another Value of the same Field removed
+##              Range Compression: Optional Equals Values of a Field replaced by Optional Between Values of their contiguous Runs
+########################################################################
+
+import math
+
+from FieldFormatEnum import FieldFormatEnum
+from VerificationLevelEnum import VerificationLevelEnum
+from VerificationOperatorEnum import VerificationOperatorEnum
+from VerificationValue import VerificationValue
+
+class PolicyCompiler:
+
+    ###############################
+    ## Policy Compiler Constants ##
+    ###############################
+
+    # Threshold Operators {Operator: Direction} (1: largest Mandatory Bound is the tightest, -1: smallest Mandatory Bound is the tightest)
+    THRESHOLD_OPERATORS = {
+        VerificationOperatorEnum.GREATER: 1,
+        VerificationOperatorEnum.GREATER_EQUALS: 1,
+        VerificationOperatorEnum.LESS: -1,
+        VerificationOperatorEnum.LESS_EQUALS: -1
+    }
+
+    # Range Operators (Values succeeding on a Range of Field Values)
+    RANGE_OPERATORS = tuple(THRESHOLD_OPERATORS) + (VerificationOperatorEnum.BETWEEN,)
+
+    # String Operators of String Fields {Operator: Function(Field Value, Value) -> True if succeeding}
+    STRING_OPERATORS = {
+        VerificationOperatorEnum.EQUALS: lambda fieldValue, value: fieldValue == value,
+        VerificationOperatorEnum.NOT_EQUALS: lambda fieldValue, value: fieldValue != value,
+        VerificationOperatorEnum.STARTSWITH: lambda fieldValue, value: fieldValue.startswith(value),
+        VerificationOperatorEnum.ENDSWITH: lambda fieldValue, value: fieldValue.endswith(value),
+        VerificationOperatorEnum.CONTAINS: lambda fieldValue, value: value in fieldValue,
+        VerificationOperatorEnum.NOT_CONTAINS: lambda fieldValue, value: value not in fieldValue
+    }
+
+    # String Descriptor Length Field (String Field Name + Suffix) & Length: Header Bytes + Bytes per UTF-16LE Character
+    STRING_LENGTH_FIELD_SUFFIX = "bLength"
+    STRING_HEADER_LENGTH = 2
+    STRING_CHAR_LENGTH = 2
+
+    # String Operators implying a minimum String Length (Equals: exact String Length)
+    STRING_MIN_LENGTH_OPERATORS = (
+        VerificationOperatorEnum.STARTSWITH,
+        VerificationOperatorEnum.ENDSWITH,
+        VerificationOperatorEnum.CONTAINS
+    )
+
+    # Operator ROM minimum Depth (a single Memory Value is duplicated) & Operator Instance Cost (Memory Bits equivalent of the Operator Logic)
+    OPERATOR_MIN_MEMORY_DEPTH = 2
+    OPERATOR_INSTANCE_COST_BITS = 1024
+
+    # String Subsumption Operators {Operator: (Match Mode, Verification Level keeping the shortest Value)}
+    # Match Mode: Values matched on Prefixes, Suffixes or Substrings of the other Values
+    STRING_SUBSUMPTION_OPERATORS = {
+        VerificationOperatorEnum.STARTSWITH: ("prefix", VerificationLevelEnum.OPTIONAL),
+        VerificationOperatorEnum.ENDSWITH: ("suffix", VerificationLevelEnum.OPTIONAL),
+        VerificationOperatorEnum.CONTAINS: ("substring", VerificationLevelEnum.OPTIONAL),
+        VerificationOperatorEnum.NOT_CONTAINS: ("substring", VerificationLevelEnum.MANDATORY)
+    }
+
+    ###########################################
+    ## Public Static Policy Compiler Methods ##
+    ###########################################
+
+    ### Compile Policy (all Compile Passes, in order) ###
+    ### Return: (List of (Compile Pass Name, Removed Value Count, Memory Rows saved, Watchdog Cycles saved), List of Unsatisfiable Fields)
+    def compilePolicy(session):
+        report = []
+        unsatisfiableFields = []
+        report.append(PolicyCompiler.__runPass(session, "Length Guards", PolicyCompiler.deriveLengthGuards))
+        report.append(PolicyCompiler.__runPass(session, "Threshold Collapsing", PolicyCompiler.collapseThresholds))
+        report.append(PolicyCompiler.__runPass(session, "Constant Folding", lambda session: PolicyCompiler.foldConstants(session, unsatisfiableFields)))
+        report.append(PolicyCompiler.__runPass(session, "String Subsumption", PolicyCompiler.pruneStringSubsumption))
+        report.append(PolicyCompiler.__runPass(session, "Range Compression", PolicyCompiler.compressRanges))
+        return (report, unsatisfiableFields)
+
+    ### Length Guards Pass (per String Field with a Length Field) ###
+    ### Mandatory Length Values implied by the String Values: Equals for an exact Length, else GreaterEquals/LessEquals Range
+    ### Mandatory Values: Equals sets the Length, StartsWith/EndsWith/Contains set a minimum Length
+    ### Optional Values: Equals set a Length Range, StartsWith/EndsWith/Contains set the shortest minimum Length
+    ### Return: Removed Value Count (negative: added Length Values)
+    def deriveLengthGuards(session):
+        addedValueCount = 0
+
+        for descriptor in session.getDescriptors():
+            for field in descriptor.DESCRIPTOR_FIELDS:
+                if (field.valueFormat != FieldFormatEnum.STRING):
+                    continue
+
+                # Length Field of the String Field
+                lengthField = descriptor.FIELD_REGISTRY.get((field.name + PolicyCompiler.STRING_LENGTH_FIELD_SUFFIX).casefold())
+                if (lengthField == None) or (len(descriptor.verificationValues[field.name]) == 0):
+                    continue
+
+                # Length Guards not already in the Length Field
+                lengthValues = {PolicyCompiler.__getValueKey(el) for el in descriptor.verificationValues[lengthField.name]}
+                guards = [el for el in PolicyCompiler.__getLengthGuards(lengthField, descriptor.verificationValues[field.name]) if ((el[2], el[1], el[0]) not in lengthValues)]
+
+                if (len(guards) > 0):
+                    descriptor.addVerificationValues(lengthField.name, guards, verifiedValues=True)
+                    addedValueCount += len(guards)
+
+        return -addedValueCount
+
+    ### Threshold Collapsing Pass (per Field, Operator, Verification Level & Hex Value Length) ###
+    ### Mandatory Values: all must succeed, only the tightest Bound is kept (largest Greater Bound, smallest Less Bound)
+    ### Optional Values: one must succeed, only the loosest Bound is kept (smallest Greater Bound, largest Less Bound)
+    ### Return: Removed Value Count
+    def collapseThresholds(session):
+        removedValueCount = 0
+
+        for descriptor in session.getDescriptors():
+            for field in descriptor.DESCRIPTOR_FIELDS:
+
+                # String Fields (Part by Part Comparison) & Fields without Threshold Values
+                if (field.valueFormat == FieldFormatEnum.STRING):
+                    continue
+                if (sum(descriptor.memoryRows[field.name][op] for op in PolicyCompiler.THRESHOLD_OPERATORS) <= 1):
+                    continue
+
+                # Kept Bound per Threshold Key
+                bounds = {}
+                for el in descriptor.verificationValues[field.name]:
+                    key = PolicyCompiler.__getThresholdKey(el)
+                    if (key == None):
+                        continue
+
+                    direction = PolicyCompiler.THRESHOLD_OPERATORS[el.operator]
+                    if (el.verificationLevel == VerificationLevelEnum.OPTIONAL):
+                        direction = -direction
+
+                    bound = PolicyCompiler.__getThresholdItem(el)
+                    if (key not in bounds) or ((bound - bounds[key]) * direction > 0):
+                        bounds[key] = bound
+
+                # Remove Values looser than the kept Bound
+                removedValueCount += descriptor.deleteVerificationValuesIf(field.name, lambda el: PolicyCompiler.__isLooserThreshold(el, bounds))
+
+        return removedValueCount
+
+    ### Constant Folding Pass (per Field, Values evaluated on the possible Field Values) ###
+    ### Possible Field Values: Value of a Mandatory Equals, or Range of the Mandatory Thresholds & Between Values (Number & full length Hex Fields)
+    ### Mandatory Values always succeeding and Optional Operator Values when one always succeeds are removed
+    ### Field with all Values removed: cheapest always succeeding Value kept (a Field without Memory Rows also succeeds on a missing Descriptor)
+    ### Field never succeeding: only its conflicting Values are kept & the Field is added to Unsatisfiable Fields
+    ### Return: Removed Value Count
+    def foldConstants(session, unsatisfiableFields):
+        removedValueCount = 0
+
+        for descriptor in session.getDescriptors():
+            for field in descriptor.DESCRIPTOR_FIELDS:
+                values = list(descriptor.verificationValues[field.name])
+                if (len(values) == 0):
+                    continue
+
+                # Values to remove & Conflict
+                (removedKeys, conflict) = PolicyCompiler.__foldField(field, values)
+                if (conflict != None):
+                    unsatisfiableFields.append(descriptor.DESCRIPTOR_NAME + " " + field.name + ": " + conflict)
+
+                if (len(removedKeys) > 0):
+                    removedValueCount += descriptor.deleteVerificationValuesIf(field.name, lambda el: PolicyCompiler.__getValueKey(el) in removedKeys)
+
+        return removedValueCount
+
+    ### String Subsumption Pass (per String Field, Operator & Verification Level) ###
+    ### Shortest Value kept: Optional StartsWith "Logi" covers "Logitech", Mandatory NotContains "Tech" covers "Logitech"
+    ### Longest Value kept: Mandatory Contains "Logitech" implies "Tech", Optional NotContains "Logitech" covers "Tech"
+    ### Return: Removed Value Count
+    def pruneStringSubsumption(session):
+        removedValueCount = 0
+
+        for descriptor in session.getDescriptors():
+            for field in descriptor.DESCRIPTOR_FIELDS:
+                if (field.valueFormat != FieldFormatEnum.STRING):
+                    continue
+
+                # Subsumed Value Keys of all String Operators
+                removedKeys = set()
+                for (op, (matchMode, shortestLevel)) in PolicyCompiler.STRING_SUBSUMPTION_OPERATORS.items():
+
+                    # Operators with at least 2 Values
+                    if (descriptor.memoryRows[field.name][op] <= 1):
+                        continue
+
+                    for level in VerificationLevelEnum:
+                        values = {el.value for el in descriptor.verificationValues[field.name] if (el.operator == op) and (el.verificationLevel == level)}
+                        if (len(values) > 1):
+                            removedKeys.update((op, level, value) for value in PolicyCompiler.__getSubsumedValues(values, matchMode, level == shortestLevel))
+
+                if (len(removedKeys) > 0):
+                    removedValueCount += descriptor.deleteVerificationValuesIf(field.name, lambda el: PolicyCompiler.__getValueKey(el) in removedKeys)
+
+        return removedValueCount
+
+    ### Range Compression Pass (per Number & Hex Field) ###
+    ### Optional Values: one per Operator must succeed, all Optional Equals replaced by one Optional Between per contiguous Run (same succeeding Field Values)
+    ### Only Fields without Optional Between Values (Equals & Between Operators checked apart) & with Equals Values on all Field Quartets
+    ### Only when less Memory Bits: Between Rows are wider, and a Between Operator without Rows is enabled (ROM & Operator Instance)
+    ### Return: Removed Value Count (Equals Values removed - Between Values added)
+    def compressRanges(session):
+        removedValueCount = 0
+
+        for descriptor in session.getDescriptors():
+            for field in descriptor.DESCRIPTOR_FIELDS:
+
+                # String Fields (no Between) & Fields without Optional Equals Values to compress
+                if (field.valueFormat == FieldFormatEnum.STRING):
+                    continue
+                if (descriptor.memoryRows[field.name][VerificationOperatorEnum.EQUALS] <= 1):
+                    continue
+
+                optionalValues = [el for el in descriptor.verificationValues[field.name] if (el.verificationLevel == VerificationLevelEnum.OPTIONAL)]
+                equalsValues = [el for el in optionalValues if (el.operator == VerificationOperatorEnum.EQUALS)]
+                if (len(equalsValues) <= 1) or any(el.operator == VerificationOperatorEnum.BETWEEN for el in optionalValues):
+                    continue
+                if (all(PolicyCompiler.__isFoldable(field, el) for el in equalsValues) == False):
+                    continue
+
+                # Contiguous Runs (less Memory Bits of the Equals & Between Operators only)
+                ranges = PolicyCompiler.__getContiguousRanges(field, equalsValues)
+                if (len(ranges) >= len(equalsValues)):
+                    continue
+
+                memoryRows = session.getPolicyMetrics()[0]
+                (equalsRows, betweenRows) = (memoryRows[VerificationOperatorEnum.EQUALS], memoryRows[VerificationOperatorEnum.BETWEEN])
+                memoryBits = PolicyCompiler.__getOperatorBits(VerificationOperatorEnum.EQUALS, equalsRows) + PolicyCompiler.__getOperatorBits(VerificationOperatorEnum.BETWEEN, betweenRows)
+                compressedMemoryBits = PolicyCompiler.__getOperatorBits(VerificationOperatorEnum.EQUALS, equalsRows - len(equalsValues)) + PolicyCompiler.__getOperatorBits(VerificationOperatorEnum.BETWEEN, betweenRows + len(ranges))
+                if (compressedMemoryBits >= memoryBits):
+                    continue
+
+                removedValueCount += descriptor.deleteVerificationValuesIf(field.name, lambda el: (el.operator == VerificationOperatorEnum.EQUALS) and (el.verificationLevel == VerificationLevelEnum.OPTIONAL))
+                descriptor.addVerificationValues(field.name, [(value, VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.BETWEEN) for value in ranges], verifiedValues=True)
+                removedValueCount -= len(ranges)
+
+        return removedValueCount
+
+    ############################################
+    ## Private Static Policy Compiler Methods ##
+    ############################################
+
+    ### Run Compile Pass ###
+    ### Return: (Compile Pass Name, Removed Value Count, Memory Rows saved, Watchdog Cycles saved)
+    def __runPass(session, passName, compilePass):
+        (memoryRows, largestVerifNumber) = session.getPolicyMetrics()
+        removedValueCount = compilePass(session)
+        (compiledMemoryRows, compiledLargestVerifNumber) = session.getPolicyMetrics()
+
+        memoryRowsSaved = sum(memoryRows.values()) - sum(compiledMemoryRows.values())
+        watchdogCyclesSaved = (largestVerifNumber - compiledLargestVerifNumber) * VerificationValue.getOperatorWatchdogLimit()
+        return (passName, removedValueCount, memoryRowsSaved, watchdogCyclesSaved)
+
+    ### Fold Field Values ###
+    ### Return: (Set of removed Value Keys, Conflict Description or None)
+    def __foldField(field, values):
+        mandatoryValues = [el for el in values if (el.verificationLevel == VerificationLevelEnum.MANDATORY)]
+        optionalValues = [el for el in values if (el.verificationLevel != VerificationLevelEnum.MANDATORY)]
+
+        # Range of the Mandatory Thresholds (Number & full length Hex Fields) & Values setting the Range
+        fieldRange = PolicyCompiler.__getFieldRange(field)
+        rangeValues = []
+        if (fieldRange != None):
+            for el in mandatoryValues:
+                if (el.operator in PolicyCompiler.RANGE_OPERATORS) and (PolicyCompiler.__isFoldable(field, el) == True):
+                    threshold = PolicyCompiler.__getThresholdRange(el)
+                    if (max(fieldRange[0], threshold[0]) != fieldRange[0]) or (min(fieldRange[1], threshold[1]) != fieldRange[1]):
+                        fieldRange = (max(fieldRange[0], threshold[0]), min(fieldRange[1], threshold[1]))
+                        rangeValues.append(el)
+
+            # Empty Range
+            if (fieldRange[0] > fieldRange[1]):
+                return PolicyCompiler.__getConflict(values, rangeValues, "thresholds never all succeed")
+
+        # Field Value set by a Mandatory Equals
+        pinValue = None
+        for el in mandatoryValues:
+            if (el.operator == VerificationOperatorEnum.EQUALS) and (PolicyCompiler.__isFoldable(field, el) == True):
+                pinValue = el
+                break
+
+        if (pinValue != None):
+            if (fieldRange != None):
+                if (PolicyCompiler.__evaluate(field, pinValue, fieldRange) == False):
+                    return PolicyCompiler.__getConflict(values, rangeValues + [pinValue], "thresholds never succeed with " + PolicyCompiler.__describe(pinValue))
+                fieldRange = (PolicyCompiler.__getThresholdItem(pinValue),) * 2
+            else:
+                fieldRange = pinValue.value
+            rangeValues = [pinValue]
+
+        # Range of the Mandatory Thresholds only (Threshold Values kept unless always succeeding on any Field Value)
+        rangeKeys = {PolicyCompiler.__getValueKey(el) for el in rangeValues}
+        removedKeys = set()
+        succeedingValues = []
+        for el in mandatoryValues:
+            key = PolicyCompiler.__getValueKey(el)
+            if (key in rangeKeys):
+                continue
+
+            if (pinValue == None) and (el.operator in PolicyCompiler.RANGE_OPERATORS):
+                result = PolicyCompiler.__evaluate(field, el, PolicyCompiler.__getFieldRange(field))
+            else:
+                result = PolicyCompiler.__evaluate(field, el, fieldRange)
+
+            # Mandatory Value never succeeding
+            if (result == False):
+                return PolicyCompiler.__getConflict(values, rangeValues + [el], PolicyCompiler.__describe(el) + " never succeeds" + ((" with " + PolicyCompiler.__describe(pinValue)) if (pinValue != None) else ""))
+
+            # Mandatory Value always succeeding
+            if (result == True):
+                removedKeys.add(key)
+                succeedingValues.append(el)
+
+        # Optional Values per Operator (at least one must succeed)
+        for op in VerificationOperatorEnum:
+            operatorValues = [el for el in optionalValues if (el.operator == op)]
+            if (len(operatorValues) == 0):
+                continue
+
+            results = [PolicyCompiler.__evaluate(field, el, fieldRange) for el in operatorValues]
+
+            # One Value always succeeding: Operator always succeeds
+            if (True in results):
+                removedKeys.update(PolicyCompiler.__getValueKey(el) for el in operatorValues)
+                succeedingValues.extend(el for (el, result) in zip(operatorValues, results) if (result == True))
+
+            # No Value can succeed
+            elif (all(result == False for result in results)):
+                return PolicyCompiler.__getConflict(values, rangeValues + operatorValues, "no optional " + VerificationOperatorEnum.getVerificationOperatorName(op) + " value can succeed" + ((" with " + PolicyCompiler.__describe(pinValue)) if (pinValue != None) else ""))
+
+            # Values never succeeding
+            else:
+                removedKeys.update(PolicyCompiler.__getValueKey(el) for (el, result) in zip(operatorValues, results) if (result == False))
+
+        # All Values removed: cheapest always succeeding Value kept (Field still required on the Device)
+        if ({PolicyCompiler.__getValueKey(el) for el in values} <= removedKeys):
+            removedKeys.discard(PolicyCompiler.__getValueKey(min(succeedingValues, key=PolicyCompiler.__getMemoryBits)))
+
+        return (removedKeys, None)
+
+    ### Get Conflict (only conflicting Values kept, same Result: never succeeding) ###
+    ### Return: (Set of removed Value Keys, Conflict Description)
+    def __getConflict(values, conflictValues, conflict):
+        keptKeys = {PolicyCompiler.__getValueKey(el) for el in conflictValues}
+        removedKeys = {PolicyCompiler.__getValueKey(el) for el in values} - keptKeys
+        return (removedKeys, ", ".join(PolicyCompiler.__describe(el) for el in conflictValues) + ": " + conflict)
+
+    ### Evaluate Value on possible Field Values ###
+    ### Field Range: (Min, Max) for Number & Hex Fields, Field Value for String Fields, None when unknown
+    ### Return: True (always succeeds), False (never succeeds), None (depends on the Field Value or not foldable)
+    def __evaluate(field, verificationValue, fieldRange):
+        if (fieldRange == None) or (PolicyCompiler.__isFoldable(field, verificationValue) == False):
+            return None
+
+        # String Field Value
+        if (field.valueFormat == FieldFormatEnum.STRING):
+            stringOperator = PolicyCompiler.STRING_OPERATORS.get(verificationValue.operator)
+            if (stringOperator == None):
+                return None
+            return stringOperator(fieldRange, verificationValue.value)
+
+        # Number & Hex Field Range (Min, Max)
+        (low, high) = fieldRange
+        match verificationValue.operator:
+            case VerificationOperatorEnum.EQUALS:
+                item = PolicyCompiler.__getThresholdItem(verificationValue)
+                return True if (low == high == item) else (False if (item < low) or (item > high) else None)
+            case VerificationOperatorEnum.NOT_EQUALS:
+                item = PolicyCompiler.__getThresholdItem(verificationValue)
+                return False if (low == high == item) else (True if (item < low) or (item > high) else None)
+            case op if (op in PolicyCompiler.RANGE_OPERATORS):
+                (thresholdLow, thresholdHigh) = PolicyCompiler.__getThresholdRange(verificationValue)
+                return True if (thresholdLow <= low) and (high <= thresholdHigh) else (False if (high < thresholdLow) or (low > thresholdHigh) else None)
+            case _:
+                return None
+
+    ### Check if a Value can be evaluated (String Fields, Number Fields & Hex Values on all Field Quartets) ###
+    ### Return: True/False
+    def __isFoldable(field, verificationValue):
+        if (field.valueFormat == FieldFormatEnum.HEX):
+            return len(verificationValue.value.split(VerificationValue.RANGE_SEPARATOR)[0]) == field.length
+        return True
+
+    ### Get Field Value Range (Number & Hex Fields) ###
+    ### Return: (Min, Max), None for String Fields
+    def __getFieldRange(field):
+        match field.valueFormat:
+            case FieldFormatEnum.NUMBER:
+                return (0, field.length)
+            case FieldFormatEnum.HEX:
+                return (0, 16 ** field.length - 1)
+            case _:
+                return None
+
+    ### Get Field Values succeeding a Threshold or Between Value ###
+    ### Return: (Min, Max)
+    def __getThresholdRange(verificationValue):
+        if (verificationValue.operator == VerificationOperatorEnum.BETWEEN):
+            base = 16 if (verificationValue.valueFormat == FieldFormatEnum.HEX) else 10
+            return tuple(int(bound, base) for bound in verificationValue.value.split(VerificationValue.RANGE_SEPARATOR))
+
+        item = PolicyCompiler.__getThresholdItem(verificationValue)
+        match verificationValue.operator:
+            case VerificationOperatorEnum.GREATER:
+                return (item + 1, math.inf)
+            case VerificationOperatorEnum.GREATER_EQUALS:
+                return (item, math.inf)
+            case VerificationOperatorEnum.LESS:
+                return (-math.inf, item - 1)
+            case _:
+                return (-math.inf, item)
+
+    ### Get Length Guards of String Values ###
+    ### Return: List of (Length Value, Verification Level, Operator)
+    def __getLengthGuards(lengthField, values):
+        (minLength, maxLength) = (PolicyCompiler.STRING_HEADER_LENGTH, lengthField.length)
+
+        # Optional Length Ranges {Operator: (Min, Max)}
+        optionalRanges = {}
+
+        for el in values:
+            length = PolicyCompiler.STRING_HEADER_LENGTH + PolicyCompiler.STRING_CHAR_LENGTH * len(el.value)
+            match el.operator:
+                case VerificationOperatorEnum.EQUALS:
+                    valueRange = (length, length)
+                case op if (op in PolicyCompiler.STRING_MIN_LENGTH_OPERATORS):
+                    valueRange = (length, math.inf)
+                case _:
+                    continue
+
+            # Mandatory: all Ranges apply
+            if (el.verificationLevel == VerificationLevelEnum.MANDATORY):
+                (minLength, maxLength) = (max(minLength, valueRange[0]), min(maxLength, valueRange[1]))
+
+            # Optional: one Range per Operator applies
+            elif (el.operator in optionalRanges):
+                optionalRange = optionalRanges[el.operator]
+                optionalRanges[el.operator] = (min(optionalRange[0], valueRange[0]), max(optionalRange[1], valueRange[1]))
+            else:
+                optionalRanges[el.operator] = valueRange
+
+        for (optionalMin, optionalMax) in optionalRanges.values():
+            (minLength, maxLength) = (max(minLength, optionalMin), min(maxLength, optionalMax))
+
+        # Length out of the Length Field (String never matching a String Descriptor): no Guard
+        if (minLength > lengthField.length):
+            return []
+
+        # Exact Length
+        if (minLength == maxLength):
+            return [(str(minLength), VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.EQUALS)]
+
+        # Length Range
+        guards = []
+        if (minLength > PolicyCompiler.STRING_HEADER_LENGTH):
+            guards.append((str(minLength), VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.GREATER_EQUALS))
+        if (maxLength < lengthField.length):
+            guards.append((str(maxLength), VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.LESS_EQUALS))
+        return guards
+
+    ### Get Contiguous Ranges of Equals Values (sorted Runs of consecutive Values) ###
+    ### Return: List of Range Values (Low..High)
+    def __getContiguousRanges(field, values):
+        items = sorted({PolicyCompiler.__getThresholdItem(el) for el in values})
+
+        # Runs of consecutive Values: (Low, High)
+        runs = []
+        for item in items:
+            if (len(runs) > 0) and (runs[-1][1] + 1 == item):
+                runs[-1] = (runs[-1][0], item)
+            else:
+                runs.append((item, item))
+
+        # Hex Bounds on all Field Quartets
+        if (field.valueFormat == FieldFormatEnum.HEX):
+            valueFormat = '0' + str(field.length) + 'x'
+        else:
+            valueFormat = 'd'
+        return [format(low, valueFormat) + VerificationValue.RANGE_SEPARATOR + format(high, valueFormat) for (low, high) in runs]
+
+    ### Get Subsumed String Values (Trie of all Values, walked from each Value Start Position) ###
+    ### Keep Shortest: Values containing another Value are subsumed, else Values contained in another Value are subsumed
+    ### Return: Set of subsumed Values
+    def __getSubsumedValues(values, matchMode, keepShortest):
+
+        # Suffixes matched as Prefixes of reversed Values {Matched String: Value}
+        if (matchMode == "suffix"):
+            strings = {value[::-1]: value for value in values}
+        else:
+            strings = {value: value for value in values}
+
+        # Trie of all Strings (None Key: String ending at this Node)
+        trie = {}
+        for string in strings:
+            node = trie
+            for char in string:
+                node = node.setdefault(char, {})
+            node[None] = string
+
+        subsumedStrings = set()
+        for string in strings:
+            startPositions = range(len(string)) if (matchMode == "substring") else (0,)
+            for start in startPositions:
+                node = trie
+                for char in string[start:]:
+                    node = node.get(char)
+                    if (node == None):
+                        break
+
+                    # Other String contained in this String
+                    containedString = node.get(None)
+                    if (containedString != None) and (containedString != string):
+                        subsumedStrings.add(string if (keepShortest == True) else containedString)
+
+        return {strings[string] for string in subsumedStrings}
+
+    ### Get Operator Memory Bits (ROM of the Operator Memory Rows & Operator Instance, nothing without Memory Rows) ###
+    def __getOperatorBits(operator, memoryRows):
+        if (memoryRows == 0):
+            return 0
+        return max(memoryRows, PolicyCompiler.OPERATOR_MIN_MEMORY_DEPTH) * VerificationValue.getMemoryWidth(operator) + PolicyCompiler.OPERATOR_INSTANCE_COST_BITS
+
+    ### Get Value Memory Bits (Memory Rows of the Value x Memory Width of its Operator) ###
+    def __getMemoryBits(verificationValue):
+        return verificationValue.getMemoryUsage() * VerificationValue.getMemoryWidth(verificationValue.operator)
+
+    ### Get Value Key (same Key: same Folding) ###
+    def __getValueKey(verificationValue):
+        return (verificationValue.operator, verificationValue.verificationLevel, verificationValue.value)
+
+    ### Describe Value (Reports) ###
+    def __describe(verificationValue):
+        return VerificationOperatorEnum.getVerificationOperatorName(verificationValue.operator) + " " + verificationValue.value + " (" + verificationValue.verificationLevel.name + ")"
+
+    ### Get Threshold Key (Values compared on the same Quartets) ###
+    ### Return: (Operator, Verification Level, Hex Value Length), None for other Operators
+    def __getThresholdKey(verificationValue):
+        if (verificationValue.operator not in PolicyCompiler.THRESHOLD_OPERATORS):
+            return None
+
+        # Number Values: all Quartets enabled, Hex Values: one Quartet per Character
+        valueLength = len(verificationValue.value) if (verificationValue.valueFormat == FieldFormatEnum.HEX) else None
+        return (verificationValue.operator, verificationValue.verificationLevel, valueLength)
+
+    ### Check if a Value is looser than the kept Bound of its Threshold Key ###
+    ### Return: True/False
+    def __isLooserThreshold(verificationValue, bounds):
+        key = PolicyCompiler.__getThresholdKey(verificationValue)
+        return (key in bounds) and (PolicyCompiler.__getThresholdItem(verificationValue) != bounds[key])
+
+    ### Get Threshold Bound ###
+    def __getThresholdItem(verificationValue):
+        if (verificationValue.valueFormat == FieldFormatEnum.HEX):
+            return int(verificationValue.value, 16)
+        return int(verificationValue.value)
@@ -45,6 +45,7 @@ class SourceFileManager:
     VHDL_USB_VERIFIER_ENDS_WITH_ENABLE_PATTERN = "ENDS_WITH_OPERATOR_ENABLE => "
     VHDL_USB_VERIFIER_CONTAINS_ENABLE_PATTERN = "CONTAINS_OPERATOR_ENABLE => "
     VHDL_USB_VERIFIER_NOT_CONTAINS_ENABLE_PATTERN = "NOT_CONTAINS_OPERATOR_ENABLE => "
+    VHDL_USB_VERIFIER_BETWEEN_ENABLE_PATTERN = "BETWEEN_OPERATOR_ENABLE => "
     VHDL_USB_VERIFIER_WATCHDOG_LIMIT_PATTERN = "WATCHDOG_LIMIT => "
 
     # USB Verifier Operator Configs
@@ -196,6 +197,10 @@ class SourceFileManager:
                 case VerificationOperatorEnum.CONTAINS:
                     opConfigs.update({self.VHDL_USB_VERIFIER_CONTAINS_ENABLE_PATTERN: self.VHDL_USB_VERIFIER_CONTAINS_ENABLE_PATTERN + operatorSummary[0][opName] + self.VHDL_USB_VERIFIER_VALUE_SEPARATOR + "\n"})
 
+                # Between
+                case VerificationOperatorEnum.BETWEEN:
+                    opConfigs.update({self.VHDL_USB_VERIFIER_BETWEEN_ENABLE_PATTERN: self.VHDL_USB_VERIFIER_BETWEEN_ENABLE_PATTERN + operatorSummary[0][opName] + self.VHDL_USB_VERIFIER_VALUE_SEPARATOR + "\n"})
+
                 # Not Contains
                 case _:
                     opConfigs.update({self.VHDL_USB_VERIFIER_NOT_CONTAINS_ENABLE_PATTERN: self.VHDL_USB_VERIFIER_NOT_CONTAINS_ENABLE_PATTERN + operatorSummary[0][opName] + self.VHDL_USB_VERIFIER_VALUE_SEPARATOR + "\n"})
@@ -0,0 +1,52 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: StringInterningPool
+## Description: String Interning (sys.intern, a String is released with its last Value) & Encoded String Chunk Pool (bounded, cleared after each Export)
+########################################################################
+
+import sys
+
+class StringInterningPool:
+
+    #####################################
+    ## String Interning Pool Constants ##
+    #####################################
+
+    # Encoded String Chunk Max Number (Pool cleared when full)
+    POOL_MAX_ENCODED_CHUNKS = 65536
+
+    #####################################
+    ## String Interning Pool Variables ##
+    #####################################
+
+    # Encoded String Chunks (shared by all Descriptors & Operators during an Export) {String Chunk: (Converted Data Value, Quartet Enable)}
+    encodedChunks = {}
+
+    #################################################
+    ## Public Static String Interning Pool Methods ##
+    #################################################
+
+    ### Intern String (one instance per distinct String while referenced) ###
+    ### Return: Interned String
+    def internString(value):
+        return sys.intern(value)
+
+    ### Intern Encoded String Chunk (encoded once per distinct Chunk) ###
+    ### Encoder: Function(String Chunk) -> (Converted Data Value, Quartet Enable)
+    ### Return: (Converted Data Value, Quartet Enable)
+    def internEncodedChunk(chunk, encoder):
+        encodedChunk = StringInterningPool.encodedChunks.get(chunk)
+
+        # New Chunk (Encode, Pool cleared when full)
+        if (encodedChunk == None):
+            if (len(StringInterningPool.encodedChunks) >= StringInterningPool.POOL_MAX_ENCODED_CHUNKS):
+                StringInterningPool.encodedChunks.clear()
+            encodedChunk = encoder(chunk)
+            StringInterningPool.encodedChunks[chunk] = encodedChunk
+
+        return encodedChunk
+
+    ### Clear Encoded String Chunks (end of Export) ###
+    def clearEncodedChunks():
+        StringInterningPool.encodedChunks.clear()
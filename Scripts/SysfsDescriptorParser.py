@@ -0,0 +1,144 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: SysfsDescriptorParser
+## Description: Parser of Linux sysfs USB Device Captures (/sys/bus/usb/devices/<device>/)
+##              descriptors: raw Device, Configuration, Interface, HID & Endpoint Descriptor bytes
+##              manufacturer, product, serial, configuration & <device>:<config>.<interface>/interface: String Descriptor texts
+########################################################################
+
+import os
+import glob
+
+from FieldFormatEnum import FieldFormatEnum
+
+# USB Descriptors
+from DeviceDescriptor import DeviceDescriptor
+from ConfigurationDescriptor import ConfigurationDescriptor
+from InterfaceDescriptor import InterfaceDescriptor
+from HIDDescriptor import HIDDescriptor
+from EndpointDescriptor import EndpointDescriptor
+from DeviceQualifierDescriptor import DeviceQualifierDescriptor
+from OtherSpeedDescriptor import OtherSpeedDescriptor
+
+class SysfsDescriptorParser:
+
+    #######################################
+    ## Sysfs Descriptor Parser Constants ##
+    #######################################
+
+    # Raw Descriptors File Name
+    SYSFS_DESCRIPTORS_FILENAME = "descriptors"
+
+    # USB Descriptor Classes {bDescriptorType Code: Descriptor Class}
+    BINARY_DESCRIPTOR_CLASSES = {descriptorClass.BINARY_DESCRIPTOR_TYPE: descriptorClass for descriptorClass in (
+        DeviceDescriptor,
+        ConfigurationDescriptor,
+        InterfaceDescriptor,
+        HIDDescriptor,
+        EndpointDescriptor,
+        DeviceQualifierDescriptor,
+        OtherSpeedDescriptor
+    )}
+
+    # Device String Files {Sysfs File Name: (Descriptor Class, USB Field Name)}
+    SYSFS_DEVICE_STRING_FILES = {
+        "manufacturer": (DeviceDescriptor, "iManufacturer"),
+        "product": (DeviceDescriptor, "iProduct"),
+        "serial": (DeviceDescriptor, "iSerialNumber"),
+        "configuration": (ConfigurationDescriptor, "iConfiguration")
+    }
+
+    # Interface String File Pattern (Configuration Value, Interface Number)
+    SYSFS_INTERFACE_STRING_PATTERN = "*:{}.{}/interface"
+
+    ###################################################
+    ## Public Static Sysfs Descriptor Parser Methods ##
+    ###################################################
+
+    ### Parse Device Capture (raw Descriptors File & String Files of its Directory) ###
+    ### Return: List of (Descriptor Class, USB Field Name, Value)
+    def parseDevice(descriptorsFile):
+        with open(descriptorsFile, 'rb') as file:
+            data = file.read()
+
+        # Binary Descriptors & Interfaces [(Configuration Value, Interface Number)]
+        (values, interfaces) = SysfsDescriptorParser.parseDescriptors(data)
+
+        # String Descriptors
+        directory = os.path.dirname(descriptorsFile)
+        for (fileName, (descriptorClass, fieldName)) in SysfsDescriptorParser.SYSFS_DEVICE_STRING_FILES.items():
+            value = SysfsDescriptorParser.__readString(os.path.join(directory, fileName))
+            if (value != None):
+                values.append((descriptorClass, fieldName, value))
+
+        for (configurationValue, interfaceNumber) in interfaces:
+            for interfaceFile in glob.glob(os.path.join(glob.escape(directory), SysfsDescriptorParser.SYSFS_INTERFACE_STRING_PATTERN.format(configurationValue, interfaceNumber))):
+                value = SysfsDescriptorParser.__readString(interfaceFile)
+                if (value != None):
+                    values.append((InterfaceDescriptor, "iInterface", value))
+
+        return values
+
+    ### Parse raw Descriptors (zero-copy Slices of the Blob) ###
+    ### Return: (List of (Descriptor Class, USB Field Name, Value), List of (Configuration Value, Interface Number))
+    def parseDescriptors(data):
+        values = []
+        interfaces = []
+        configurationValue = None
+        view = memoryview(data)
+        offset = 0
+
+        while (offset < len(view)):
+
+            # Descriptor Header (bLength, bDescriptorType)
+            if (offset + 2 > len(view)):
+                raise Exception("Byte " + str(offset) + ": Truncated descriptor header !")
+            (length, descriptorType) = (view[offset], view[offset + 1])
+            if (length < 2) or (offset + length > len(view)):
+                raise Exception("Byte " + str(offset) + ": Wrong descriptor length " + str(length) + " !")
+
+            # Verified Descriptor (other Descriptors skipped)
+            descriptorClass = SysfsDescriptorParser.BINARY_DESCRIPTOR_CLASSES.get(descriptorType)
+            if (descriptorClass != None):
+                layout = descriptorClass.BINARY_LAYOUT
+                if (length < layout.size):
+                    raise Exception("Byte " + str(offset) + ": " + descriptorClass.DESCRIPTOR_NAME + " shorter than " + str(layout.size) + " bytes !")
+
+                items = layout.unpack_from(view, offset)
+                for (fieldName, item) in zip(descriptorClass.BINARY_FIELDS, items):
+                    if (fieldName != None):
+                        values.append((descriptorClass, fieldName, SysfsDescriptorParser.__formatValue(descriptorClass.FIELD_REGISTRY[fieldName.casefold()], item)))
+
+                # Interface String Lookup (Interface of the current Configuration)
+                if (descriptorClass == ConfigurationDescriptor):
+                    configurationValue = items[descriptorClass.BINARY_FIELDS.index("bConfigurationValue")]
+                elif (descriptorClass == InterfaceDescriptor) and (configurationValue != None):
+                    interfaces.append((configurationValue, items[descriptorClass.BINARY_FIELDS.index("bInterfaceNumber")]))
+
+            offset += length
+
+        return (values, list(dict.fromkeys(interfaces)))
+
+    ####################################################
+    ## Private Static Sysfs Descriptor Parser Methods ##
+    ####################################################
+
+    ### Format Binary Field Value (Field Format) ###
+    def __formatValue(field, item):
+        if (field.valueFormat == FieldFormatEnum.HEX):
+            return format(item, '0' + str(field.length) + 'x')
+        return str(item)
+
+    ### Read String File (without trailing Line End) ###
+    ### Return: String, None when missing or empty
+    def __readString(path):
+        try:
+            with open(path, 'r', encoding='UTF8') as file:
+                value = file.read().rstrip("\n")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        if (value == ""):
+            return None
+        return value
@@ -0,0 +1,117 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: test_PolicyCompiler
+## Description: Policy Compiler Pass Tests (compiled Policy must verify Devices as the written Policy)
+##              python -m unittest discover Scripts/Tests
+########################################################################
+
+import os
+import sys
+import unittest
+
+# Configurer Sources
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from PolicyCompiler import PolicyCompiler
+from VerificationSession import VerificationSession
+from VerificationLevelEnum import VerificationLevelEnum
+from VerificationOperatorEnum import VerificationOperatorEnum
+
+class PolicyCompilerTest(unittest.TestCase):
+
+    ##################################
+    ## Policy Compiler Test Methods ##
+    ##################################
+
+    ### Create Session with Values of one Descriptor Field ###
+    ### Values: List of (Value, Verification Level, Operator)
+    ### Return: (Session, Descriptor)
+    def createSession(self, descriptorType, fieldName, values):
+        session = VerificationSession()
+        descriptor = session.getDescriptor(descriptorType)
+        for (value, verificationLevel, operator) in values:
+            descriptor.addVerificationValue(fieldName, value, verificationLevel, operator)
+        return (session, descriptor)
+
+    ### Get Field Values ###
+    ### Return: List of (Value, Verification Level, Operator)
+    def getValues(self, descriptor, fieldName):
+        return [(el.value, el.verificationLevel, el.operator) for el in descriptor.verificationValues[fieldName]]
+
+    ### Constant Folding: Mandatory Value always succeeding removed when other Values remain ###
+    def testFoldMandatoryValue(self):
+        (session, descriptor) = self.createSession("interface", "bInterfaceClass", [
+            ("00", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.GREATER_EQUALS),
+            ("03", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.NOT_EQUALS)
+        ])
+        unsatisfiableFields = []
+
+        self.assertEqual(PolicyCompiler.foldConstants(session, unsatisfiableFields), 1)
+        self.assertEqual(self.getValues(descriptor, "bInterfaceClass"), [("03", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.NOT_EQUALS)])
+        self.assertEqual(unsatisfiableFields, [])
+
+    ### Constant Folding: Field never emptied (a Field without Memory Rows succeeds on a Device without the Descriptor) ###
+    def testFoldKeepsRequiredField(self):
+        (session, descriptor) = self.createSession("interface", "bInterfaceClass", [
+            ("00", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.GREATER_EQUALS)
+        ])
+
+        self.assertEqual(PolicyCompiler.foldConstants(session, []), 0)
+        self.assertEqual(self.getValues(descriptor, "bInterfaceClass"), [("00", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.GREATER_EQUALS)])
+
+    ### Constant Folding: Field never emptied by Optional Values always succeeding (one Value kept) ###
+    def testFoldKeepsRequiredFieldOptional(self):
+        (session, descriptor) = self.createSession("interface", "bInterfaceClass", [
+            ("00", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.GREATER_EQUALS),
+            ("10", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.GREATER_EQUALS)
+        ])
+
+        self.assertEqual(PolicyCompiler.foldConstants(session, []), 1)
+        self.assertEqual(self.getValues(descriptor, "bInterfaceClass"), [("00", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.GREATER_EQUALS)])
+
+    ### Constant Folding: Field never emptied by a full Compile ###
+    def testCompileKeepsRequiredField(self):
+        (session, descriptor) = self.createSession("interface", "bInterfaceClass", [
+            ("00", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.GREATER_EQUALS)
+        ])
+
+        PolicyCompiler.compilePolicy(session)
+        self.assertEqual(len(descriptor.verificationValues["bInterfaceClass"]), 1)
+        self.assertTrue(descriptor.isDescriptorInUse())
+
+    ### Range Compression: no Compression when the Between ROM & Operator cost more Memory Bits than the Equals Rows ###
+    def testCompressRangesMemoryBits(self):
+        (session, descriptor) = self.createSession("device", "idVendor", [
+            ("0001", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS),
+            ("0002", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS),
+            ("0003", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS)
+        ])
+
+        self.assertEqual(PolicyCompiler.compressRanges(session), 0)
+        self.assertEqual(len(descriptor.verificationValues["idVendor"]), 3)
+        self.assertEqual(session.getPolicyMetrics()[0][VerificationOperatorEnum.BETWEEN], 0)
+
+    ### Range Compression: long contiguous Run compressed to one Between Value ###
+    def testCompressRangesLongRun(self):
+        (session, descriptor) = self.createSession("device", "idVendor", [
+            (format(item, '04x'), VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS) for item in range(1, 65)
+        ])
+
+        self.assertEqual(PolicyCompiler.compressRanges(session), 63)
+        self.assertEqual(self.getValues(descriptor, "idVendor"), [("0001..0040", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.BETWEEN)])
+
+    ### Range Compression: short Run compressed when the Between Operator is already enabled ###
+    def testCompressRangesEnabledBetween(self):
+        (session, descriptor) = self.createSession("device", "idVendor", [
+            ("0001", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS),
+            ("0002", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS),
+            ("0003", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.EQUALS)
+        ])
+        session.getDescriptor("device").addVerificationValue("idProduct", "0001..0010", VerificationLevelEnum.MANDATORY, VerificationOperatorEnum.BETWEEN)
+
+        self.assertEqual(PolicyCompiler.compressRanges(session), 2)
+        self.assertEqual(self.getValues(descriptor, "idVendor"), [("0001..0003", VerificationLevelEnum.OPTIONAL, VerificationOperatorEnum.BETWEEN)])
+
+if __name__ == '__main__':
+    unittest.main()
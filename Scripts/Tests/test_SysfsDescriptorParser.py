@@ -0,0 +1,127 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: test_SysfsDescriptorParser
+## Description: Sysfs Descriptor Parser Tests on a captured Device (Fixtures/SysfsDevice)
+##              python -m unittest discover Scripts/Tests
+########################################################################
+
+import os
+import sys
+import unittest
+
+# Configurer Sources
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from SysfsDescriptorParser import SysfsDescriptorParser
+from DeviceDescriptor import DeviceDescriptor
+from ConfigurationDescriptor import ConfigurationDescriptor
+from InterfaceDescriptor import InterfaceDescriptor
+from HIDDescriptor import HIDDescriptor
+from EndpointDescriptor import EndpointDescriptor
+
+class SysfsDescriptorParserTest(unittest.TestCase):
+
+    ############################################
+    ## Sysfs Descriptor Parser Test Constants ##
+    ############################################
+
+    # Captured Device (USB Optical Mouse: Device, Configuration, Interface, HID & Endpoint Descriptors & String Files)
+    FIXTURE_DESCRIPTORS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Fixtures", "SysfsDevice", "descriptors")
+
+    # Expected Binary Descriptor Values (Descriptor Order)
+    EXPECTED_BINARY_VALUES = [
+        (DeviceDescriptor, "bLength", "18"),
+        (DeviceDescriptor, "bcdUsb", "0200"),
+        (DeviceDescriptor, "bDeviceClass", "00"),
+        (DeviceDescriptor, "bDeviceSubClass", "00"),
+        (DeviceDescriptor, "bDeviceProtocol", "00"),
+        (DeviceDescriptor, "bMaxPacketSize0", "8"),
+        (DeviceDescriptor, "idVendor", "046d"),
+        (DeviceDescriptor, "idProduct", "c077"),
+        (DeviceDescriptor, "bcdDevice", "7200"),
+        (DeviceDescriptor, "bNumConfigurations", "1"),
+        (ConfigurationDescriptor, "bLength", "9"),
+        (ConfigurationDescriptor, "wTotalLength", "34"),
+        (ConfigurationDescriptor, "bNumInterfaces", "1"),
+        (ConfigurationDescriptor, "bConfigurationValue", "1"),
+        (ConfigurationDescriptor, "bmAttributes", "a0"),
+        (ConfigurationDescriptor, "bMaxPower", "50"),
+        (InterfaceDescriptor, "bLength", "9"),
+        (InterfaceDescriptor, "bInterfaceNumber", "0"),
+        (InterfaceDescriptor, "bAlternateSetting", "0"),
+        (InterfaceDescriptor, "bNumEndpoints", "1"),
+        (InterfaceDescriptor, "bInterfaceClass", "03"),
+        (InterfaceDescriptor, "bInterfaceSubClass", "01"),
+        (InterfaceDescriptor, "bInterfaceProtocol", "02"),
+        (HIDDescriptor, "bLength", "9"),
+        (HIDDescriptor, "bcdHID", "0111"),
+        (HIDDescriptor, "bCountryCode", "00"),
+        (HIDDescriptor, "bNumDescriptors", "1"),
+        (HIDDescriptor, "bDescriptorType", "22"),
+        (HIDDescriptor, "wDescriptorLength", "67"),
+        (EndpointDescriptor, "bLength", "7"),
+        (EndpointDescriptor, "bEndpointAddress", "81"),
+        (EndpointDescriptor, "bmAttributes", "03"),
+        (EndpointDescriptor, "wMaxPacketSize", "4"),
+        (EndpointDescriptor, "bInterval", "10")
+    ]
+
+    # Expected String Descriptor Values (String Files)
+    EXPECTED_STRING_VALUES = [
+        (DeviceDescriptor, "iManufacturer", "Logitech"),
+        (DeviceDescriptor, "iProduct", "USB Optical Mouse"),
+        (DeviceDescriptor, "iSerialNumber", "0001A2B3"),
+        (ConfigurationDescriptor, "iConfiguration", "Mouse Config"),
+        (InterfaceDescriptor, "iInterface", "HID Mouse")
+    ]
+
+    ##########################################
+    ## Sysfs Descriptor Parser Test Methods ##
+    ##########################################
+
+    ### Read Fixture raw Descriptors ###
+    def readFixture(self):
+        with open(self.FIXTURE_DESCRIPTORS_FILE, 'rb') as file:
+            return file.read()
+
+    ### Parse captured Device (Binary Descriptors & String Files) ###
+    def testParseDevice(self):
+        self.assertEqual(SysfsDescriptorParser.parseDevice(self.FIXTURE_DESCRIPTORS_FILE), self.EXPECTED_BINARY_VALUES + self.EXPECTED_STRING_VALUES)
+
+    ### Parse raw Descriptors (Interfaces of each Configuration for the Interface String Lookup) ###
+    def testParseDescriptors(self):
+        (values, interfaces) = SysfsDescriptorParser.parseDescriptors(self.readFixture())
+        self.assertEqual(values, self.EXPECTED_BINARY_VALUES)
+        self.assertEqual(interfaces, [(1, 0)])
+
+    ### Skip Descriptors not verified (String Descriptor) ###
+    def testSkipUnverifiedDescriptor(self):
+        (values, interfaces) = SysfsDescriptorParser.parseDescriptors(self.readFixture() + bytes([0x04, 0x03, 0x09, 0x04]))
+        self.assertEqual(values, self.EXPECTED_BINARY_VALUES)
+
+    ### Truncated Descriptor Header ###
+    def testTruncatedHeader(self):
+        data = self.readFixture()
+        with self.assertRaisesRegex(Exception, "Byte " + str(len(data)) + ": Truncated descriptor header"):
+            SysfsDescriptorParser.parseDescriptors(data + bytes([0x07]))
+
+    ### Descriptor Length beyond the Blob ###
+    def testTruncatedDescriptor(self):
+        with self.assertRaisesRegex(Exception, "Byte 18: Wrong descriptor length 9"):
+            SysfsDescriptorParser.parseDescriptors(self.readFixture()[:20])
+
+    ### Descriptor Length below 2 Bytes ###
+    def testWrongLength(self):
+        with self.assertRaisesRegex(Exception, "Byte 0: Wrong descriptor length 1"):
+            SysfsDescriptorParser.parseDescriptors(bytes([0x01, 0x01]))
+
+    ### Descriptor shorter than its Layout ###
+    def testShortDescriptor(self):
+        data = bytearray(self.readFixture())
+        data[0] = 8
+        with self.assertRaisesRegex(Exception, "Byte 0: Device Descriptor shorter than 18 bytes"):
+            SysfsDescriptorParser.parseDescriptors(bytes(data[:8]))
+
+if __name__ == '__main__':
+    unittest.main()
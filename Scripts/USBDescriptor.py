@@ -0,0 +1,704 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: USBDescriptor
+## Description: USB Descriptor Base Class containing fields to verify
+########################################################################
+
+from VerificationValue import VerificationValue
+from ColumnarValueStore import ColumnarValueStore
+from VerificationLevelEnum import VerificationLevelEnum
+from VerificationOperatorEnum import VerificationOperatorEnum
+
+class USBDescriptor:
+
+    ##############################
+    ## USB Descriptor Constants ##
+    ##############################
+
+    # Descriptor Type
+    DESCRIPTOR_TYPE = ""
+
+    # Descriptor Name
+    DESCRIPTOR_NAME = ""
+
+    # Descriptor Fields (ordered as in the USB Descriptor)
+    DESCRIPTOR_FIELDS = ()
+
+    # Descriptor Field Registry {Field Match Name: Descriptor Field}
+    FIELD_REGISTRY = {}
+
+    # Binary Descriptor (bDescriptorType Code, little-endian struct Layout & Field Name of each Layout Item, None: not verified)
+    BINARY_DESCRIPTOR_TYPE = None
+    BINARY_LAYOUT = None
+    BINARY_FIELDS = ()
+
+    # Snapshot Variables (Dicts copied on Snapshot, Field Entries shared until changed)
+    SNAPSHOT_VARIABLES = (
+        "verificationValues", "lastMandatoryValueIndex", "valuePositions",
+        "memoryRows", "operatorValueCount", "valuePartHistogram",
+        "valueKeys", "duplicateValueCount", "duplicateMemoryRows", "duplicateValuePartHistogram"
+    )
+
+    ##############################
+    ## USB Descriptor Variables ##
+    ##############################
+
+    # Columnar Value Store Enable (array-backed Field Values instead of Lists)
+    columnarStore = False
+
+    # Duplicate Values Rejection Enable (Duplicate Values only counted when disabled)
+    rejectDuplicates = True
+
+    # Field Verification Values {Field Name: [Verification Value]}
+    verificationValues = None
+
+    # Field Last Mandatory Value Index {Field Name: Index}
+    lastMandatoryValueIndex = None
+
+    # Field Value Positions Index {Field Name: {Value: {Operator: [Index]}}} (None when rebuild is required)
+    valuePositions = None
+
+    # Field Value Keys {Field Name: {(Operator, Verification Level, Normalized Value): Count}} (None when rebuild is required)
+    valueKeys = None
+
+    # Field Duplicate Values (Rejected, or counted when Duplicate Values Rejection is disabled) {Field Name: Count}
+    duplicateValueCount = None
+
+    # Field Duplicate Memory Rows {Field Name: Memory Rows}
+    duplicateMemoryRows = None
+
+    # Field Duplicate Operator & Value Part Number Histogram {Field Name: {(Operator, Value Part Number): Count}}
+    duplicateValuePartHistogram = None
+
+    # Fields shared with a Snapshot (copied before next change) {Field Name}
+    sharedFields = None
+
+    # Field Memory Rows per Operator {Field Name: {Operator: Memory Rows}}
+    memoryRows = None
+
+    # Verification Values per Operator {Operator: Value Count}
+    operatorValueCount = None
+
+    # Field Operator & Value Part Number Histogram {Field Name: {(Operator, Value Part Number): Count}}
+    valuePartHistogram = None
+
+    ###################################
+    ## Public USB Descriptor Methods ##
+    ###################################
+
+    ### Constructor (Empty Descriptor, state owned by the instance) ###
+    def __init__(self, columnarStore=False, rejectDuplicates=True):
+        self.columnarStore = columnarStore
+        self.rejectDuplicates = rejectDuplicates
+        self.verificationValues = {field.name: self.newFieldStore(field) for field in self.DESCRIPTOR_FIELDS}
+        self.lastMandatoryValueIndex = {field.name: 0 for field in self.DESCRIPTOR_FIELDS}
+        self.valuePositions = {field.name: {} for field in self.DESCRIPTOR_FIELDS}
+
+        # Aggregates (updated on each Add & Delete)
+        self.memoryRows = {field.name: {op: 0 for op in VerificationOperatorEnum} for field in self.DESCRIPTOR_FIELDS}
+        self.operatorValueCount = {op: 0 for op in VerificationOperatorEnum}
+        self.valuePartHistogram = {field.name: {} for field in self.DESCRIPTOR_FIELDS}
+
+        # Duplicate Detection
+        self.valueKeys = {field.name: {} for field in self.DESCRIPTOR_FIELDS}
+        self.duplicateValueCount = {field.name: 0 for field in self.DESCRIPTOR_FIELDS}
+        self.duplicateMemoryRows = {field.name: 0 for field in self.DESCRIPTOR_FIELDS}
+        self.duplicateValuePartHistogram = {field.name: {} for field in self.DESCRIPTOR_FIELDS}
+
+        # Copy-on-Write Snapshots
+        self.sharedFields = set()
+
+    ### Create Empty Field Value Store (List or Columnar Store) ###
+    def newFieldStore(self, field):
+        if (self.columnarStore):
+            return ColumnarValueStore(field.valueFormat)
+        else:
+            return []
+
+    ### is Descriptor Requested ###
+    def isRequestedDescriptor(self, userDescriptor):
+        return userDescriptor.casefold() == self.DESCRIPTOR_TYPE.casefold()
+
+    ### Get Descriptor Field from Field Name ###
+    def getField(self, fieldName):
+        field = self.FIELD_REGISTRY.get(fieldName.casefold())
+
+        # Unknown Field
+        if (field == None):
+            raise Exception("Unkown " + self.DESCRIPTOR_NAME + " Field: " + fieldName)
+
+        return field
+
+    ### Add Verification Value ###
+    ### Return: True if added, False if rejected as Duplicate Value
+    def addVerificationValue(self, fieldName, value, verificationLevel, operator):
+
+        # Descriptor Field
+        field = self.getField(fieldName)
+
+        # New Value to Add
+        newValue = VerificationValue(value, field.length, field.valueFormat, verificationLevel, operator)
+
+        # Copy Field shared with a Snapshot
+        self.__copySharedField(field)
+
+        # Duplicate Value
+        if (self.__addValueKey(field, newValue) == False) and (self.rejectDuplicates == True):
+            return False
+
+        # Handle Verification Level Priority (Mandatory First)
+        fieldValues = self.verificationValues[field.name]
+        if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
+            # Add New Mandatory Value
+            newValueIndex = self.lastMandatoryValueIndex[field.name]
+            fieldValues.insert(newValueIndex, newValue)
+            self.lastMandatoryValueIndex[field.name] += 1
+
+            # Optional Values are shifted: Value Positions Index to rebuild
+            if (newValueIndex != len(fieldValues) - 1):
+                self.valuePositions[field.name] = None
+
+        # Optional New Value (add the end of the list)
+        else:
+            newValueIndex = len(fieldValues)
+            fieldValues.append(newValue)
+
+        # Update Value Positions Index
+        if (self.valuePositions[field.name] != None):
+            self.valuePositions[field.name].setdefault(newValue.value, {}).setdefault(newValue.operator, []).append(newValueIndex)
+
+        # Update Aggregates
+        self.__addAggregates(field, newValue)
+
+        return True
+
+    ### Add Verification Values (Bulk) ###
+    ### Values: Iterable of (Value, Verification Level, Operator)
+    ### Verified Values: Values already checked by the Command Parser (Level & Operator Enums, Level None for Mandatory)
+    ### Return: (List of (Value Position, Error) for skipped Values (only when skipInvalidValues is set), Rejected Duplicate Value Count)
+    def addVerificationValues(self, fieldName, values, skipInvalidValues=False, verifiedValues=False):
+
+        # Descriptor Field
+        field = self.getField(fieldName)
+
+        # Validate all New Values
+        newValues = []
+        errors = []
+        for position, (value, verificationLevel, operator) in enumerate(values):
+
+            # Already checked Value
+            if (verifiedValues == True):
+                if (verificationLevel == None):
+                    verificationLevel = VerificationLevelEnum.MANDATORY
+                newValues.append(VerificationValue.fromVerifiedValue(value, field.valueFormat, verificationLevel, operator))
+                continue
+
+            try:
+                newValues.append(VerificationValue(value, field.length, field.valueFormat, verificationLevel, operator))
+            except Exception as e:
+                errors.append((position, str(e)))
+
+        # Invalid Values: nothing added
+        if (len(errors) > 0) and (skipInvalidValues == False):
+            raise Exception("\n".join("Value " + str(position+1) + ": " + error for (position, error) in errors))
+
+        # Copy Field shared with a Snapshot
+        self.__copySharedField(field)
+
+        # Mandatory & Optional Buckets
+        mandatoryValues = []
+        optionalValues = []
+        duplicateValueCount = 0
+        for newValue in newValues:
+
+            # Duplicate Value (also within the Values to Add)
+            if (self.__addValueKey(field, newValue) == False) and (self.rejectDuplicates == True):
+                duplicateValueCount += 1
+                continue
+
+            if (VerificationLevelEnum.MANDATORY == newValue.verificationLevel):
+                mandatoryValues.append(newValue)
+            else:
+                optionalValues.append(newValue)
+
+        # Single Merge (Mandatory Values after previous Mandatory Values, Optional Values at the end)
+        fieldValues = self.verificationValues[field.name]
+        fieldValueCount = len(fieldValues)
+        lastMandatoryValueIndex = self.lastMandatoryValueIndex[field.name]
+        fieldValues[lastMandatoryValueIndex:lastMandatoryValueIndex] = mandatoryValues
+        fieldValues.extend(optionalValues)
+        self.lastMandatoryValueIndex[field.name] += len(mandatoryValues)
+
+        # Optional Values shifted: Value Positions Index to rebuild
+        if (len(mandatoryValues) > 0) and (lastMandatoryValueIndex != fieldValueCount):
+            self.valuePositions[field.name] = None
+
+        # Update Value Positions Index (Values added at the end of the list)
+        elif (self.valuePositions[field.name] != None):
+            for index, newValue in enumerate(mandatoryValues + optionalValues, fieldValueCount):
+                self.valuePositions[field.name].setdefault(newValue.value, {}).setdefault(newValue.operator, []).append(index)
+
+        # Update Aggregates
+        for newValue in mandatoryValues + optionalValues:
+            self.__addAggregates(field, newValue)
+
+        return (errors, duplicateValueCount)
+
+    ### Delete Verification Value ###
+    ### Return: Number of deleted Values
+    def deleteVerificationValue(self, fieldName, value, operator):
+        return self.deleteVerificationValues(fieldName, [(value, operator)])
+
+    ### Delete Verification Values (Bulk) ###
+    ### Values: Iterable of (Value, Operator) (Operator None: any Operator)
+    ### Return: Number of deleted Values
+    def deleteVerificationValues(self, fieldName, values):
+
+        # Descriptor Field
+        field = self.getField(fieldName)
+
+        # Value Positions Index
+        valuePositions = self.__getValuePositions(field)
+
+        # Lookup Positions to Delete
+        deletePositions = set()
+        for (value, operator) in values:
+            operatorPositions = valuePositions.get(value)
+
+            # Unknown Value
+            if (operatorPositions == None):
+                continue
+
+            # Any Operator
+            if (operator == None):
+                for positions in operatorPositions.values():
+                    deletePositions.update(positions)
+
+            # Specific Operator
+            else:
+                operator = VerificationOperatorEnum.getVerificationOperatorEnum(operator)
+                deletePositions.update(operatorPositions.get(operator, ()))
+
+        return self.__deletePositions(field, deletePositions)
+
+    ### Delete Verification Values matching Predicate (Bulk) ###
+    ### Predicate: Function(Verification Value) -> True to delete
+    ### Return: Number of deleted Values
+    def deleteVerificationValuesIf(self, fieldName, predicate):
+
+        # Descriptor Field
+        field = self.getField(fieldName)
+
+        # Lookup Positions to Delete
+        deletePositions = set()
+        for index, el in enumerate(self.verificationValues[field.name]):
+            if (predicate(el)):
+                deletePositions.add(index)
+
+        return self.__deletePositions(field, deletePositions)
+
+    ### Display Descriptor Field Values ###
+    def displayVerificationValues(self, fieldName):
+
+        # Descriptor Field
+        field = self.getField(fieldName)
+
+        print(field.name + ":\n")
+        for el in self.verificationValues[field.name]: el.showDetails()
+
+    ### Print All Descriptor Field Values ###
+    def displayAllVerificationValues(self):
+        print("---", self.DESCRIPTOR_NAME, "---")
+
+        for field in self.DESCRIPTOR_FIELDS:
+            self.displayVerificationValues(field.name)
+
+    ### Get Verification Values ###
+    ### Return: [ [USB Field, Operator, Value, Verification Level] ]
+    def getVerificationValues(self):
+        valueList = []
+
+        for field in self.DESCRIPTOR_FIELDS:
+            for el in self.verificationValues[field.name]:
+                valueList.append([field.name, el.operator.name.capitalize(), el.value, el.verificationLevel.name])
+
+        return valueList
+
+    ### Count Descriptor Field by Name & Operator ###
+    ### Return: [USB Field, Counter of Operator Value]
+    def countPerOperator(self, operator):
+        result = []
+
+        for field in self.DESCRIPTOR_FIELDS:
+            result.append([field.name, self.memoryRows[field.name][operator]])
+
+        # End of Process
+        return result
+
+    ### Check if Operator is used by the Descriptor (at least once) ###
+    ### Return: True/False
+    def isOperatorInUse(self, operator):
+        return self.operatorValueCount[operator] > 0
+
+    ### Get Converted Verification Values per Operator ###
+    def getConvertedVerificationValues(self, operator):
+        result = []
+
+        for field in self.DESCRIPTOR_FIELDS:
+            memoryValueConfig = []
+            for el in self.verificationValues[field.name]:
+                if (operator == el.operator):
+                    # Convert Memory Configurations
+                    for e in el.convertToMemConfig():
+                        memoryValueConfig.append(e)
+
+            # Order & Add Memory Values
+            for el in VerificationValue.generateMemoryValues(memoryValueConfig):
+                result.append(el)
+
+        # End of Process
+        return result
+
+    ### Get Largest Verification Number per Value Part ###
+    ### Return Largest Verification Number
+    def getLargestVerificationNumber(self, currentLargestVerificationNumber=1):
+        largestPartVerif = currentLargestVerificationNumber
+
+        for field in self.DESCRIPTOR_FIELDS:
+            histogram = self.valuePartHistogram[field.name]
+
+            # Largest Verification Number of the Field (most common Operator & Value Part Number)
+            if (len(histogram) > 0):
+                largestPartVerif = max(largestPartVerif, max(histogram.values()))
+
+        return largestPartVerif
+
+    ### Get Duplicate Values Summary ###
+    ### Return: (Duplicate Value Count, Duplicate Memory Rows)
+    def getDuplicateSummary(self):
+        return (sum(self.duplicateValueCount.values()), sum(self.duplicateMemoryRows.values()))
+
+    ### Get Largest Verification Number per Value Part with Duplicate Values ###
+    ### Return Largest Verification Number (as if all Duplicate Values were kept)
+    def getLargestVerificationNumberWithDuplicates(self, currentLargestVerificationNumber=1):
+
+        # Duplicate Values already kept in Field Values
+        if (self.rejectDuplicates == False):
+            return self.getLargestVerificationNumber(currentLargestVerificationNumber)
+
+        largestPartVerif = currentLargestVerificationNumber
+
+        for field in self.DESCRIPTOR_FIELDS:
+            histogram = self.valuePartHistogram[field.name]
+            duplicateHistogram = self.duplicateValuePartHistogram[field.name]
+
+            # Largest Verification Number of the Field (Kept & Rejected Values)
+            for key in duplicateHistogram:
+                largestPartVerif = max(largestPartVerif, histogram.get(key, 0) + duplicateHistogram[key])
+
+        return self.getLargestVerificationNumber(largestPartVerif)
+
+    ### Get Largest Verification Number per Value Part without Duplicate Values ###
+    ### Return Largest Verification Number (as if all Duplicate Values were rejected)
+    def getLargestVerificationNumberWithoutDuplicates(self, currentLargestVerificationNumber=1):
+
+        # Duplicate Values already rejected
+        if (self.rejectDuplicates == True):
+            return self.getLargestVerificationNumber(currentLargestVerificationNumber)
+
+        largestPartVerif = currentLargestVerificationNumber
+
+        for field in self.DESCRIPTOR_FIELDS:
+            histogram = self.valuePartHistogram[field.name]
+            duplicateHistogram = self.duplicateValuePartHistogram[field.name]
+
+            # Largest Verification Number of the Field (Kept Values minus Duplicate Values)
+            for key in histogram:
+                largestPartVerif = max(largestPartVerif, histogram[key] - duplicateHistogram.get(key, 0))
+
+        return largestPartVerif
+
+    ### Create Snapshot (Copy-on-Write, Fields are copied on their next change) ###
+    ### Return: Dict {Variable Name: {Field Name or Operator: Value}}
+    def createSnapshot(self):
+        snapshot = {name: dict(getattr(self, name)) for name in self.SNAPSHOT_VARIABLES}
+        self.sharedFields = set(self.verificationValues)
+        return snapshot
+
+    ### Restore Snapshot (Copy-on-Write, Fields are copied on their next change) ###
+    def restoreSnapshot(self, snapshot):
+        for name in self.SNAPSHOT_VARIABLES:
+            setattr(self, name, dict(snapshot[name]))
+        self.sharedFields = set(self.verificationValues)
+
+    ### Pack Snapshot (JSON Snapshot to store: Field Values as Columns, Operators as Codes, Indexes rebuilt on use) ###
+    ### Return: Dict {Variable Name: {Field Name: Value} or [Value per Operator Code]}
+    def packSnapshot(self, snapshot):
+        packedSnapshot = {name: dict(snapshot[name]) for name in ("lastMandatoryValueIndex", "duplicateValueCount", "duplicateMemoryRows")}
+        packedSnapshot["verificationValues"] = {fieldName: USBDescriptor.__packFieldValues(values) for (fieldName, values) in snapshot["verificationValues"].items()}
+        packedSnapshot["memoryRows"] = {fieldName: [rows[op] for op in ColumnarValueStore.OPERATORS] for (fieldName, rows) in snapshot["memoryRows"].items()}
+        packedSnapshot["operatorValueCount"] = [snapshot["operatorValueCount"][op] for op in ColumnarValueStore.OPERATORS]
+        packedSnapshot["valuePartHistogram"] = {fieldName: USBDescriptor.__packHistogram(histogram) for (fieldName, histogram) in snapshot["valuePartHistogram"].items()}
+        packedSnapshot["duplicateValuePartHistogram"] = {fieldName: USBDescriptor.__packHistogram(histogram) for (fieldName, histogram) in snapshot["duplicateValuePartHistogram"].items()}
+        return packedSnapshot
+
+    ### Unpack Snapshot (stored with packSnapshot, malformed Snapshot raises an Exception) ###
+    ### Return: Dict {Variable Name: {Field Name or Operator: Value}}
+    def unpackSnapshot(self, packedSnapshot):
+        snapshot = {}
+        for name in ("lastMandatoryValueIndex", "duplicateValueCount", "duplicateMemoryRows"):
+            snapshot[name] = {field.name: int(packedSnapshot[name][field.name]) for field in self.DESCRIPTOR_FIELDS}
+        snapshot["verificationValues"] = {field.name: self.__unpackFieldValues(field, packedSnapshot["verificationValues"][field.name]) for field in self.DESCRIPTOR_FIELDS}
+        snapshot["memoryRows"] = {field.name: USBDescriptor.__unpackOperatorCounts(packedSnapshot["memoryRows"][field.name]) for field in self.DESCRIPTOR_FIELDS}
+        snapshot["operatorValueCount"] = USBDescriptor.__unpackOperatorCounts(packedSnapshot["operatorValueCount"])
+        snapshot["valuePartHistogram"] = {field.name: USBDescriptor.__unpackHistogram(packedSnapshot["valuePartHistogram"][field.name]) for field in self.DESCRIPTOR_FIELDS}
+        snapshot["duplicateValuePartHistogram"] = {field.name: USBDescriptor.__unpackHistogram(packedSnapshot["duplicateValuePartHistogram"][field.name]) for field in self.DESCRIPTOR_FIELDS}
+        snapshot["valuePositions"] = dict.fromkeys(snapshot["verificationValues"])
+        snapshot["valueKeys"] = dict.fromkeys(snapshot["verificationValues"])
+        return snapshot
+
+    ### Compare Verification Values with Snapshot (only changed Fields are scanned) ###
+    ### Return: [ [USB Field, Change (+/-), Operator, Value, Verification Level] ]
+    def diffSnapshot(self, snapshot):
+        result = []
+
+        for field in self.DESCRIPTOR_FIELDS:
+            currentValues = self.verificationValues[field.name]
+            snapshotValues = snapshot["verificationValues"][field.name]
+
+            # Unchanged Field (shared with the Snapshot)
+            if (currentValues is snapshotValues):
+                continue
+
+            # Count Snapshot Values, then match Current Values
+            snapshotCount = {}
+            for el in snapshotValues:
+                key = (el.operator, el.value, el.verificationLevel)
+                snapshotCount[key] = snapshotCount.get(key, 0) + 1
+
+            for el in currentValues:
+                key = (el.operator, el.value, el.verificationLevel)
+                if (snapshotCount.get(key, 0) > 0):
+                    snapshotCount[key] -= 1
+                else:
+                    result.append([field.name, "+", el.operator.name.capitalize(), el.value, el.verificationLevel.name])
+
+            # Remaining Snapshot Values are removed
+            for (operator, value, verificationLevel) in snapshotCount:
+                for i in range(snapshotCount[(operator, value, verificationLevel)]):
+                    result.append([field.name, "-", operator.name.capitalize(), value, verificationLevel.name])
+
+        return result
+
+    ### Check if the Descriptor is InUse (at least on Value) ###
+    ### Return True/False
+    def isDescriptorInUse(self):
+        return sum(self.operatorValueCount.values()) > 0
+
+    #########################################
+    ## Public Class USB Descriptor Methods ##
+    #########################################
+
+    ### Get Source File Index & Count Pattern for specific Descriptor field ###
+    ### Return (Index Pattern, Count Pattern)
+    @classmethod
+    def getSourceIndexCountPattern(cls, fieldName):
+        field = cls.FIELD_REGISTRY.get(fieldName.casefold())
+
+        # Unknown Field
+        if (field == None):
+            raise Exception("Unkown " + cls.DESCRIPTOR_NAME + " Field: " + fieldName)
+
+        return (field.sourceIndexPattern, field.sourceCountPattern)
+
+    ####################################
+    ## Private USB Descriptor Methods ##
+    ####################################
+
+    ### Copy Field shared with a Snapshot (before its first change) ###
+    def __copySharedField(self, field):
+        if (field.name not in self.sharedFields):
+            return
+
+        self.verificationValues[field.name] = self.verificationValues[field.name].copy()
+        self.valuePositions[field.name] = None
+        self.memoryRows[field.name] = dict(self.memoryRows[field.name])
+        self.valuePartHistogram[field.name] = dict(self.valuePartHistogram[field.name])
+        if (self.valueKeys[field.name] != None):
+            self.valueKeys[field.name] = dict(self.valueKeys[field.name])
+        self.duplicateValuePartHistogram[field.name] = dict(self.duplicateValuePartHistogram[field.name])
+        self.sharedFields.discard(field.name)
+
+    ### Pack Field Values (Values, Operator Codes & Mandatory Flags Columns) ###
+    def __packFieldValues(fieldValues):
+        return [
+            [el.value for el in fieldValues],
+            [ColumnarValueStore.OPERATOR_CODES[el.operator] for el in fieldValues],
+            [int(VerificationLevelEnum.MANDATORY == el.verificationLevel) for el in fieldValues]
+        ]
+
+    ### Unpack Field Values (packed with __packFieldValues, Values checked against the Field Format) ###
+    def __unpackFieldValues(self, field, packedValues):
+        (values, operatorCodes, mandatoryFlags) = packedValues
+        if (len(values) != len(operatorCodes)) or (len(values) != len(mandatoryFlags)):
+            raise Exception("Wrong " + self.DESCRIPTOR_NAME + " " + field.name + " packed Values !")
+
+        fieldValues = self.newFieldStore(field)
+        for (value, operatorCode, mandatory) in zip(values, operatorCodes, mandatoryFlags):
+            operator = ColumnarValueStore.OPERATORS[operatorCode]
+            VerificationValue.checkValue(value, field.length, field.valueFormat, operator)
+            fieldValues.append(VerificationValue.fromVerifiedValue(value, field.valueFormat, VerificationLevelEnum.MANDATORY if mandatory else VerificationLevelEnum.OPTIONAL, operator))
+        return fieldValues
+
+    ### Pack Value Part Histogram ###
+    ### Return: [[Operator Code, Value Part Number, Count]]
+    def __packHistogram(histogram):
+        return [[ColumnarValueStore.OPERATOR_CODES[operator], part, count] for ((operator, part), count) in histogram.items()]
+
+    ### Unpack Value Part Histogram (packed with __packHistogram) ###
+    ### Return: Dict {(Operator, Value Part Number): Count}
+    def __unpackHistogram(packedHistogram):
+        return {(ColumnarValueStore.OPERATORS[operatorCode], int(part)): int(count) for (operatorCode, part, count) in packedHistogram}
+
+    ### Unpack Operator Counts (Count per Operator Code) ###
+    ### Return: Dict {Operator: Count}
+    def __unpackOperatorCounts(packedCounts):
+        if (len(packedCounts) != len(ColumnarValueStore.OPERATORS)):
+            raise Exception("Wrong packed Operator Counts !")
+        return {operator: int(count) for (operator, count) in zip(ColumnarValueStore.OPERATORS, packedCounts)}
+
+    ### Get Field Value Positions Index (rebuild if required) ###
+    ### Return: Dict {Value: {Operator: [Index]}}
+    def __getValuePositions(self, field):
+
+        # Rebuild Value Positions Index
+        if (self.valuePositions[field.name] == None):
+            valuePositions = {}
+            for index, el in enumerate(self.verificationValues[field.name]):
+                valuePositions.setdefault(el.value, {}).setdefault(el.operator, []).append(index)
+            self.valuePositions[field.name] = valuePositions
+
+        return self.valuePositions[field.name]
+
+    ### Delete Field Values at Positions (Single Pass) ###
+    ### Return: Number of deleted Values
+    def __deletePositions(self, field, deletePositions):
+
+        # Nothing to Delete
+        if (len(deletePositions) == 0):
+            return 0
+
+        # Copy Field shared with a Snapshot
+        self.__copySharedField(field)
+
+        # Split Kept & Removed Values
+        fieldValues = self.verificationValues[field.name]
+        keptValues = []
+        for index, el in enumerate(fieldValues):
+            if (index in deletePositions):
+                # Update Aggregates
+                self.__removeAggregates(field, el)
+                self.__removeValueKey(field, el)
+            else:
+                keptValues.append(el)
+
+        # Replace Field Values
+        self.verificationValues[field.name] = self.newFieldStore(field)
+        self.verificationValues[field.name].extend(keptValues)
+
+        # Update Mandatory / Optional Boundary
+        self.lastMandatoryValueIndex[field.name] -= sum(1 for index in deletePositions if index < self.lastMandatoryValueIndex[field.name])
+
+        # Value Positions Index to rebuild
+        self.valuePositions[field.name] = None
+
+        return len(deletePositions)
+
+    ### Get Field Value Keys (rebuild if required) ###
+    ### Return: Dict {(Operator, Verification Level, Normalized Value): Count}
+    def __getValueKeys(self, field):
+
+        # Rebuild Value Keys (Count of kept Values per Key)
+        if (self.valueKeys[field.name] == None):
+            valueKeys = {}
+            for el in self.verificationValues[field.name]:
+                key = (el.operator, el.verificationLevel, el.getNormalizedValue())
+                valueKeys[key] = valueKeys.get(key, 0) + 1
+            self.valueKeys[field.name] = valueKeys
+
+        return self.valueKeys[field.name]
+
+    ### Add Verification Value Key (Duplicate Detection) ###
+    ### Return: True if new Value Key, False if Duplicate Value
+    def __addValueKey(self, field, verificationValue):
+        key = (verificationValue.operator, verificationValue.verificationLevel, verificationValue.getNormalizedValue())
+        valueKeys = self.__getValueKeys(field)
+
+        # New Value Key
+        if (key not in valueKeys):
+            valueKeys[key] = 1
+            return True
+
+        # Duplicate Value (kept only when Duplicate Values Rejection is disabled)
+        if (self.rejectDuplicates == False):
+            valueKeys[key] += 1
+
+        # Update Duplicate Summary
+        self.duplicateValueCount[field.name] += 1
+        self.duplicateMemoryRows[field.name] += verificationValue.getMemoryUsage()
+        duplicateHistogram = self.duplicateValuePartHistogram[field.name]
+        for partNumber in verificationValue.getValuePartNumbers():
+            duplicateKey = (verificationValue.operator, partNumber)
+            duplicateHistogram[duplicateKey] = duplicateHistogram.get(duplicateKey, 0) + 1
+
+        return False
+
+    ### Remove Verification Value Key (Duplicate Detection) ###
+    def __removeValueKey(self, field, verificationValue):
+        key = (verificationValue.operator, verificationValue.verificationLevel, verificationValue.getNormalizedValue())
+        valueKeys = self.__getValueKeys(field)
+
+        # Last Value with this Key
+        valueKeys[key] -= 1
+        if (valueKeys[key] == 0):
+            del valueKeys[key]
+            return
+
+        # Kept Duplicate Value removed: Update Duplicate Summary
+        self.duplicateValueCount[field.name] -= 1
+        self.duplicateMemoryRows[field.name] -= verificationValue.getMemoryUsage()
+        duplicateHistogram = self.duplicateValuePartHistogram[field.name]
+        for partNumber in verificationValue.getValuePartNumbers():
+            duplicateKey = (verificationValue.operator, partNumber)
+            duplicateHistogram[duplicateKey] -= 1
+            if (duplicateHistogram[duplicateKey] == 0):
+                del duplicateHistogram[duplicateKey]
+
+    ### Add Verification Value to Aggregates ###
+    def __addAggregates(self, field, verificationValue):
+
+        # Memory Rows & Operator Usage
+        self.memoryRows[field.name][verificationValue.operator] += verificationValue.getMemoryUsage()
+        self.operatorValueCount[verificationValue.operator] += 1
+
+        # Operator & Value Part Number Histogram
+        histogram = self.valuePartHistogram[field.name]
+        for partNumber in verificationValue.getValuePartNumbers():
+            key = (verificationValue.operator, partNumber)
+            histogram[key] = histogram.get(key, 0) + 1
+
+    ### Remove Verification Value from Aggregates ###
+    def __removeAggregates(self, field, verificationValue):
+
+        # Memory Rows & Operator Usage
+        self.memoryRows[field.name][verificationValue.operator] -= verificationValue.getMemoryUsage()
+        self.operatorValueCount[verificationValue.operator] -= 1
+
+        # Operator & Value Part Number Histogram
+        histogram = self.valuePartHistogram[field.name]
+        for partNumber in verificationValue.getValuePartNumbers():
+            key = (verificationValue.operator, partNumber)
+            histogram[key] -= 1
+            if (histogram[key] == 0):
+                del histogram[key]
@@ -3,29 +3,34 @@
 ## Create Date: 25/07/2025
 ## Module Name: USBVerificationConfigurer
 ## Description: USB Verification Configurer Main program
+##              python USBVerificationConfigurer.py [--columnar] (--columnar: Columnar Value Store backend, lower Memory on large Policies)
 ########################################################################
 
 import os
+import sys
 import csv
 import time
 import math
 
-# USB Descriptors
-from DeviceDescriptor import DeviceDescriptor
-from ConfigurationDescriptor import ConfigurationDescriptor
-from InterfaceDescriptor import InterfaceDescriptor
-from HIDDescriptor import HIDDescriptor
-from EndpointDescriptor import EndpointDescriptor
-from DeviceQualifierDescriptor import DeviceQualifierDescriptor
-from OtherSpeedDescriptor import OtherSpeedDescriptor
+# USB Verification Session (USB Descriptors)
+from VerificationSession import VerificationSession
 
 # USB Descriptor Enable Status
 from DescriptorEnableStatusEnum import DescriptorEnableStatusEnum
 
+# Command Parser & Importer
+from CommandParser import CommandParser
+from VerificationImporter import VerificationImporter
+from PolicyCache import PolicyCache
+
+# Policy Compiler (Compile Passes of the Export Pipeline)
+from PolicyCompiler import PolicyCompiler
+
 # Verification Order, Operator & Value
 from VerificationOrderEnum import VerificationOrderEnum
 from VerificationOperatorEnum import VerificationOperatorEnum
 from VerificationValue import VerificationValue
+from StringInterningPool import StringInterningPool
 
 # Source File Manager
 from SourceFileManager import SourceFileManager
@@ -35,17 +40,26 @@ from SourceFileManager import SourceFileManager
 ###########################################
 
 hints = "Hints:\n"\
-        "add verification value(s) with specific operator\t\"add usb_descriptor usb_field operator value [and/or operator value] ... \"\n"\
+        "add verification value(s) with specific operator\t\"add usb_descriptor usb_field operator value [and/or] [operator value [and/or]] ... \"\n"\
+        "add verification value range (number & hex fields)\t\"add usb_descriptor usb_field between low..high [and/or]\"\n"\
         "remove verification value(s) mathing value\t\t\"remove usb_descriptor usb_field value [operator]\"\n"\
-        "import verification values from file\t\t\t\"import path_to_file\"\n"\
+        "import verification values from file(s) or export\t\"import path_to_file_or_glob ... [continue/failfast] [cache]\" (.csv: exported USBVerificationValues.csv, .json: JSON policy, descriptors: sysfs device, lsusb -v dump, cache: reuse the whole policy of unchanged files, parsed command & include files are always reused)\n"\
+        "include file(s) in an import file (relative paths)\t\"include path_to_file_or_glob ...\"\n"\
+        "import fleet inventory (vid,pid,manufacturer,product,serial)\t\"import-inventory path_to_csv_or_glob ... [continue/failfast]\"\n"\
         "export verification values\t\t\t\t\"export [directory_path]\"\n"\
         "show all verification values\t\t\t\t\"summary\"\n"\
         "show Descriptor verification values\t\t\t\"summary [device/configuration/interface/hid/endpoint/deviceQualifier/otherSpeed]\"\n"\
         "show specific Descriptor field verification values\t\"summary usb_descriptor usb_field\"\t\t\n"\
+        "save verification values snapshot\t\t\t\"snapshot [snapshot_name]\"\n"\
+        "restore verification values snapshot\t\t\t\"rollback [snapshot_name]\"\n"\
+        "compare verification values with snapshot\t\t\"diff [snapshot_name]\"\n"\
         "quit programm\t\t\t\t\t\t\"quit\"\n\n"
 
-# Import File - Character Comment
-IMPORT_COMMENT = "#"
+# Columnar Value Store Program Option (Verification Values stored in packed Columns instead of Objects)
+COLUMNAR_STORE_OPTION = "--columnar"
+
+# Default Snapshot Name
+DEFAULT_SNAPSHOT_NAME = "default"
 
 # Original VHDL Source Directory
 VHDL_SOURCE_DIR = os.path.abspath(os.path.join(os.getcwd(), os.pardir)) + "/USB-Verifier/Sources/"
@@ -53,6 +67,9 @@ VHDL_SOURCE_DIR = os.path.abspath(os.path.join(os.getcwd(), os.pardir)) + "/USB-
 # Default Export Directory
 DEFAULT_EXPORT_DIR = os.getcwd() + '/Export/'
 
+# Policy Cache Directory (user-private: Parsed Command Files keyed by Content Hash, imported Policies of "import ... cache")
+POLICY_CACHE_DIR = PolicyCache.getDefaultDirectory()
+
 # Exported USB Descriptor Verifications File
 DESCRIPTOR_VALUES_FILENAME = "USBVerificationValues"
 DESCRIPTOR_VALUES_FILE_EXTENSION = ".csv"
@@ -84,38 +101,18 @@ USB_SUMMARY_HEADER_OPERATOR_STATUS = "Status"
 USB_SUMMARY_OPERATOR_INUSE_TITLE = "Operators in Use"
 USB_SUMMARY_OPERATOR_AVAILABLE_TITLE = "Operators Available"
 USB_SUMMARY_WATCHDOG_LIMIT_TITLE = "Watchdog Limit (in clock cycles)"
+USB_SUMMARY_DUPLICATE_VALUES_TITLE = "Duplicate Values"
+USB_SUMMARY_DUPLICATE_MEM_ROWS_TITLE = "Duplicate Memory Rows"
+USB_SUMMARY_DUPLICATE_WATCHDOG_TITLE = "Duplicate Watchdog Cycles (in clock cycles)"
+USB_SUMMARY_HEADER_COMPILE_PASS = "Compile Passes"
+USB_SUMMARY_HEADER_COMPILE_REMOVED_VALUES = "Removed Values"
+USB_SUMMARY_HEADER_COMPILE_MEM_ROWS = "Memory Rows saved"
+USB_SUMMARY_HEADER_COMPILE_WATCHDOG = "Watchdog Cycles saved (in clock cycles)"
+USB_SUMMARY_HEADER_UNSATISFIABLE = "Unsatisfiable Fields (never succeed)"
 
 # Exported VHDL Sources
 VHDL_EXPORT_DIR = "HDL_Sources/"
 
-###########################################
-## USB Verification Configurer Variables ##
-###########################################
-
-# Device Descriptor
-deviceDescriptor = DeviceDescriptor()
-
-# Configuration Descriptor
-configurationDescriptor = ConfigurationDescriptor()
-
-# Interface Descriptor
-interfaceDescriptor = InterfaceDescriptor()
-
-# HID Descriptor
-hidDescriptor = HIDDescriptor()
-
-# Endpoint Descriptor
-endpointDescriptor = EndpointDescriptor()
-
-# Device Qualifier Descriptor
-deviceQualifierDescriptor = DeviceQualifierDescriptor()
-
-# Other Speed Descriptor
-otherSpeedDescriptor = OtherSpeedDescriptor()
-
-# Exported Values Status
-requiredExportValue = False
-
 #########################################
 ## USB Verification Configurer Methods ##
 #########################################
@@ -125,126 +122,49 @@ def clearConsole():
     clear = lambda: os.system('clear')
     clear()
 
-### Get Descriptor from Descriptor Name ###
-def getDescriptor(userInputValue):
-
-    # Device Descriptor
-    if (deviceDescriptor.isRequestedDescriptor(userInputValue)):
-        return deviceDescriptor
-
-    # Configuration Descriptor
-    if (configurationDescriptor.isRequestedDescriptor(userInputValue)):
-        return configurationDescriptor
-
-    # Interface Descriptor
-    if (interfaceDescriptor.isRequestedDescriptor(userInputValue)):
-        return interfaceDescriptor
-    
-    # HID Descriptor
-    if (hidDescriptor.isRequestedDescriptor(userInputValue)):
-        return hidDescriptor
-
-    # Endpoint Descriptor
-    if (endpointDescriptor.isRequestedDescriptor(userInputValue)):
-        return endpointDescriptor
-
-    # Device Qualifier Descriptor
-    if (deviceQualifierDescriptor.isRequestedDescriptor(userInputValue)):
-        return deviceQualifierDescriptor
-
-    # Other Speed Descriptor
-    if (otherSpeedDescriptor.isRequestedDescriptor(userInputValue)):
-        return otherSpeedDescriptor
-
-    # No Descriptor
-    raise Exception("Unkown USB Descriptor with name " + str(userInputValue))
-
 ### Add Verification Values ###
-def addVerificationValues(userInputValues):
+### Return: Rejected Duplicate Value Count
+def addVerificationValues(session, command):
 
     # Get Descriptor
-    descriptor = getDescriptor(userInputValues[0])
-
-    # USB Field
-    usbField = userInputValues[1]
-
-    # Verify User Input Values
-    if (len(userInputValues[2:]) < 2):
-        raise Exception("Missing element !\n")
-
-    # Parse remaining elements
-    for i in range(2, len(userInputValues[2:]), 2):
+    descriptor = session.getDescriptor(command.descriptorType)
 
-        ## First Round ##
-        if (i == 2):
-
-            # Extract Operator
-            operator = userInputValues[i]
-
-            # Verification Value
-            value = userInputValues[i+1]
-
-            # Verificarion Level
-            if (i+2 > len(userInputValues[2:])):
-                verificationLevel = None
-            else:
-                verificationLevel = userInputValues[i+2]
-
-        ## Next Round ##
-        else:
-
-            # Verify User Input Values
-            if (len(userInputValues[i:]) < 3):
-                raise Exception("Missing element !\n")
-
-            # Verificarion Level
-            verificationLevel = userInputValues[i]
-
-            # Extract Operator
-            operator = userInputValues[i+1]
-
-            # Verification Value
-            value = userInputValues[i+2]
-
-        # Add Description Verification Value
-        descriptor.addVerificationValue(usbField, value, verificationLevel, operator)
+    # Add Descriptor Verification Values (all or nothing, already checked by the Command Parser)
+    (errors, duplicateValueCount) = descriptor.addVerificationValues(command.field.name, command.values, verifiedValues=True)
+    return duplicateValueCount
 
 ### Remove Verification Values ###
-def removeVerificationValues(userInputValues):
+def removeVerificationValues(session, command):
 
     # Get Descriptor
-    descriptor = getDescriptor(userInputValues[0])
+    descriptor = session.getDescriptor(command.descriptorType)
 
-    # USB Field
-    usbField = userInputValues[1]
+    # Remove Verification Value
+    descriptor.deleteVerificationValues(command.field.name, command.values)
 
-    # Value to Remove
-    value = userInputValues[2]
+### Import Verification Values from file ###
+def importVerificationValues(session, command):
 
-    # Operator (optional)
-    if (len(userInputValues) > 3):
-        operator = userInputValues[3]
-    else:
-        operator = None
+    # Streaming Importer (Orders other than Add, Remove & Import go through the Command Handler)
+    # Policy Cache: Parse Results of unchanged Command Files always reused, Policy restored when Import Files are unchanged on "cache" only
+    importer = VerificationImporter(session, command.arguments[-2], commandHandler, PolicyCache(POLICY_CACHE_DIR), command.arguments[-1])
 
-    # Remove Verification Value
-    descriptor.deleteVerificationValue(usbField, value, operator)
+    # Import Files & Display Summary
+    importer.importFiles(command.arguments[:-2])
+    importer.displaySummary()
 
-### Import Verification Values from file ###
-def importVerificationValues(userInputValues):
+### Import Fleet Inventory from file ###
+def importInventoryValues(session, command):
 
-    # Get Import File
-    importFile = userInputValues[0]
+    # Inventory Compiler (Device Descriptor optional Equals Values, ROM Depth estimated before Insertion)
+    importer = VerificationImporter(session, command.arguments[-2])
 
-    # Read File Line by Line
-    with open(importFile, 'r') as file:
-        for line in file:
-            # Remove Empty & Comment Line
-            if line.strip() and not line.startswith(IMPORT_COMMENT):
-                userInputHandler(line)
+    # Import Inventory Files & Display Summary
+    importer.importInventoryFiles(command.arguments[:-2])
+    importer.displaySummary()
 
 ### Export Verification Values ###
-def exportVerificationValues(userInputValues):
+def exportVerificationValues(session, userInputValues):
 
     # Default Export Directory
     exportDir = DEFAULT_EXPORT_DIR
@@ -279,21 +199,40 @@ def exportVerificationValues(userInputValues):
 
     # Export New Descriptor Verification Values
     # Return: Dict {Descriptor Name: Descriptor Enable Status}
-    descriptorEnables = exportDescriptorVerificationValues(exportDir)
+    descriptorEnables = exportDescriptorVerificationValues(session, exportDir)
+
+    # Compile Policy (Memory Configurations of the compiled Policy, Verification Values kept as written)
+    # Return: (List[(Compile Pass Name, Removed Value Count, Memory Rows saved, Watchdog Cycles saved)], List[Unsatisfiable Field])
+    state = session.saveState()
+    try:
+        (compileReport, unsatisfiableFields) = PolicyCompiler.compilePolicy(session)
 
-    # Export New Operator Memory Configurations (Indexes & Values)
-    # Return: Dict { OperatorName: (List[(Descriptor, USB Field, Index, Counter)], Required Memory Address Bit Length, Max Index, Max Counter, Total Index)}
-    operatorConfig = exportOperatorMemoryConfigurations(exportDir)
+        # Unsatisfiable Policy Report (Devices with these Fields always rejected)
+        for el in unsatisfiableFields:
+            print("Unsatisfiable Policy: " + el)
 
-    # Export Operator Memory Values Configurations
-    # Input: List[(OperatorName, Depth)]
-    # Return: Dict {OperatorName, List[MemoryValues]}
-    memoryValues = exportOperatorMemoryValuesConfigurations(exportDir, [(el, operatorConfig[el][4]) for el in operatorConfig])
+        # Descriptor Enables of the compiled Policy (Descriptors without Values after Constant Folding always succeed)
+        descriptorEnables = extractDescriptorEnable(session)
 
-    # Export New Operator Summary
-    # Input: Dict {Descriptor Name: Descriptor Enable Status}
-    # Return: (Dict {OperatorName, Enable/Disable}, Watchdog Limit)
-    operatorSummary = exportOperatorSummary(exportDir, descriptorEnables)
+        # Export New Operator Memory Configurations (Indexes & Values)
+        # Return: Dict { OperatorName: (List[(Descriptor, USB Field, Index, Counter)], Required Memory Address Bit Length, Max Index, Max Counter, Total Index)}
+        operatorConfig = exportOperatorMemoryConfigurations(session, exportDir)
+
+        # Export Operator Memory Values Configurations
+        # Input: List[(OperatorName, Depth)]
+        # Return: Dict {OperatorName, List[MemoryValues]}
+        memoryValues = exportOperatorMemoryValuesConfigurations(session, exportDir, [(el, operatorConfig[el][4]) for el in operatorConfig])
+
+        # Export New Operator Summary
+        # Input: Dict {Descriptor Name: Descriptor Enable Status}, List[(Compile Pass Name, Removed Value Count, Memory Rows saved, Watchdog Cycles saved)], List[Unsatisfiable Field]
+        # Return: (Dict {OperatorName, Enable/Disable}, Watchdog Limit)
+        operatorSummary = exportOperatorSummary(session, exportDir, descriptorEnables, compileReport, unsatisfiableFields)
+
+    # Back to Policy as written (Memory Configurations & Encoded String Chunks released)
+    finally:
+        session.restoreState(state)
+        VerificationValue.clearMemConfigCache()
+        StringInterningPool.clearEncodedChunks()
 
     # Export New Operator VHDL Sources
     # Operator Config Input: Dict { OperatorName: (List[(Descriptor, USB Field, Index, Counter)], Required Memory Address Bit Length, Max Index, Max Counter, Total Index)}
@@ -303,76 +242,38 @@ def exportVerificationValues(userInputValues):
 
 ### Export Descriptor Verification Values ###
 ### Return: Dict {Descriptor Name: Descriptor Enable Status}
-def exportDescriptorVerificationValues(exportDir):
+def exportDescriptorVerificationValues(session, exportDir):
 
     # Export Descriptor Values File
     with open(exportDir + DESCRIPTOR_VALUES_FILENAME + DESCRIPTOR_VALUES_FILE_EXTENSION, 'w', encoding='UTF8', newline='') as csvfile:
         fileWriter = csv.writer(csvfile)
-        
-        # Device Descriptor
-        fileWriter.writerow(["Device Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in deviceDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
-        
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
-
-        # Configuration Descriptor
-        fileWriter.writerow(["Configuration Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in configurationDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
-
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
-
-        # Interface Descriptor
-        fileWriter.writerow(["Interface Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in interfaceDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
-    
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
-
-        # HID Descriptor
-        fileWriter.writerow(["HID Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in hidDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
 
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
-
-        # Endpoint Descriptor
-        fileWriter.writerow(["Endpoint Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in endpointDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
-
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
-
-        # Device Qualifier Descriptor
-        fileWriter.writerow(["Device Qualifier Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in deviceQualifierDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
-        
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
-
-        # Other Speed Descriptor
-        fileWriter.writerow(["Other Speed Descriptor Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
-        for el in otherSpeedDescriptor.getVerificationValues():
-            fileWriter.writerow(el)
+        # For each Descriptor
+        for descriptor in session.getDescriptors():
+            fileWriter.writerow([descriptor.DESCRIPTOR_NAME + " Fields", DESCRIPTOR_VALUES_HEADER_OPERATOR, DESCRIPTOR_VALUES_HEADER_VALUE, DESCRIPTOR_VALUES_HEADER_VERIF_LEVEL])
+            for el in descriptor.getVerificationValues():
+                fileWriter.writerow(el)
 
-        # Write Empty Line
-        fileWriter.writerow(["", "", "", ""])
+            # Write Empty Line
+            fileWriter.writerow(["", "", "", ""])
 
         # Extract Descriptor Enables
-        return extractDescriptorEnable()
+        return extractDescriptorEnable(session)
 
 ### Extract Descriptor Enable ###
 # Return: Dict {Descriptor Name: Descriptor Enable Status}
-def extractDescriptorEnable():
+def extractDescriptorEnable(session):
     descriptorEnables = {}
 
+    # Session Descriptors
+    deviceDescriptor = session.deviceDescriptor
+    configurationDescriptor = session.configurationDescriptor
+    interfaceDescriptor = session.interfaceDescriptor
+    hidDescriptor = session.hidDescriptor
+    endpointDescriptor = session.endpointDescriptor
+    deviceQualifierDescriptor = session.deviceQualifierDescriptor
+    otherSpeedDescriptor = session.otherSpeedDescriptor
+
     # Disable all Descriptors
     descriptorEnables.update({deviceDescriptor.DESCRIPTOR_NAME: DescriptorEnableStatusEnum.DISABLE})
     descriptorEnables.update({configurationDescriptor.DESCRIPTOR_NAME: DescriptorEnableStatusEnum.DISABLE})
@@ -424,7 +325,7 @@ def extractDescriptorEnable():
 
 ### Export Operator Memory Configurations (Memory Indexes & Values) ###
 ### Return: Dict { OperatorName: (List[(Descriptor, USB Field, Index, Counter)], Required Memory Address Bit Length, Max Index, Max Counter, Total Index)}
-def exportOperatorMemoryConfigurations(exportDir):
+def exportOperatorMemoryConfigurations(session, exportDir):
 
     # Export Operator Memory Configuration
     with open(exportDir + OPERATOR_MEM_CONFIG_FILENAME + OPERATOR_MEM_CONFIG_FILE_EXTENSION, 'w', encoding='UTF8', newline='') as csvfile:
@@ -448,205 +349,34 @@ def exportOperatorMemoryConfigurations(exportDir):
             # Headers
             fileWriter.writerow([VerificationOperatorEnum.getVerificationOperatorName(op), OPERATOR_MEM_CONFIG_HEADER_INDEX, OPERATOR_MEM_CONFIG_HEADER_COUNTER])
 
-            # Device Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([deviceDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in deviceDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((deviceDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((deviceDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
-
-            # Configuration Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([configurationDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in configurationDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((configurationDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
+            # For each Descriptor [USB Field, Counter of Operator Value]
+            for descriptor in session.getDescriptors():
+                fileWriter.writerow([descriptor.DESCRIPTOR_NAME, "", ""])
+                for el in descriptor.countPerOperator(op):
+                    # Check Count Value
+                    if (el[1] == 0):
+                        # No Value, Disable Field (x)
+                        fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
+                        operatorConfigList.append((descriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
+                    else:
+                        # Value, Enable Field
+                        fileWriter.writerow([el[0], index, el[1]])
+                        operatorConfigList.append((descriptor, el[0], index, el[1]))
+
+                        # Set Last Index (-1 to handle Index 0)
+                        last_index = index + el[1] -1
+
+                        # Set new Max Index
+                        max_index = index
+
+                        # Check Max Count Value
+                        if (el[1] > max_count):
+                            max_count = el[1]
+
+                    # Increment Index (for Next Value)
+                    index += el[1]
 
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((configurationDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
-
-            # Interface Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([interfaceDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in interfaceDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((interfaceDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
-
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((interfaceDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
-
-            # HID Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([hidDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in hidDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((hidDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
-
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((hidDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
-
-            # Endpoint Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([endpointDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in endpointDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((endpointDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
-
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((endpointDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
-
-            # Device Qualifier Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([deviceQualifierDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in deviceQualifierDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((deviceQualifierDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((deviceQualifierDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
-
-            # Other Speed Descriptor [USB Field, Counter of Operator Value]
-            fileWriter.writerow([otherSpeedDescriptor.DESCRIPTOR_NAME, "", ""])
-            for el in otherSpeedDescriptor.countPerOperator(op):
-                # Check Count Value
-                if (el[1] == 0):
-                    # No Value, Disable Field (x)
-                    fileWriter.writerow([el[0], VerificationValue.getMemoryDisableFieldStr(), el[1]])
-                    operatorConfigList.append((otherSpeedDescriptor, el[0], VerificationValue.getMemoryDisableFieldLogic(), el[1]))
-                else:
-                    # Value, Enable Field
-                    fileWriter.writerow([el[0], index, el[1]])
-                    operatorConfigList.append((otherSpeedDescriptor, el[0], index, el[1]))
-
-                    # Set Last Index (-1 to handle Index 0)
-                    last_index = index + el[1] -1
-
-                    # Set new Max Index
-                    max_index = index
-
-                    # Check Max Count Value
-                    if (el[1] > max_count):
-                        max_count = el[1]
-                
-                # Increment Index (for Next Value)
-                index += el[1]
-
-            fileWriter.writerow(["", "", ""])
+                fileWriter.writerow(["", "", ""])
 
             # Operator Memory Address Bit Length
             if (last_index <= 1):
@@ -675,7 +405,7 @@ def exportOperatorMemoryConfigurations(exportDir):
 ### Export Operator Memory Values Configurations ###
 ### Input: List[(OperatorName, Depth)]
 ### Return: Dict {OperatorName, List[MemoryValues]}
-def exportOperatorMemoryValuesConfigurations(exportDir, operatorConfigList):
+def exportOperatorMemoryValuesConfigurations(session, exportDir, operatorConfigList):
 
     # Create Memory Export Directory
     os.makedirs(exportDir + OPERATOR_MEM_VALUES_CONF_DIR)
@@ -702,33 +432,10 @@ def exportOperatorMemoryValuesConfigurations(exportDir, operatorConfigList):
             # Memory Values
             valueToWrite = []
 
-            # Device Descriptor
-            for el in deviceDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
-
-            # Configuration Descriptor
-            for el in configurationDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
-
-            # Interface Descriptor
-            for el in interfaceDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
-
-            # HID Descriptor
-            for el in hidDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
-
-            # Endpoint Descriptor
-            for el in endpointDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
-
-            # Device Qualifier Descriptor
-            for el in deviceQualifierDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
-
-            # Other Speed Descriptor
-            for el in otherSpeedDescriptor.getConvertedVerificationValues(operator):
-                valueToWrite.append(el)
+            # For each Descriptor
+            for descriptor in session.getDescriptors():
+                for el in descriptor.getConvertedVerificationValues(operator):
+                    valueToWrite.append(el)
 
             # Write to Memory Configuration File
             nb_value = len(valueToWrite)
@@ -752,9 +459,9 @@ def exportOperatorMemoryValuesConfigurations(exportDir, operatorConfigList):
     return operatorMemValues
 
 ### Export Operator Summary ###
-### Input: Dict {Descriptor Name: Descriptor Enable Status}
+### Input: Dict {Descriptor Name: Descriptor Enable Status}, List[(Compile Pass Name, Removed Value Count, Memory Rows saved, Watchdog Cycles saved)], List[Unsatisfiable Field]
 ### Return: (Dict {OperatorName, Enable/Disable}, Watchdog Limit)
-def exportOperatorSummary(exportDir, descriptorEnableStatus):
+def exportOperatorSummary(session, exportDir, descriptorEnableStatus, compileReport=(), unsatisfiableFields=()):
     
     # Operator Summary: Dict {OperatorName, Enable/Disable}
     operatorSummary = {}
@@ -785,7 +492,7 @@ def exportOperatorSummary(exportDir, descriptorEnableStatus):
         for op in VerificationOperatorEnum:
 
             # Check if Operator is used (at least 1)
-            isInUse = deviceDescriptor.isOperatorInUse(op) or configurationDescriptor.isOperatorInUse(op) or interfaceDescriptor.isOperatorInUse(op) or hidDescriptor.isOperatorInUse(op) or endpointDescriptor.isOperatorInUse(op) or deviceQualifierDescriptor.isOperatorInUse(op) or otherSpeedDescriptor.isOperatorInUse(op)
+            isInUse = any(descriptor.isOperatorInUse(op) for descriptor in session.getDescriptors())
             if (isInUse):
                 fileWriter.writerow([op.name, VerificationValue.getOperatorEnableStr()])
                 inUseOperators += 1
@@ -803,31 +510,50 @@ def exportOperatorSummary(exportDir, descriptorEnableStatus):
         # Overall Watchdog Limit = Largest Verification Number of Value Part x Watchdog Limit per Verification
         largestVerifNumber = 1
 
-        # Device Descriptor
-        largestVerifNumber = deviceDescriptor.getLargestVerificationNumber(largestVerifNumber)
-
-        # Configuration Descriptor
-        largestVerifNumber = configurationDescriptor.getLargestVerificationNumber(largestVerifNumber)
-
-        # Interface Descriptor
-        largestVerifNumber = interfaceDescriptor.getLargestVerificationNumber(largestVerifNumber)
-        
-        # HID Descriptor
-        largestVerifNumber = hidDescriptor.getLargestVerificationNumber(largestVerifNumber)
-    
-        # Endpoint Descriptor
-        largestVerifNumber = endpointDescriptor.getLargestVerificationNumber(largestVerifNumber)
-
-        # Device Qualifier Descriptor
-        largestVerifNumber = deviceQualifierDescriptor.getLargestVerificationNumber(largestVerifNumber)
-
-        # Other Speed Descriptor
-        largestVerifNumber = otherSpeedDescriptor.getLargestVerificationNumber(largestVerifNumber)
+        # For each Descriptor
+        for descriptor in session.getDescriptors():
+            largestVerifNumber = descriptor.getLargestVerificationNumber(largestVerifNumber)
 
         # Operator Watchdog Limit
         watchdogLimit = largestVerifNumber * VerificationValue.getOperatorWatchdogLimit()
         fileWriter.writerow([USB_SUMMARY_WATCHDOG_LIMIT_TITLE, watchdogLimit])
 
+        # Duplicate Values Summary (Memory Rows & Watchdog Cycles saved when rejected)
+        (duplicateValueCount, duplicateMemoryRows, largestVerifWithDuplicates, largestVerifWithoutDuplicates) = session.getDuplicateSummary()
+        if (duplicateValueCount > 0):
+            duplicateWatchdogCycles = (largestVerifWithDuplicates - largestVerifWithoutDuplicates) * VerificationValue.getOperatorWatchdogLimit()
+            fileWriter.writerow(["", ""])
+            fileWriter.writerow([USB_SUMMARY_DUPLICATE_VALUES_TITLE, duplicateValueCount])
+            fileWriter.writerow([USB_SUMMARY_DUPLICATE_MEM_ROWS_TITLE, duplicateMemoryRows])
+            fileWriter.writerow([USB_SUMMARY_DUPLICATE_WATCHDOG_TITLE, duplicateWatchdogCycles])
+
+            # Duplicate Values Report
+            if (session.deviceDescriptor.rejectDuplicates == True):
+                print(str(duplicateValueCount) + " Duplicate Values rejected: " + str(duplicateMemoryRows) + " Memory Rows & " + str(duplicateWatchdogCycles) + " Watchdog Cycles saved")
+            else:
+                print(str(duplicateValueCount) + " Duplicate Values kept: " + str(duplicateMemoryRows) + " Memory Rows & " + str(duplicateWatchdogCycles) + " Watchdog Cycles could be saved")
+
+        # Compile Passes Summary (Passes with removed or added Values only)
+        compileReport = [el for el in compileReport if (el[1] != 0)]
+        if (len(compileReport) > 0):
+            fileWriter.writerow(["", ""])
+            fileWriter.writerow([USB_SUMMARY_HEADER_COMPILE_PASS, USB_SUMMARY_HEADER_COMPILE_REMOVED_VALUES, USB_SUMMARY_HEADER_COMPILE_MEM_ROWS, USB_SUMMARY_HEADER_COMPILE_WATCHDOG])
+            for (passName, removedValueCount, memoryRowsSaved, watchdogCyclesSaved) in compileReport:
+                fileWriter.writerow([passName, removedValueCount, memoryRowsSaved, watchdogCyclesSaved])
+
+                # Compile Pass Report (negative Counts: Values added)
+                if (removedValueCount > 0):
+                    print(passName + ": " + str(removedValueCount) + " Values removed, " + str(memoryRowsSaved) + " Memory Rows & " + str(watchdogCyclesSaved) + " Watchdog Cycles saved")
+                else:
+                    print(passName + ": " + str(-removedValueCount) + " Values added, " + str(-memoryRowsSaved) + " Memory Rows & " + str(-watchdogCyclesSaved) + " Watchdog Cycles added")
+
+        # Unsatisfiable Fields Summary
+        if (len(unsatisfiableFields) > 0):
+            fileWriter.writerow(["", ""])
+            fileWriter.writerow([USB_SUMMARY_HEADER_UNSATISFIABLE, ""])
+            for el in unsatisfiableFields:
+                fileWriter.writerow([el, ""])
+
     # Return: (Dict {OperatorName, Enable/Disable}, Watchdog Limit)
     return (operatorSummary, watchdogLimit)
 
@@ -857,36 +583,67 @@ def exportVHDLSources(exportDir, operatorConfig, memoryValues, operatorSummary):
     sourceFileManager.configureUSBVerifierSourceFile(operatorConfig, operatorSummary)
 
 ### Summary Verification Values ###
-def summaryVerificationValues(userInputValues):
+def summaryVerificationValues(session, command):
 
     # Summary of All Verification Values
-    if (len(userInputValues) == 0):
-        deviceDescriptor.displayAllVerificationValues()
-        configurationDescriptor.displayAllVerificationValues()
-        interfaceDescriptor.displayAllVerificationValues()
-        hidDescriptor.displayAllVerificationValues()
-        endpointDescriptor.displayAllVerificationValues()
-        deviceQualifierDescriptor.displayAllVerificationValues()
-        otherSpeedDescriptor.displayAllVerificationValues()
+    if (command.descriptorType == None):
+        for descriptor in session.getDescriptors():
+            descriptor.displayAllVerificationValues()
 
     else:
 
         # Get Descriptor
-        descriptor = getDescriptor(userInputValues[0])
+        descriptor = session.getDescriptor(command.descriptorType)
 
         # Summary of Descriptor
-        if (len(userInputValues) == 1):
+        if (command.field == None):
             descriptor.displayAllVerificationValues()
         
         # Summary of Specific Descriptor USB Field
         else:
-            descriptor.displayVerificationValues(userInputValues[1])
+            descriptor.displayVerificationValues(command.field.name)
+
+### Get Snapshot Name ###
+def getSnapshotName(userInputValues):
+    if (len(userInputValues) == 0):
+        return DEFAULT_SNAPSHOT_NAME
+    else:
+        return userInputValues[0]
+
+### Snapshot Verification Values ###
+def snapshotVerificationValues(session, userInputValues):
+    session.createSnapshot(getSnapshotName(userInputValues))
+
+### Rollback Verification Values ###
+def rollbackVerificationValues(session, userInputValues):
+    session.rollbackSnapshot(getSnapshotName(userInputValues))
+
+### Compare Verification Values with Snapshot ###
+def diffVerificationValues(session, userInputValues):
+
+    # Snapshot & Current Policy
+    ((snapshotMemoryRows, snapshotLargestVerifNumber), (currentMemoryRows, currentLargestVerifNumber), changes) = session.diffSnapshot(getSnapshotName(userInputValues))
+
+    # Verification Value Changes
+    print("--- Verification Values ---")
+    for el in changes:
+        print("\t", el[2], el[0], el[1], el[3], el[4], el[5])
+
+    # Memory Rows per Operator (only changed Operators)
+    print("--- Memory Rows ---")
+    for op in VerificationOperatorEnum:
+        if (snapshotMemoryRows[op] != currentMemoryRows[op]):
+            print("\t", op.name, "\t", snapshotMemoryRows[op], "->", currentMemoryRows[op])
+
+    # Watchdog Limit
+    print("--- " + USB_SUMMARY_WATCHDOG_LIMIT_TITLE + " ---")
+    print("\t", snapshotLargestVerifNumber * VerificationValue.getOperatorWatchdogLimit(), "->", currentLargestVerifNumber * VerificationValue.getOperatorWatchdogLimit())
 
 ### Quit Program ###
-def quitProgram(requiredExportValue):
+def quitProgram(session):
 
     # Some Verification Values are not exported (require Export)
-    if (requiredExportValue == True):
+    if (session.requiredExportValue == True):
         nextStep = False
         userExportOrder = False
         print("Some of Verification Values are not exported (May override previously files)")
@@ -906,71 +663,92 @@ def quitProgram(requiredExportValue):
         # Export Verification Values
         if (userExportOrder == True):
             exportDir = input("Enter directory path to export files (press enter to use default directory: " + DEFAULT_EXPORT_DIR + ")")
-            exportVerificationValues(exportDir)
+            exportVerificationValues(session, exportDir)
 
     # Quit Programm
     print("Exiting USB Verification Configurer Program")
     exit()
 
 ### User Input Handler ###
-def userInputHandler(userInput):
+def userInputHandler(session, userInput):
 
-    # Exported Values Status
-    global requiredExportValue
+    # Process User Input
+    try:
 
-    # Split User Input Value
-    userInputValues = userInput.split()
+        # Parse User Command
+        command = CommandParser.parseCommand(userInput)
 
-    # Process each User Input Values
-    try:
+        # Handle User Command
+        commandHandler(session, command)
 
-        # Extract User Order
-        userOrder = VerificationOrderEnum.getVerificationOrderEnum(userInputValues[0])
-
-        # Mode
-        match(userOrder):
-
-            # Add Verification Values
-            case VerificationOrderEnum.ADD:
-                addVerificationValues(userInputValues[1:])
-                requiredExportValue = True
-                print("Add Process Completed")
-                
-            # Remove Verification Values
-            case VerificationOrderEnum.REMOVE:
-                removeVerificationValues(userInputValues[1:])
-                requiredExportValue = True
-                print("Remove Process Completed")
-
-            # Import Verification Values
-            case VerificationOrderEnum.IMPORT:
-                importVerificationValues(userInputValues[1:])
-                requiredExportValue = True
-                print("Import Process Completed")
-
-            # Export Verification Values
-            case VerificationOrderEnum.EXPORT:
-                exportVerificationValues(userInputValues[1:])
-                requiredExportValue = False
-                print("Export Process Completed")
-
-            # Summary
-            case VerificationOrderEnum.SUMMARY:
-                summaryVerificationValues(userInputValues[1:])
-
-            # Hints
-            case VerificationOrderEnum.HELP:
-                print(hints)
-
-            # Quit
-            case _:
-                quitProgram(requiredExportValue)
-
-    except IndexError as ie:
-        print("Missing element !\n")
     except Exception as e:
         print(e)
 
+### Command Handler ###
+def commandHandler(session, command):
+
+    # Mode
+    match(command.order):
+
+        # Add Verification Values
+        case VerificationOrderEnum.ADD:
+            duplicateValueCount = addVerificationValues(session, command)
+            session.requiredExportValue = True
+            if (duplicateValueCount > 0):
+                print("Duplicate value ignored: " + str(duplicateValueCount) + " value(s) already in " + command.descriptorType + " " + command.field.name)
+            print("Add Process Completed")
+            
+        # Remove Verification Values
+        case VerificationOrderEnum.REMOVE:
+            removeVerificationValues(session, command)
+            session.requiredExportValue = True
+            print("Remove Process Completed")
+
+        # Import Verification Values (Include outside of an Import File)
+        case VerificationOrderEnum.IMPORT | VerificationOrderEnum.INCLUDE:
+            importVerificationValues(session, command)
+            session.requiredExportValue = True
+            print("Import Process Completed")
+
+        # Import Fleet Inventory
+        case VerificationOrderEnum.IMPORT_INVENTORY:
+            importInventoryValues(session, command)
+            session.requiredExportValue = True
+            print("Import Inventory Process Completed")
+
+        # Export Verification Values
+        case VerificationOrderEnum.EXPORT:
+            exportVerificationValues(session, command.arguments)
+            session.requiredExportValue = False
+            print("Export Process Completed")
+
+        # Summary
+        case VerificationOrderEnum.SUMMARY:
+            summaryVerificationValues(session, command)
+
+        # Snapshot Verification Values
+        case VerificationOrderEnum.SNAPSHOT:
+            snapshotVerificationValues(session, command.arguments)
+            print("Snapshot Process Completed")
+
+        # Rollback Verification Values
+        case VerificationOrderEnum.ROLLBACK:
+            rollbackVerificationValues(session, command.arguments)
+            session.requiredExportValue = True
+            print("Rollback Process Completed")
+
+        # Compare Verification Values with Snapshot
+        case VerificationOrderEnum.DIFF:
+            diffVerificationValues(session, command.arguments)
+
+        # Hints
+        case VerificationOrderEnum.HELP:
+            print(hints)
+
+        # Quit
+        case _:
+            quitProgram(session)
+
 #################################
 ## USB Verification Configurer ##
 #################################
@@ -985,6 +763,12 @@ if __name__ == '__main__':
     # Display Hints
     print(hints)
 
+    # USB Verification Session (Columnar Value Store on Program Option)
+    columnarStore = COLUMNAR_STORE_OPTION in sys.argv[1:]
+    if (columnarStore == True):
+        print("Columnar Value Store enabled\n")
+    session = VerificationSession(columnarStore)
+
     # Start USB Verification Configurer
     while(True):
 
@@ -992,4 +776,4 @@ if __name__ == '__main__':
         userInput = input("\nWrite your command:")
 
         # Handle User Input
-        userInputHandler(userInput)
+        userInputHandler(session, userInput)
@@ -0,0 +1,45 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: VerificationCommand
+## Description: Parsed USB Verification Command Class
+########################################################################
+
+class VerificationCommand:
+
+    ####################################
+    ## Verification Command Variables ##
+    ####################################
+
+    # Verification Order
+    order = None
+
+    # USB Descriptor Type (Add, Remove & Summary Orders)
+    descriptorType = None
+
+    # USB Descriptor Field (Add, Remove & Summary Orders)
+    field = None
+
+    # Verification Values
+    # Add Order: [(Value, Verification Level, Operator)]
+    # Remove Order: [(Value, Operator)]
+    values = None
+
+    # Verification Value Columns (same order as Verification Values)
+    valueColumns = None
+
+    # Order Arguments (Import Files, Import Mode & Policy Cache, Export Directory or Snapshot Name)
+    arguments = None
+
+    #########################################
+    ## Public Verification Command Methods ##
+    #########################################
+
+    ### Constructor (All Args) ###
+    def __init__(self, order, descriptorType=None, field=None, values=None, valueColumns=None, arguments=None):
+        self.order = order
+        self.descriptorType = descriptorType
+        self.field = field
+        self.values = values if (values != None) else []
+        self.valueColumns = valueColumns if (valueColumns != None) else []
+        self.arguments = arguments if (arguments != None) else []
@@ -0,0 +1,830 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: VerificationImporter
+## Description: Streaming Bulk Importer of Verification Values files
+##              (Command files, exported USBVerificationValues.csv files, JSON Policy files, sysfs descriptors files & lsusb -v dumps)
+##              Fleet Inventory CSV files (vid,pid,manufacturer,product,serial) compiled into Device Descriptor Allow-Lists
+########################################################################
+
+import io
+import os
+import csv
+import glob
+import locale
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from CommandParser import CommandParser
+from ImportModeEnum import ImportModeEnum
+from VerificationOrderEnum import VerificationOrderEnum
+from VerificationOperatorEnum import VerificationOperatorEnum
+from VerificationLevelEnum import VerificationLevelEnum
+from VerificationValue import VerificationValue
+from VerificationCommand import VerificationCommand
+from DeviceDescriptor import DeviceDescriptor
+from JsonPolicyDecoder import JsonPolicyDecoder
+from SysfsDescriptorParser import SysfsDescriptorParser
+from LsusbDumpParser import LsusbDumpParser
+from InventoryCompiler import InventoryCompiler
+
+class VerificationImporter:
+
+    #####################################
+    ## Verification Importer Constants ##
+    #####################################
+
+    # Import File - Character Comment
+    IMPORT_COMMENT = "#"
+
+    # Max Pending Values before Insertion (bounded Batch Memory)
+    IMPORT_BATCH_SIZE = 65536
+
+    # Import File Chunk Size (in Bytes, Chunks are parsed in parallel)
+    IMPORT_CHUNK_SIZE = 4 * 1024 * 1024
+
+    # Import Worker Number (Parser Processes)
+    IMPORT_WORKER_NUMBER = os.cpu_count()
+
+    # Exported Verification Values File (CSV) - Extension & Descriptor Header Suffix
+    IMPORT_VALUES_FILE_EXTENSION = ".csv"
+    IMPORT_VALUES_HEADER_SUFFIX = " Fields"
+
+    # JSON Policy File - Extension & Rule Keys
+    IMPORT_POLICY_FILE_EXTENSION = ".json"
+    IMPORT_POLICY_RULE_OPERATOR = "operator"
+    IMPORT_POLICY_RULE_VALUE = "value"
+    IMPORT_POLICY_RULE_LEVEL = "level"
+
+    # Verification Level of Values captured from Devices (sysfs & lsusb, Allow-List: any captured Value)
+    IMPORT_CAPTURE_VERIF_LEVEL = VerificationLevelEnum.OPTIONAL
+
+    # Max Displayed Errors in Import Summary
+    IMPORT_ERROR_DISPLAY_LIMIT = 100
+
+    #####################################
+    ## Verification Importer Variables ##
+    #####################################
+
+    # USB Verification Session
+    session = None
+
+    # Import Mode (Continue or Fail Fast on Error)
+    importMode = None
+
+    # Handler of Orders other than Add, Remove & Import: Function(Session, Command)
+    commandHandler = None
+
+    # Import Errors [(Import File, Line Number, Error)]
+    errors = None
+
+    # Import Counters
+    lineCount = 0
+    addedValueCount = 0
+    removedValueCount = 0
+    duplicateValueCount = 0
+
+    # Pending Values to Add {(Descriptor, USB Field Name): [(Value, Verification Level, Operator)]}
+    pendingValues = None
+
+    # Pending Value Locations (same order as Pending Values to Add) {(Descriptor, USB Field Name): [(Import File, Line Number)]}
+    pendingLocations = None
+
+    # Pending Value Operators (Remove of a Pending Value flushes the Batch first) {(Descriptor, USB Field Name): {Value: {Operator}}}
+    pendingValueOperators = None
+
+    # Pending Values to Remove {(Descriptor, USB Field Name): [(Value, Operator)]}
+    pendingRemoveValues = None
+
+    # Pending Value Number
+    pendingValueCount = 0
+
+    # Parser Process Pool (created on first multi-chunk Import)
+    executor = None
+
+    # Policy Cache (optional, Parsed Command Files), Policy State Cache Enable (opt-in) & Cache Hit of last Import
+    policyCache = None
+    cachePolicyState = False
+    cacheHit = False
+
+    # Read Import Files & Glob Patterns [(Glob Pattern, Matches)] (Policy Cache Dependencies)
+    readFiles = None
+    readPatterns = None
+
+    # Command Files being read (outer File first, Include Cycle Detection)
+    includeStack = None
+
+    # Orders sent to the Command Handler (Import with Side Effects, not cached)
+    handledCommandCount = 0
+
+    # Values captured from Devices {(Descriptor Type, USB Field Name, Value)} (same Value of several Devices added once)
+    capturedValues = None
+
+    ##########################################
+    ## Public Verification Importer Methods ##
+    ##########################################
+
+    ### Constructor (Session, Import Mode, Handler of other Orders, optional Policy Cache & Policy State Cache Enable) ###
+    def __init__(self, session, importMode=ImportModeEnum.CONTINUE, commandHandler=None, policyCache=None, cachePolicyState=False):
+        self.session = session
+        self.importMode = ImportModeEnum.getImportModeEnum(importMode)
+        self.commandHandler = commandHandler
+        self.policyCache = policyCache
+        self.cachePolicyState = cachePolicyState
+        self.cacheHit = False
+        self.readFiles = []
+        self.readPatterns = []
+        self.includeStack = []
+        self.handledCommandCount = 0
+        self.capturedValues = set()
+        self.errors = []
+        self.lineCount = 0
+        self.addedValueCount = 0
+        self.removedValueCount = 0
+        self.duplicateValueCount = 0
+        self.__clearPendingValues()
+
+    ### Import Files or Glob Patterns (Fail Fast: Policy restored on first Error) ###
+    def importFiles(self, importFiles):
+
+        # Import Summary before Import
+        summary = self.__getSummary()
+        self.cacheHit = False
+
+        # Policy State before Import (Fail Fast)
+        if (self.importMode == ImportModeEnum.FAIL_FAST):
+            state = self.session.saveState()
+
+        # Duplicate Values before Import
+        duplicateValueCount = self.session.getDuplicateSummary()[0]
+
+        # Policy State Cache (opt-in, Import into an empty Policy only)
+        importFiles = self.__expandImportFiles(importFiles)
+        cacheKey = None
+        if (self.policyCache != None) and (self.cachePolicyState == True) and (self.session.getVerificationValueNumber() == 0) and (duplicateValueCount == 0):
+            cacheKey = self.policyCache.getKey(self.session, importFiles, self.importMode)
+
+            # Cache Hit: Restore Policy State & Import Summary
+            cacheEntry = self.policyCache.load(cacheKey)
+            if (cacheEntry != None):
+                (cachedState, cachedSummary) = cacheEntry
+
+                # Malformed Cache Entry (Cache Miss)
+                try:
+                    cachedState = self.session.unpackState(cachedState)
+                except Exception:
+                    cachedState = None
+
+                if (cachedState != None):
+                    self.session.restoreState(cachedState)
+                    self.__addSummary(cachedSummary)
+                    self.cacheHit = True
+                    return
+
+        # Stream File & Insert remaining Pending Values
+        handledCommandCount = self.handledCommandCount
+        try:
+            self.__readFiles(importFiles)
+            self.__flushPendingValues()
+
+        # Fail Fast: Restore Policy State
+        except Exception as e:
+            self.__clearPendingValues()
+            if (self.importMode == ImportModeEnum.FAIL_FAST):
+                self.session.restoreState(state)
+            raise e
+
+        # Stop Parser Processes
+        finally:
+            if (self.executor != None):
+                self.executor.shutdown()
+                self.executor = None
+
+        # Duplicate Values of this Import
+        self.duplicateValueCount += self.session.getDuplicateSummary()[0] - duplicateValueCount
+
+        # Store Policy State & Import Summary (Import without Side Effects)
+        if (cacheKey != None) and (self.handledCommandCount == handledCommandCount):
+            self.policyCache.store(cacheKey, self.readFiles, self.readPatterns, self.session.packState(self.session.saveState()), self.__getSummary(summary))
+
+    ### Import Fleet Inventory Files or Glob Patterns (Device Descriptor Allow-Lists, ROM Depth estimated before Insertion) ###
+    def importInventoryFiles(self, importFiles):
+        self.cacheHit = False
+
+        # Policy State before Import (Fail Fast)
+        if (self.importMode == ImportModeEnum.FAIL_FAST):
+            state = self.session.saveState()
+
+        # Duplicate Values before Import
+        duplicateValueCount = self.session.getDuplicateSummary()[0]
+
+        # Compile Inventory Files (deduplicated Field Values)
+        compiler = InventoryCompiler()
+        try:
+            for importFile in self.__expandImportFiles(importFiles):
+                self.__readInventoryFile(compiler, importFile)
+            self.lineCount += compiler.rowCount
+
+            # Values Format & Length (one Batch per Field)
+            for (importFile, lineNumber, error) in compiler.checkValues():
+                self.__reportError(importFile, lineNumber, error)
+
+            # ROM Depth Estimate
+            compiler.displayMemoryDepths(compiler.estimateMemoryDepths(self.session))
+
+            # Insert Inventory Values
+            descriptor = self.session.getDescriptor(DeviceDescriptor.DESCRIPTOR_TYPE)
+            for (fieldName, values, locations) in compiler.iterateValues():
+                self.__addPendingValues((descriptor, fieldName), values, locations)
+            self.__flushPendingValues()
+
+        # Fail Fast: Restore Policy State
+        except Exception as e:
+            self.__clearPendingValues()
+            if (self.importMode == ImportModeEnum.FAIL_FAST):
+                self.session.restoreState(state)
+            raise e
+
+        # Duplicate Values of this Import
+        self.duplicateValueCount += self.session.getDuplicateSummary()[0] - duplicateValueCount
+
+    ### Display Import Summary ###
+    def displaySummary(self):
+        print(
+            ("Import Summary (Policy Cache): " if (self.cacheHit == True) else "Import Summary: ") + str(self.lineCount) + " lines, " +
+            str(self.addedValueCount) + " values added, " +
+            str(self.removedValueCount) + " values removed, " +
+            str(self.duplicateValueCount) + " duplicate values, " +
+            str(len(self.errors)) + " errors"
+        )
+
+        # Errors (up to Display Limit)
+        for (importFile, lineNumber, error) in self.errors[:self.IMPORT_ERROR_DISPLAY_LIMIT]:
+            print(importFile + ":" + str(lineNumber) + ": " + str(error))
+        if (len(self.errors) > self.IMPORT_ERROR_DISPLAY_LIMIT):
+            print("... " + str(len(self.errors) - self.IMPORT_ERROR_DISPLAY_LIMIT) + " more errors")
+
+    #################################################
+    ## Public Static Verification Importer Methods ##
+    #################################################
+
+    ### Parse File Chunk (run by Parser Processes) ###
+    ### Return: (Chunk Line Number, List[(Chunk Line Number, Command, Error)])
+    def parseChunk(importFile, start, end):
+        results = []
+
+        # Read Chunk (same Decoding as Text Files)
+        with open(importFile, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start).decode(locale.getpreferredencoding(False))
+
+        lineNumber = 0
+        for line in io.StringIO(data, newline=None):
+            lineNumber += 1
+
+            # Remove Empty & Comment Line
+            if (not line.strip()) or line.startswith(VerificationImporter.IMPORT_COMMENT):
+                continue
+
+            # Parse Line
+            try:
+                results.append((lineNumber, CommandParser.parseCommand(line), None))
+            except Exception as e:
+                results.append((lineNumber, None, str(e)))
+
+        return (lineNumber, results)
+
+    ###########################################
+    ## Private Verification Importer Methods ##
+    ###########################################
+
+    ### Expand Import Files & Glob Patterns (sorted Matches, Pattern order kept) ###
+    ### Return: List of Import Files
+    def __expandImportFiles(self, importFiles):
+        result = []
+
+        for importFile in importFiles:
+
+            # Plain File (missing File reported when read)
+            if (glob.has_magic(importFile) == False):
+                result.append(importFile)
+                continue
+
+            # Glob Pattern
+            matches = sorted(glob.glob(importFile))
+            self.readPatterns.append((importFile, matches))
+            if (len(matches) == 0):
+                self.__reportError(importFile, 0, "No file matching pattern !")
+            result.extend(matches)
+
+        return result
+
+    ### Read Files (Command Files, exported Verification Values Files, JSON Policy Files & Device Captures, in File order) ###
+    def __readFiles(self, importFiles):
+        commandFiles = []
+
+        for importFile in importFiles:
+
+            # Command File (parsed with the next Command Files)
+            fileReader = self.__getFileReader(importFile)
+            if (fileReader == None):
+                commandFiles.append(importFile)
+                continue
+
+            # Previous Command Files first
+            self.__readCommandFiles(commandFiles)
+            commandFiles = []
+            fileReader(importFile)
+
+        self.__readCommandFiles(commandFiles)
+
+    ### Get File Reader from File Name (& first Line of lsusb Dumps) ###
+    ### Return: Reader Method, None for a Command File
+    def __getFileReader(self, importFile):
+        extension = os.path.splitext(importFile)[1].lower()
+
+        # sysfs Device raw Descriptors File
+        if (os.path.basename(importFile) == SysfsDescriptorParser.SYSFS_DESCRIPTORS_FILENAME):
+            return self.__readSysfsFile
+
+        # Exported Verification Values File
+        if (extension == self.IMPORT_VALUES_FILE_EXTENSION):
+            return self.__readValuesFile
+
+        # JSON Policy File
+        if (extension == self.IMPORT_POLICY_FILE_EXTENSION):
+            return self.__readPolicyFile
+
+        # lsusb -v Dump
+        if (LsusbDumpParser.isDump(importFile)):
+            return self.__readLsusbFile
+
+        return None
+
+    ### Read Command Files (Parse in parallel, merge in File & Line order) ###
+    def __readCommandFiles(self, importFiles):
+        for (importFile, lineNumber, command, error) in self.__parseFiles(importFiles):
+
+            # Parsing Error
+            if (error != None):
+                self.__reportError(importFile, lineNumber, error)
+                continue
+
+            # Order
+            match command.order:
+
+                # Add & Remove Orders: Batch Values
+                case VerificationOrderEnum.ADD | VerificationOrderEnum.REMOVE:
+                    self.__addPendingCommand(command, importFile, lineNumber)
+
+                # Import & Include Orders: Read nested Files (Pending Values first, keep File Order)
+                case VerificationOrderEnum.IMPORT | VerificationOrderEnum.INCLUDE:
+                    self.__flushPendingValues()
+                    self.__readIncludedFiles(importFile, lineNumber, command)
+
+                # Other Orders (Pending Values first, keep File Order)
+                case _:
+                    self.__flushPendingValues()
+                    self.handledCommandCount += 1
+                    if (self.commandHandler == None):
+                        self.__reportError(importFile, lineNumber, "Order " + command.order.name + " not allowed in Import File !")
+                        continue
+                    try:
+                        self.commandHandler(self.session, command)
+                    except Exception as e:
+                        self.__reportError(importFile, lineNumber, e)
+
+    ### Read nested Files of a Command File (Include Paths relative to the Command File, Include Cycles reported) ###
+    def __readIncludedFiles(self, importFile, lineNumber, command):
+        includeFiles = command.arguments[:-2]
+        if (command.order == VerificationOrderEnum.INCLUDE):
+            includeFiles = [os.path.join(os.path.dirname(importFile), includeFile) for includeFile in includeFiles]
+
+        # Command File read until its nested Files are read
+        self.includeStack.append(importFile)
+        try:
+            nestedFiles = []
+            for includeFile in self.__expandImportFiles(includeFiles):
+
+                # Include Cycle (nested File already being read)
+                if (os.path.realpath(includeFile) in map(os.path.realpath, self.includeStack)):
+                    self.__reportError(importFile, lineNumber, "Include cycle: " + " -> ".join(self.includeStack + [includeFile]))
+                    continue
+                nestedFiles.append(includeFile)
+
+            self.__readFiles(nestedFiles)
+
+        finally:
+            self.includeStack.pop()
+
+    ### Read exported Verification Values File (one csv.reader Pass, Rows batched without Command Parsing) ###
+    ### Descriptor Header Row: [Descriptor Name + " Fields", Operator, Value, Verification Level]
+    ### Value Row: [USB Field Name, Operator Name, Value, Verification Level Name]
+    def __readValuesFile(self, importFile):
+
+        # USB Descriptors {Descriptor Header: Descriptor}
+        descriptors = {descriptor.DESCRIPTOR_NAME + self.IMPORT_VALUES_HEADER_SUFFIX: descriptor for descriptor in self.session.getDescriptors()}
+        descriptor = None
+        self.readFiles.append(importFile)
+
+        try:
+            with open(importFile, 'r', encoding='UTF8', newline='') as csvfile:
+                fileReader = csv.reader(csvfile)
+                for row in fileReader:
+
+                    # Empty Row (end of Descriptor Section)
+                    if (any(row) == False):
+                        descriptor = None
+                        continue
+
+                    self.lineCount += 1
+
+                    # Descriptor Header Row
+                    if (row[0] in descriptors):
+                        descriptor = descriptors[row[0]]
+                        continue
+
+                    # Value Row
+                    try:
+                        self.__addPendingCommand(VerificationImporter.__parseValueRow(descriptor, row), importFile, fileReader.line_num)
+                    except Exception as e:
+                        self.__reportError(importFile, fileReader.line_num, e)
+
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            self.__reportError(importFile, 0, e)
+
+    ### Read JSON Policy File (streamed Rules, validated per Descriptor Field Batch) ###
+    def __readPolicyFile(self, importFile):
+
+        # Rule Batch of current Descriptor Field
+        batchKey = None
+        rules = []
+        lineNumbers = []
+        self.readFiles.append(importFile)
+
+        try:
+            with open(importFile, 'r', encoding='UTF8') as file:
+                decoder = JsonPolicyDecoder(file)
+                rulesIterator = decoder.iterateRules()
+                while (True):
+
+                    # Next Rule (JSON Syntax Error: Rules before the Error are kept)
+                    try:
+                        (descriptorKey, fieldKey, rule, lineNumber) = next(rulesIterator)
+                    except StopIteration:
+                        break
+                    except Exception as e:
+                        self.__reportError(importFile, decoder.getLineNumber(), e)
+                        break
+                    self.lineCount += 1
+
+                    # New Descriptor Field or Batch Full
+                    if ((descriptorKey, fieldKey) != batchKey) or (len(rules) >= self.IMPORT_BATCH_SIZE):
+                        self.__addPolicyRules(importFile, batchKey, rules, lineNumbers)
+                        batchKey = (descriptorKey, fieldKey)
+                        rules = []
+                        lineNumbers = []
+
+                    rules.append(rule)
+                    lineNumbers.append(lineNumber)
+
+                self.__addPolicyRules(importFile, batchKey, rules, lineNumbers)
+
+        except (OSError, UnicodeDecodeError) as e:
+            self.__reportError(importFile, 0, e)
+
+    ### Add JSON Policy Rules of one Descriptor Field to Pending Values (Values validated in one Batch) ###
+    def __addPolicyRules(self, importFile, batchKey, rules, lineNumbers):
+
+        # Empty Batch
+        if (len(rules) == 0):
+            return
+        (descriptorKey, fieldKey) = batchKey
+
+        # USB Descriptor & Field
+        descriptorClass = CommandParser.DESCRIPTOR_CLASSES.get(descriptorKey.casefold())
+        if (descriptorClass == None):
+            self.__reportError(importFile, lineNumbers[0], "Unkown USB Descriptor with name " + descriptorKey)
+            return
+
+        field = descriptorClass.FIELD_REGISTRY.get(fieldKey.casefold())
+        if (field == None):
+            self.__reportError(importFile, lineNumbers[0], "Unkown " + descriptorClass.DESCRIPTOR_NAME + " Field: " + fieldKey)
+            return
+
+        # Rules: (Value, Verification Level, Operator)
+        values = []
+        locations = []
+        for (rule, lineNumber) in zip(rules, lineNumbers):
+            try:
+                values.append(VerificationImporter.__parsePolicyRule(rule))
+                locations.append((importFile, lineNumber))
+            except Exception as e:
+                self.__reportError(importFile, lineNumber, e)
+
+        # Values Format & Length (one Batch Check)
+        errors = VerificationValue.checkValues([el[0] for el in values], field.length, field.valueFormat, [el[2] for el in values])
+        invalidPositions = set()
+        for (position, error) in errors:
+            (importFile, lineNumber) = locations[position]
+            self.__reportError(importFile, lineNumber, error)
+            invalidPositions.add(position)
+
+        if (len(invalidPositions) != 0):
+            values = [el for (position, el) in enumerate(values) if (position not in invalidPositions)]
+            locations = [el for (position, el) in enumerate(locations) if (position not in invalidPositions)]
+
+        self.__addPendingValues((self.session.getDescriptor(descriptorClass.DESCRIPTOR_TYPE), field.name), values, locations)
+
+    ### Read sysfs Device raw Descriptors File & String Files (Equals Values, one Line per Device) ###
+    def __readSysfsFile(self, importFile):
+        self.readFiles.append(importFile)
+
+        # Device Values: [(Descriptor Class, USB Field Name, Value)]
+        try:
+            deviceValues = SysfsDescriptorParser.parseDevice(importFile)
+        except Exception as e:
+            self.__reportError(importFile, 0, e)
+            return
+        self.lineCount += 1
+
+        for (descriptorClass, fieldName, value) in deviceValues:
+            self.__addCapturedValue(importFile, 0, descriptorClass, fieldName, value)
+
+    ### Read lsusb -v Dump (streamed Lines, Equals Values, one Line per verified Field) ###
+    def __readLsusbFile(self, importFile):
+        self.readFiles.append(importFile)
+
+        try:
+            with open(importFile, 'r', encoding='UTF8') as file:
+                for (lineNumber, descriptorClass, fieldName, value, error) in LsusbDumpParser.parseDump(file):
+                    self.lineCount += 1
+
+                    # Field Value Error
+                    if (error != None):
+                        self.__reportError(importFile, lineNumber, error)
+                        continue
+
+                    self.__addCapturedValue(importFile, lineNumber, descriptorClass, fieldName, value)
+
+        except (OSError, UnicodeDecodeError) as e:
+            self.__reportError(importFile, 0, e)
+
+    ### Read Fleet Inventory File (one csv.reader Pass into the Inventory Compiler) ###
+    def __readInventoryFile(self, compiler, importFile):
+        try:
+            with open(importFile, 'r', encoding='UTF8', newline='') as csvfile:
+                for (lineNumber, error) in compiler.readInventory(importFile, csv.reader(csvfile)):
+                    self.__reportError(importFile, lineNumber, error)
+
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            self.__reportError(importFile, 0, e)
+
+    ### Add Value captured from a Device to Pending Values (Equals Value, once per Import) ###
+    def __addCapturedValue(self, importFile, lineNumber, descriptorClass, fieldName, value):
+
+        # Value already captured from another Device
+        key = (descriptorClass.DESCRIPTOR_TYPE, fieldName, value)
+        if (key in self.capturedValues):
+            return
+        self.capturedValues.add(key)
+
+        # Value Format & Length
+        field = descriptorClass.FIELD_REGISTRY[fieldName.casefold()]
+        try:
+            VerificationValue.checkValue(value, field.length, field.valueFormat)
+        except Exception as e:
+            self.__reportError(importFile, lineNumber, fieldName + ": " + str(e))
+            return
+
+        self.__addPendingValues((self.session.getDescriptor(descriptorClass.DESCRIPTOR_TYPE), field.name), [(value, self.IMPORT_CAPTURE_VERIF_LEVEL, VerificationOperatorEnum.EQUALS)], [(importFile, lineNumber)])
+
+    ### Parse Files (Parse Results of unchanged Files from the Policy Cache, Line-aligned Chunks of other Files parsed by the Process Pool) ###
+    ### Return: Generator of (Import File, Line Number, Command, Error)
+    def __parseFiles(self, importFiles):
+
+        # Files: List[(Import File, File Hash, cached Parse Results, Chunk Number)] & Chunks: List[(Import File, Start, End)]
+        files = []
+        chunks = []
+        for importFile in importFiles:
+            self.readFiles.append(importFile)
+
+            # Unchanged File (Parse Results from the Policy Cache)
+            (fileHash, results) = (None, None)
+            if (self.policyCache != None):
+                (fileHash, results) = self.policyCache.loadParsedFile(importFile)
+            if (results != None):
+                files.append((importFile, fileHash, results, 0))
+                continue
+
+            try:
+                fileChunks = VerificationImporter.__splitFile(importFile, self.IMPORT_CHUNK_SIZE)
+            except OSError as e:
+                self.__reportError(importFile, 0, e)
+                continue
+            files.append((importFile, fileHash, None, len(fileChunks)))
+            chunks.extend((importFile, start, end) for (start, end) in fileChunks)
+
+        # Parse Chunks (in order, in parallel when several Chunks)
+        if (len(chunks) > 1):
+            if (self.executor == None):
+                self.executor = ProcessPoolExecutor(max_workers=self.IMPORT_WORKER_NUMBER)
+            chunkResults = self.executor.map(VerificationImporter.parseChunk, *zip(*chunks))
+        else:
+            chunkResults = (VerificationImporter.parseChunk(*chunk) for chunk in chunks)
+
+        for (importFile, fileHash, results, chunkNumber) in files:
+
+            # Merge Chunk Results (absolute Line Numbers)
+            if (results == None):
+                results = []
+                lineOffset = 0
+                for (chunkLineCount, chunkResult) in itertools.islice(chunkResults, chunkNumber):
+                    results.extend((lineOffset + lineNumber, command, error) for (lineNumber, command, error) in chunkResult)
+                    lineOffset += chunkLineCount
+
+                # Store Parse Results (File Hash taken before Parsing)
+                if (fileHash != None):
+                    self.policyCache.storeParsedFile(importFile, fileHash, results)
+
+            for (lineNumber, command, error) in results:
+                self.lineCount += 1
+                yield (importFile, lineNumber, command, error)
+
+    ### Add Command Values to Pending Values ###
+    def __addPendingCommand(self, command, importFile, lineNumber):
+        key = (self.session.getDescriptor(command.descriptorType), command.field.name)
+
+        # Add Order: Batch Values per Descriptor Field
+        if (command.order == VerificationOrderEnum.ADD):
+            self.__addPendingValues(key, command.values, [(importFile, lineNumber)] * len(command.values))
+            return
+
+        # Remove Order of a Pending Value to Add: Insert the Batch first (Duplicate Values & Counts as in File Order)
+        valueOperators = self.pendingValueOperators.get(key, {})
+        for (value, operator) in command.values:
+            operators = valueOperators.get(value)
+            if (operators != None) and ((operator == None) or (operator in operators)):
+                self.__flushPendingValues()
+                break
+
+        # Remove Order: Batch Values per Descriptor Field
+        self.pendingRemoveValues.setdefault(key, []).extend(command.values)
+        self.pendingValueCount += len(command.values)
+
+        # Batch Full
+        if (self.pendingValueCount >= self.IMPORT_BATCH_SIZE):
+            self.__flushPendingValues()
+
+    ### Add verified Values to Pending Values ###
+    def __addPendingValues(self, key, values, locations):
+        self.pendingValues.setdefault(key, []).extend(values)
+        self.pendingLocations.setdefault(key, []).extend(locations)
+        valueOperators = self.pendingValueOperators.setdefault(key, {})
+        for el in values:
+            valueOperators.setdefault(el[0], set()).add(el[2])
+        self.pendingValueCount += len(values)
+
+        # Batch Full
+        if (self.pendingValueCount >= self.IMPORT_BATCH_SIZE):
+            self.__flushPendingValues()
+
+    ### Insert Pending Values (one Bulk Remove, then one Bulk Add per Descriptor Field) ###
+    ### Same Result as File Order: Values to Remove apply to the Values before the Batch (a Remove of a Pending Value flushes the Batch first)
+    def __flushPendingValues(self):
+        pendingValues = self.pendingValues
+        pendingLocations = self.pendingLocations
+        pendingRemoveValues = self.pendingRemoveValues
+        self.__clearPendingValues()
+
+        # Remove Values (Values before the Batch)
+        for (descriptor, usbField) in pendingRemoveValues:
+            self.removedValueCount += descriptor.deleteVerificationValues(usbField, pendingRemoveValues[(descriptor, usbField)])
+
+        for (descriptor, usbField) in pendingValues:
+            locations = pendingLocations[(descriptor, usbField)]
+
+            # Add Valid Values & Report Invalid Values
+            valueCount = sum(descriptor.operatorValueCount.values())
+            errors = descriptor.addVerificationValues(usbField, pendingValues[(descriptor, usbField)], skipInvalidValues=True, verifiedValues=True)[0]
+            self.addedValueCount += sum(descriptor.operatorValueCount.values()) - valueCount
+            for (position, error) in errors:
+                (importFile, lineNumber) = locations[position]
+                self.__reportError(importFile, lineNumber, error)
+
+    ### Parse exported Verification Value Row ###
+    ### Return: Add Verification Command (one Value)
+    def __parseValueRow(descriptor, row):
+
+        # Value Row in Descriptor Section
+        if (descriptor == None):
+            raise Exception("Verification Value outside of USB Descriptor section !")
+
+        if (len(row) != 4):
+            raise Exception("Wrong column number " + str(len(row)) + " ! Must be: USB Field, Operator, Value, Verification Level")
+        (fieldName, operatorName, value, levelName) = row
+
+        # USB Field
+        field = descriptor.FIELD_REGISTRY.get(fieldName.casefold())
+        if (field == None):
+            raise Exception("Unkown " + descriptor.DESCRIPTOR_NAME + " Field: " + fieldName)
+
+        # Operator & Verification Level (exported Enum Names)
+        operator = VerificationOperatorEnum.__members__.get(operatorName.upper())
+        if (operator == None):
+            raise Exception("Wrong Operator " + operatorName + " ! Must be one of: " + VerificationOperatorEnum.getVerificationOperatorEnumDetails())
+
+        level = VerificationLevelEnum.__members__.get(levelName.upper())
+        if (level == None):
+            raise Exception("Wrong Verification Level " + levelName + " ! Must be one of: " + VerificationLevelEnum.getVerificationLevelEnumDetails())
+
+        # Value
+        VerificationValue.checkValue(value, field.length, field.valueFormat, operator)
+
+        return VerificationCommand(VerificationOrderEnum.ADD, descriptor.DESCRIPTOR_TYPE, field, [(value, level, operator)])
+
+    ### Parse JSON Policy Rule {"operator": Operator, "value": Value, "level": Verification Level (optional, Mandatory by default)} ###
+    ### Return: (Value, Verification Level, Operator)
+    def __parsePolicyRule(rule):
+
+        # Rule Object
+        if (isinstance(rule, dict) == False):
+            raise Exception("Rule must be an object with operator, value & level !")
+
+        unknownKeys = rule.keys() - {VerificationImporter.IMPORT_POLICY_RULE_OPERATOR, VerificationImporter.IMPORT_POLICY_RULE_VALUE, VerificationImporter.IMPORT_POLICY_RULE_LEVEL}
+        if (len(unknownKeys) != 0):
+            raise Exception("Unexpected Rule key " + ", ".join(sorted(unknownKeys)) + " !")
+
+        # Operator & Verification Level (Aliases of Command Language)
+        operator = rule.get(VerificationImporter.IMPORT_POLICY_RULE_OPERATOR)
+        if (isinstance(operator, str) == False):
+            raise Exception("Missing Rule operator !")
+        operator = VerificationOperatorEnum.getVerificationOperatorEnum(operator)
+
+        level = rule.get(VerificationImporter.IMPORT_POLICY_RULE_LEVEL, VerificationLevelEnum.MANDATORY.value[1])
+        if (isinstance(level, str) == False):
+            raise Exception("Rule level must be a string !")
+        level = VerificationLevelEnum.getVerificationLevelEnum(level)
+
+        # Value (String, or Integer for Number Fields)
+        value = rule.get(VerificationImporter.IMPORT_POLICY_RULE_VALUE)
+        if (isinstance(value, int) == True) and (isinstance(value, bool) == False):
+            value = str(value)
+        if (isinstance(value, str) == False):
+            raise Exception("Missing Rule value !")
+
+        return (value, level, operator)
+
+    ### Split File in Line-aligned Chunks ###
+    ### Return: List of (Start, End) Byte Offsets
+    def __splitFile(importFile, chunkSize):
+        chunks = []
+
+        with open(importFile, 'rb') as file:
+            fileSize = os.fstat(file.fileno()).st_size
+            start = 0
+            while (start < fileSize):
+
+                # Chunk End on next Line End
+                file.seek(min(start + chunkSize, fileSize))
+                file.readline()
+                end = min(file.tell(), fileSize)
+
+                chunks.append((start, end))
+                start = end
+
+        return chunks
+
+    ### Get Import Summary (since a previous Import Summary) ###
+    ### Return: (Line Count, Added Value Count, Removed Value Count, Duplicate Value Count, [(Import File, Line Number, Error)])
+    def __getSummary(self, previousSummary=(0, 0, 0, 0, ())):
+        return (
+            self.lineCount - previousSummary[0],
+            self.addedValueCount - previousSummary[1],
+            self.removedValueCount - previousSummary[2],
+            self.duplicateValueCount - previousSummary[3],
+            [(importFile, lineNumber, str(error)) for (importFile, lineNumber, error) in self.errors[len(previousSummary[4]):]]
+        )
+
+    ### Add Import Summary ###
+    def __addSummary(self, summary):
+        self.lineCount += summary[0]
+        self.addedValueCount += summary[1]
+        self.removedValueCount += summary[2]
+        self.duplicateValueCount += summary[3]
+        self.errors.extend(summary[4])
+
+    ### Clear Pending Values ###
+    def __clearPendingValues(self):
+        self.pendingValues = {}
+        self.pendingLocations = {}
+        self.pendingValueOperators = {}
+        self.pendingRemoveValues = {}
+        self.pendingValueCount = 0
+
+    ### Report Import Error (raised in Fail Fast Mode) ###
+    def __reportError(self, importFile, lineNumber, error):
+        if (self.importMode == ImportModeEnum.FAIL_FAST):
+            raise Exception(importFile + ":" + str(lineNumber) + ": " + str(error) + " (Import cancelled)")
+
+        self.errors.append((importFile, lineNumber, error))
@@ -35,14 +35,21 @@ class VerificationLevelEnum(Enum):
     
     ### Get Verification Level Enum from User Value ###
     def getVerificationLevelEnum(userValue):
-        selectedVerificationLevel = ""
 
-        for level in VerificationLevelEnum:
-            if (userValue.casefold() in level.value):
-                selectedVerificationLevel = level
-                break
+        # Already a Verification Level
+        if (isinstance(userValue, VerificationLevelEnum)):
+            return userValue
 
-        if (selectedVerificationLevel == ""):
+        # Alias Lookup (Alias Table built once)
+        selectedVerificationLevel = VERIFICATION_LEVEL_ALIASES.get(userValue.casefold())
+
+        if (selectedVerificationLevel == None):
             raise Exception("Wrong Verification Level " + str(userValue) + " ! Must be one of: " + VerificationLevelEnum.getVerificationLevelEnumDetails())
 
         return selectedVerificationLevel
+
+# Verification Level Aliases {Casefolded Alias: Verification Level} (built once at import)
+VERIFICATION_LEVEL_ALIASES = {}
+for el in VerificationLevelEnum:
+    for alias in el.value:
+        VERIFICATION_LEVEL_ALIASES.setdefault(alias.casefold(), el)
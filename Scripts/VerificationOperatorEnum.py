@@ -18,6 +18,7 @@ class VerificationOperatorEnum(Enum):
     ENDSWITH = ["EndsWith", "ew"]
     CONTAINS = ["Contains", "c"]
     NOT_CONTAINS = ["NotContains", "not contains", "nc"]
+    BETWEEN = ["Between", "bt", "range"]
 
     ##########################################
     ## Public Verification Operator Methods ##
@@ -59,14 +60,21 @@ class VerificationOperatorEnum(Enum):
 
     ### Get Verification Operator Enum from User Value ###
     def getVerificationOperatorEnum(userValue):
-        selectedOperator = ""
 
-        for op in VerificationOperatorEnum:
-            if (userValue.casefold() in [el.casefold() for el in op.value]):
-                selectedOperator = op
-                break
+        # Already a Verification Operator
+        if (isinstance(userValue, VerificationOperatorEnum)):
+            return userValue
 
-        if (selectedOperator == ""):
+        # Alias Lookup (Alias Table built once)
+        selectedOperator = VERIFICATION_OPERATOR_ALIASES.get(userValue.casefold())
+
+        if (selectedOperator == None):
             raise Exception("Wrong Operator " + str(userValue) + " ! Must be one of: " + VerificationOperatorEnum.getVerificationOperatorEnumDetails())
 
         return selectedOperator
+
+# Verification Operator Aliases {Casefolded Alias: Verification Operator} (built once at import)
+VERIFICATION_OPERATOR_ALIASES = {}
+for el in VerificationOperatorEnum:
+    for alias in el.value:
+        VERIFICATION_OPERATOR_ALIASES.setdefault(alias.casefold(), el)
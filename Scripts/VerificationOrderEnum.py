@@ -11,8 +11,13 @@ class VerificationOrderEnum(Enum):
     ADD = ["add", "a"]
     REMOVE = ["remove", "rm", "r"]
     IMPORT = ["import", "imp", "i"]
+    IMPORT_INVENTORY = ["import-inventory", "inventory", "inv"]
+    INCLUDE = ["include", "inc"]
     EXPORT = ["export", "exp", "e"]
     SUMMARY = ["summary", "sum", "s"]
+    SNAPSHOT = ["snapshot", "snap"]
+    ROLLBACK = ["rollback", "rb"]
+    DIFF = ["diff", "d"]
     HELP = ["help", "hint", "h"]
     QUIT = ["quit", "exit", "q"]
 
@@ -29,14 +34,21 @@ class VerificationOrderEnum(Enum):
 
     ### Get Verification Order Enum from User Value ###
     def getVerificationOrderEnum(userValue):
-        selectedOrder = ""
 
-        for order in VerificationOrderEnum:
-            if (userValue.casefold() in order.value):
-                selectedOrder = order
-                break
+        # Already a Verification Order
+        if (isinstance(userValue, VerificationOrderEnum)):
+            return userValue
 
-        if (selectedOrder == ""):
+        # Alias Lookup (Alias Table built once)
+        selectedOrder = VERIFICATION_ORDER_ALIASES.get(userValue.casefold())
+
+        if (selectedOrder == None):
             raise Exception("Wrong Order " + str(userValue) + " ! Must be one of: " + VerificationOrderEnum.getVerificationOrderEnumDetails())
 
         return selectedOrder
+
+# Verification Order Aliases {Casefolded Alias: Verification Order} (built once at import)
+VERIFICATION_ORDER_ALIASES = {}
+for el in VerificationOrderEnum:
+    for alias in el.value:
+        VERIFICATION_ORDER_ALIASES.setdefault(alias.casefold(), el)
@@ -0,0 +1,169 @@
+########################################################################
+## Engineer:    Dalmasso Loic
+## Create Date: 18/10/2026
+## Module Name: VerificationSession
+## Description: USB Verification Session Class (Descriptors of one Policy)
+########################################################################
+
+# Verification Operator
+from VerificationOperatorEnum import VerificationOperatorEnum
+
+# USB Descriptors
+from DeviceDescriptor import DeviceDescriptor
+from ConfigurationDescriptor import ConfigurationDescriptor
+from InterfaceDescriptor import InterfaceDescriptor
+from HIDDescriptor import HIDDescriptor
+from EndpointDescriptor import EndpointDescriptor
+from DeviceQualifierDescriptor import DeviceQualifierDescriptor
+from OtherSpeedDescriptor import OtherSpeedDescriptor
+
+class VerificationSession:
+
+    ####################################
+    ## Verification Session Variables ##
+    ####################################
+
+    # USB Descriptors
+    deviceDescriptor = None
+    configurationDescriptor = None
+    interfaceDescriptor = None
+    hidDescriptor = None
+    endpointDescriptor = None
+    deviceQualifierDescriptor = None
+    otherSpeedDescriptor = None
+
+    # Exported Values Status
+    requiredExportValue = False
+
+    # Policy Snapshots {Snapshot Name: [Descriptor Snapshot]}
+    snapshots = None
+
+    #########################################
+    ## Public Verification Session Methods ##
+    #########################################
+
+    ### Constructor (Empty Policy, optional Columnar Value Store & Duplicate Values Rejection) ###
+    def __init__(self, columnarStore=False, rejectDuplicates=True):
+        self.deviceDescriptor = DeviceDescriptor(columnarStore, rejectDuplicates)
+        self.configurationDescriptor = ConfigurationDescriptor(columnarStore, rejectDuplicates)
+        self.interfaceDescriptor = InterfaceDescriptor(columnarStore, rejectDuplicates)
+        self.hidDescriptor = HIDDescriptor(columnarStore, rejectDuplicates)
+        self.endpointDescriptor = EndpointDescriptor(columnarStore, rejectDuplicates)
+        self.deviceQualifierDescriptor = DeviceQualifierDescriptor(columnarStore, rejectDuplicates)
+        self.otherSpeedDescriptor = OtherSpeedDescriptor(columnarStore, rejectDuplicates)
+        self.requiredExportValue = False
+        self.snapshots = {}
+
+    ### Get all Descriptors (Export Order) ###
+    def getDescriptors(self):
+        return [
+            self.deviceDescriptor,
+            self.configurationDescriptor,
+            self.interfaceDescriptor,
+            self.hidDescriptor,
+            self.endpointDescriptor,
+            self.deviceQualifierDescriptor,
+            self.otherSpeedDescriptor
+        ]
+
+    ### Get Duplicate Values Summary of all Descriptors ###
+    ### Return: (Duplicate Value Count, Duplicate Memory Rows, Largest Verification Number with Duplicates, Largest Verification Number without Duplicates)
+    def getDuplicateSummary(self):
+        duplicateValueCount = 0
+        duplicateMemoryRows = 0
+        largestVerifNumberWithDuplicates = 1
+        largestVerifNumberWithoutDuplicates = 1
+
+        for descriptor in self.getDescriptors():
+            (count, memoryRows) = descriptor.getDuplicateSummary()
+            duplicateValueCount += count
+            duplicateMemoryRows += memoryRows
+            largestVerifNumberWithDuplicates = descriptor.getLargestVerificationNumberWithDuplicates(largestVerifNumberWithDuplicates)
+            largestVerifNumberWithoutDuplicates = descriptor.getLargestVerificationNumberWithoutDuplicates(largestVerifNumberWithoutDuplicates)
+
+        return (duplicateValueCount, duplicateMemoryRows, largestVerifNumberWithDuplicates, largestVerifNumberWithoutDuplicates)
+
+    ### Save Policy State (Copy-on-Write) ###
+    ### Return: [Descriptor Snapshot]
+    def saveState(self):
+        return [descriptor.createSnapshot() for descriptor in self.getDescriptors()]
+
+    ### Restore Policy State (Copy-on-Write) ###
+    def restoreState(self, state):
+        for (descriptor, snapshot) in zip(self.getDescriptors(), state):
+            descriptor.restoreSnapshot(snapshot)
+
+    ### Pack Policy State (JSON State to store) ###
+    ### Return: [Packed Descriptor Snapshot]
+    def packState(self, state):
+        return [descriptor.packSnapshot(snapshot) for (descriptor, snapshot) in zip(self.getDescriptors(), state)]
+
+    ### Unpack Policy State (stored with packState, malformed State raises an Exception) ###
+    ### Return: [Descriptor Snapshot]
+    def unpackState(self, packedState):
+        if (len(packedState) != len(self.getDescriptors())):
+            raise Exception("Wrong packed Policy State !")
+        return [descriptor.unpackSnapshot(packedSnapshot) for (descriptor, packedSnapshot) in zip(self.getDescriptors(), packedState)]
+
+    ### Create Policy Snapshot (Copy-on-Write) ###
+    def createSnapshot(self, snapshotName):
+        self.snapshots[snapshotName] = self.saveState()
+
+    ### Rollback Policy to Snapshot ###
+    def rollbackSnapshot(self, snapshotName):
+        self.restoreState(self.getSnapshot(snapshotName))
+
+    ### Compare Policy with Snapshot ###
+    ### Return: (Snapshot Policy Metrics, Current Policy Metrics, [ [Descriptor Name, USB Field, Change (+/-), Operator, Value, Verification Level] ])
+    def diffSnapshot(self, snapshotName):
+        snapshots = self.getSnapshot(snapshotName)
+
+        # Verification Value Changes
+        changes = []
+        for (descriptor, snapshot) in zip(self.getDescriptors(), snapshots):
+            for el in descriptor.diffSnapshot(snapshot):
+                changes.append([descriptor.DESCRIPTOR_NAME] + el)
+
+        # Current Policy Metrics
+        currentState = self.saveState()
+        currentMetrics = self.getPolicyMetrics()
+
+        # Snapshot Policy Metrics (then back to Current Policy)
+        self.restoreState(snapshots)
+        snapshotMetrics = self.getPolicyMetrics()
+        self.restoreState(currentState)
+
+        return (snapshotMetrics, currentMetrics, changes)
+
+    ### Get Policy Snapshot from Snapshot Name ###
+    def getSnapshot(self, snapshotName):
+        if (snapshotName not in self.snapshots):
+            raise Exception("Unknown Snapshot " + str(snapshotName) + " ! Must be one of: " + ", ".join(self.snapshots))
+        return self.snapshots[snapshotName]
+
+    ### Get Verification Value Number of all Descriptors ###
+    def getVerificationValueNumber(self):
+        return sum(sum(descriptor.operatorValueCount.values()) for descriptor in self.getDescriptors())
+
+    ### Get Policy Metrics ###
+    ### Return: (Dict {Operator: Memory Rows}, Largest Verification Number)
+    def getPolicyMetrics(self):
+        memoryRows = {}
+        largestVerifNumber = 1
+
+        for descriptor in self.getDescriptors():
+            for op in VerificationOperatorEnum:
+                memoryRows[op] = memoryRows.get(op, 0) + sum(rows for (usbField, rows) in descriptor.countPerOperator(op))
+            largestVerifNumber = descriptor.getLargestVerificationNumber(largestVerifNumber)
+
+        return (memoryRows, largestVerifNumber)
+
+    ### Get Descriptor from Descriptor Name ###
+    def getDescriptor(self, userInputValue):
+
+        for descriptor in self.getDescriptors():
+            if (descriptor.isRequestedDescriptor(userInputValue)):
+                return descriptor
+
+        # No Descriptor
+        raise Exception("Unkown USB Descriptor with name " + str(userInputValue))
@@ -7,10 +7,12 @@
 
 import re
 import math
+import functools
 
 from FieldFormatEnum import FieldFormatEnum
 from VerificationLevelEnum import VerificationLevelEnum
 from VerificationOperatorEnum import VerificationOperatorEnum
+from StringInterningPool import StringInterningPool
 
 class VerificationValue:
 
@@ -31,6 +33,12 @@ class VerificationValue:
     # Memory Total Width
     MEM_TOTAL_WIDTH = MEM_VALUE_PART_NUMBER_BIT_LENGTH + MEM_DATA_WIDTH_BIT + MEM_DATA_QUARTET_ENABLE_BIT_LENGTH + MEM_VERIF_LEVEL_BIT_LENGTH
 
+    # Range Memory Total Width (Between Operator: High & Low Expected Values)
+    MEM_RANGE_TOTAL_WIDTH = MEM_TOTAL_WIDTH + MEM_DATA_WIDTH_BIT
+
+    # Range Value Separator (Between Operator: Low..High)
+    RANGE_SEPARATOR = ".."
+
     # Memory Value Part Number Format
     MEM_VALUE_PART_NUMBER_BIT_LENGTH_FORMAT = '0' + str(MEM_VALUE_PART_NUMBER_BIT_LENGTH) + 'b'
 
@@ -56,6 +64,9 @@ class VerificationValue:
     # Operator Watchdog Limit
     OPERATOR_WATCHDOG_LIMIT_PER_VERIF = 18
 
+    # Memory Configuration Cache Size (Encoded Values shared by all Verification Values)
+    MEM_CONFIG_CACHE_SIZE = 262144
+
     # Operator Enable/Disable
     OPERATOR_ENABLE = ["ENABLE", '1']
     OPERATOR_DISABLE = ["DISABLE", '0']
@@ -83,10 +94,15 @@ class VerificationValue:
     ### Constructor (All Args) ###
     def __init__(self, value, maxValueLength, valueFormat, verificationLevel, operator):
 
+        # Operator
+        operator = VerificationOperatorEnum.getVerificationOperatorEnum(operator)
+
         # Check Value & Format
-        self.__checkValue(maxValueLength, valueFormat, value)
+        self.__checkValue(maxValueLength, valueFormat, value, operator)
 
-        # Construct Verification Value
+        # Construct Verification Value (String Values are interned)
+        if (valueFormat == FieldFormatEnum.STRING):
+            value = StringInterningPool.internString(value)
         self.value = value
         self.valueFormat = valueFormat
 
@@ -97,7 +113,7 @@ class VerificationValue:
             self.verificationLevel = VerificationLevelEnum.MANDATORY
 
         # Operator
-        self.operator = VerificationOperatorEnum.getVerificationOperatorEnum(operator)
+        self.operator = operator
 
     ### Display Verification Value ###
     def showDetails(self):
@@ -124,28 +140,84 @@ class VerificationValue:
             case _:
                 raise Exception("Unknown Field Format !")
 
+    ### Get Value Part Numbers (same as Memory Configuration, without conversion) ###
+    ### Return: List of Value Part Number
+    def getValuePartNumbers(self):
+
+        # Value Part Number Count
+        partNumberCount = self.getMemoryUsage()
+
+        # Check Operator
+        if (self.operator == VerificationOperatorEnum.ENDSWITH):
+
+            # Number & Hex Value Part Number (always Value Part Number -1)
+            if (self.valueFormat != FieldFormatEnum.STRING):
+                return [-1]
+
+            # String Value Part Number (Negative Order)
+            firstPartNumber = -(partNumberCount-1)
+
+        # Value Part Number (Positive Order)
+        else:
+            firstPartNumber = 0
+
+        return list(range(firstPartNumber, firstPartNumber + partNumberCount))
+
     ### Convert Verification Value to Memory Configuration ###
     ### Return: List of (Value Part Number, Verification Level, Converted Data Value, Quartet Enable)
     def convertToMemConfig(self):
 
-        # Value Format
-        match self.valueFormat:
-            case FieldFormatEnum.NUMBER:
-                return self.__convertNumberValue()
+        # Encoded once per (Value, Format, Operator, Level), a mutated Value uses a new Cache Key
+        return list(VerificationValue.__getMemConfig(self.value, self.valueFormat, self.operator, self.verificationLevel))
 
-            case FieldFormatEnum.HEX:
-                return self.__convertHexValue()
-
-            case FieldFormatEnum.STRING:
-                return self.__convertStringValue()
-
-            case _:
-                raise Exception("Unknown Field Format !")
+    ### Get Normalized Value (Memory Configuration Rows, same ROM Rows when equal) ###
+    ### Return: Tuple of (Value Part Number, Verification Level, Converted Data Value, Quartet Enable)
+    def getNormalizedValue(self):
+        return VerificationValue.__getMemConfig(self.value, self.valueFormat, self.operator, self.verificationLevel)
 
     ##############################################
     ## Public Static Verification Value Methods ##
     ##############################################
 
+    ### Create Verification Value from an already verified Value (Level & Operator Enums, no Check) ###
+    def fromVerifiedValue(value, valueFormat, verificationLevel, operator):
+        verificationValue = VerificationValue.__new__(VerificationValue)
+        verificationValue.value = value
+        verificationValue.valueFormat = valueFormat
+        verificationValue.verificationLevel = verificationLevel
+        verificationValue.operator = operator
+        return verificationValue
+
+    ### Verify User Value Format & Length (without creating a Verification Value) ###
+    def checkValue(value, maxValueLength, valueFormat, operator=None):
+        VerificationValue.__new__(VerificationValue).__checkValue(maxValueLength, valueFormat, value, operator)
+
+    ### Verify Values Format & Length (one Pass over all Values, per Value Errors only when some Values are invalid) ###
+    ### Operators Input: List of Operator per Value (optional)
+    ### Return: List[(Value Position, Error)]
+    def checkValues(values, maxValueLength, valueFormat, operators=None):
+
+        # No Operator per Value
+        if (operators == None):
+            operators = [None] * len(values)
+
+        # All Values valid (Range Values always checked one by one)
+        if (VerificationOperatorEnum.BETWEEN not in operators) and (VerificationValue.__checkAllValues(values, maxValueLength, valueFormat) == True):
+            return []
+
+        # Errors of invalid Values
+        errors = []
+        for (position, (value, operator)) in enumerate(zip(values, operators)):
+            try:
+                VerificationValue.checkValue(value, maxValueLength, valueFormat, operator)
+            except Exception as e:
+                errors.append((position, e))
+        return errors
+
+    ### Clear Memory Configuration Cache ###
+    def clearMemConfigCache():
+        VerificationValue.__getMemConfig.cache_clear()
+
     ### Get Operator Watchdog Limit ###
     def getOperatorWatchdogLimit():
         return VerificationValue.OPERATOR_WATCHDOG_LIMIT_PER_VERIF
@@ -174,12 +246,25 @@ class VerificationValue:
     def getMemoryDisableFieldLogic():
         return VerificationValue.MEM_DISABLE_FIELD[1]
 
+    ### Get Memory Width (Range Memory for Between Operator) ###
+    def getMemoryWidth(operator):
+        if (VerificationOperatorEnum.getVerificationOperatorEnum(operator) == VerificationOperatorEnum.BETWEEN):
+            return VerificationValue.MEM_RANGE_TOTAL_WIDTH
+        return VerificationValue.MEM_TOTAL_WIDTH
+
     ### Get Memory File Header ###
     def getMemoryHeader(operatorName, depth):
+
+        # Expected Value Format (Range Memory: High & Low Expected Values)
+        if (VerificationValue.getMemoryWidth(operatorName) == VerificationValue.MEM_RANGE_TOTAL_WIDTH):
+            expectedValueFormat = "High Expected Value (" + str(VerificationValue.MEM_DATA_WIDTH_BIT) + " bits) - Low Expected Value (" + str(VerificationValue.MEM_DATA_WIDTH_BIT) + " bits)"
+        else:
+            expectedValueFormat = "Expected Value (" + str(VerificationValue.MEM_DATA_WIDTH_BIT) + " bits)"
+
         return \
             "; Memory Configuration - " + operatorName + " Operator\n" + \
-            "; Memory Row Format: Value Part Number (" + str(VerificationValue.MEM_VALUE_PART_NUMBER_BIT_LENGTH) + " bits) - Expected Value (" + str(VerificationValue.MEM_DATA_WIDTH_BIT) + " bits) - Value Quartet Enable (" + str(VerificationValue.MEM_DATA_QUARTET_ENABLE_BIT_LENGTH) + " bits) - Mandatory Level (" + str(VerificationValue.MEM_VERIF_LEVEL_BIT_LENGTH) + " bit)\n" + \
-            "; Memory Format: Depth=" + str(depth) + ", Width=" + str(VerificationValue.MEM_TOTAL_WIDTH) + " bits\n" + \
+            "; Memory Row Format: Value Part Number (" + str(VerificationValue.MEM_VALUE_PART_NUMBER_BIT_LENGTH) + " bits) - " + expectedValueFormat + " - Value Quartet Enable (" + str(VerificationValue.MEM_DATA_QUARTET_ENABLE_BIT_LENGTH) + " bits) - Mandatory Level (" + str(VerificationValue.MEM_VERIF_LEVEL_BIT_LENGTH) + " bit)\n" + \
+            "; Memory Format: Depth=" + str(depth) + ", Width=" + str(VerificationValue.getMemoryWidth(operatorName)) + " bits\n" + \
             "MEMORY_INITIALIZATION_RADIX=2;\n" + \
             "MEMORY_INITIALIZATION_VECTOR=\n"
 
@@ -194,7 +279,7 @@ class VerificationValue:
         memoryValues = []
         for el in memoryConfigValues:
             
-            # Converted Memory Value Format: Value Part Number (8 bits) - Expected Value (24 bits) - Quartet Enable (6 bits) - Mandatory Level (1 bit)
+            # Converted Memory Value Format: Value Part Number (8 bits) - Expected Value (24 bits, High & Low Expected Values for Range) - Quartet Enable (6 bits) - Mandatory Level (1 bit)
             convertedMemoryValue = format(abs(el[0]), VerificationValue.MEM_VALUE_PART_NUMBER_BIT_LENGTH_FORMAT) + el[2] + el[3] + str(el[1])
 
             # Add Converted Memory Value
@@ -207,8 +292,35 @@ class VerificationValue:
     ## Private Verification Value Methods ##
     ########################################
 
+    ### Get Memory Configuration (Cached) ###
+    ### Return: Tuple of (Value Part Number, Verification Level, Converted Data Value, Quartet Enable)
+    @staticmethod
+    @functools.lru_cache(maxsize=MEM_CONFIG_CACHE_SIZE)
+    def __getMemConfig(value, valueFormat, operator, verificationLevel):
+        verificationValue = VerificationValue.fromVerifiedValue(value, valueFormat, verificationLevel, operator)
+
+        # Value Format
+        match valueFormat:
+            case FieldFormatEnum.NUMBER:
+                return tuple(verificationValue.__convertNumberValue())
+
+            case FieldFormatEnum.HEX:
+                return tuple(verificationValue.__convertHexValue())
+
+            case FieldFormatEnum.STRING:
+                return tuple(verificationValue.__convertStringValue())
+
+            case _:
+                raise Exception("Unknown Field Format !")
+
     ### Verify User Value Format & Length ###
-    def __checkValue(self, maxValueLength, valueFormat, value):
+    def __checkValue(self, maxValueLength, valueFormat, value, operator=None):
+
+        # Range Value (Between Operator)
+        if (operator == VerificationOperatorEnum.BETWEEN):
+            self.__checkRangeValue(maxValueLength, valueFormat, value)
+            return
+
         match valueFormat:
             case FieldFormatEnum.NUMBER:
                 self.__checkNumberValue(maxValueLength, value)
@@ -244,6 +356,32 @@ class VerificationValue:
         if (len(value) > maxValueLength):
             raise Exception("Wrong value Length of " + str(len(value)) + " ! Must be up to " + str(maxValueLength) + " HEX characters")
 
+    ### Verify Range Value (Low..High) ###
+    def __checkRangeValue(self, maxValueLength, valueFormat, value):
+
+        # Verify Value Format (Number & Hex only)
+        if (valueFormat == FieldFormatEnum.STRING):
+            raise Exception("Wrong Operator for STRING value ! Between only applies on NUMBER & HEX values")
+
+        # Verify Range Format
+        bounds = value.split(self.RANGE_SEPARATOR)
+        if (len(bounds) != 2):
+            raise Exception("Wrong range Format " + str(value) + " ! Must be: Low" + self.RANGE_SEPARATOR + "High")
+        (lowValue, highValue) = bounds
+
+        # Verify each Bound
+        self.__checkValue(maxValueLength, valueFormat, lowValue)
+        self.__checkValue(maxValueLength, valueFormat, highValue)
+
+        # Verify Bound Lengths (same Quartets compared)
+        if (valueFormat == FieldFormatEnum.HEX) and (len(lowValue) != len(highValue)):
+            raise Exception("Wrong range " + str(value) + " ! Low & High HEX values must have the same Length")
+
+        # Verify Bound Order
+        base = 16 if (valueFormat == FieldFormatEnum.HEX) else 10
+        if (int(lowValue, base) > int(highValue, base)):
+            raise Exception("Wrong range " + str(value) + " ! Low value must be lower or equal to High value")
+
     ### Verify String Value ###
     def __checkStringValue(self, maxValueLength, value):
         
@@ -267,8 +405,12 @@ class VerificationValue:
         # Verification Level
         verifLevel = VerificationLevelEnum.getVerificationLevelMemValue(self.verificationLevel)
 
-        # Converted Data Value
-        convertedDataValue = format(int(self.value), self.MEM_DATA_BIT_LENGTH_FORMAT)
+        # Converted Data Value (Range: High & Low Expected Values)
+        if (self.operator == VerificationOperatorEnum.BETWEEN):
+            (lowValue, highValue) = self.value.split(self.RANGE_SEPARATOR)
+            convertedDataValue = format(int(highValue), self.MEM_DATA_BIT_LENGTH_FORMAT) + format(int(lowValue), self.MEM_DATA_BIT_LENGTH_FORMAT)
+        else:
+            convertedDataValue = format(int(self.value), self.MEM_DATA_BIT_LENGTH_FORMAT)
 
         # Quartet Enable (always All Quartet Enable)
         quartetEnable = self.MEM_QUARTET_6_ENABLE
@@ -291,12 +433,17 @@ class VerificationValue:
         # Verification Level
         verifLevel = VerificationLevelEnum.getVerificationLevelMemValue(self.verificationLevel)
 
-        # Converted Data Value
-        convertedDataValue = format(int(str(self.value), 16), self.MEM_DATA_BIT_LENGTH_FORMAT)
+        # Converted Data Value (Range: High & Low Expected Values)
+        if (self.operator == VerificationOperatorEnum.BETWEEN):
+            (value, highValue) = self.value.split(self.RANGE_SEPARATOR)
+            convertedDataValue = format(int(highValue, 16), self.MEM_DATA_BIT_LENGTH_FORMAT) + format(int(value, 16), self.MEM_DATA_BIT_LENGTH_FORMAT)
+        else:
+            value = self.value
+            convertedDataValue = format(int(str(value), 16), self.MEM_DATA_BIT_LENGTH_FORMAT)
 
         # Quartet Enable
         # Check Value Length
-        match (len(self.value)):
+        match (len(value)):
             
             # Hex Value on 0 quartet: not allowed
             # Hex Value on 1 quartet
@@ -344,31 +491,10 @@ class VerificationValue:
         else:
             valuePartNumber = 0
 
-        # Convert each String Part
+        # Convert each String Part (encoded once per Export in the String Interning Pool)
         result = []
         for part in stringPart:
-
-            # Check String Part Length:
-            match (len(part)):
-
-                # String Value on 0 character: not allowed
-                # String Value on 1 character (Padding + 2 x 4bits)
-                case 1:
-                    # Converted Data Value
-                    convertedDataValue = "0000000000000000" + ''.join(format(ord(char), self.MEM_STRING_CHAR_BIT_LENGTH_FORMAT) for char in part)
-                    quartetEnable = self.MEM_QUARTET_2_ENABLE
-
-                # String Value on 2 characters (Padding + 4 x 4bits)
-                case 2:
-                    # Converted Data Value
-                    convertedDataValue = "00000000" + ''.join(format(ord(char), self.MEM_STRING_CHAR_BIT_LENGTH_FORMAT) for char in part)
-                    quartetEnable = self.MEM_QUARTET_4_ENABLE
-
-                # String Value on 3 characters (6 x 4bits)
-                case _:
-                    # Converted Data Value
-                    convertedDataValue = ''.join(format(ord(char), self.MEM_STRING_CHAR_BIT_LENGTH_FORMAT) for char in part)
-                    quartetEnable = self.MEM_QUARTET_6_ENABLE
+            (convertedDataValue, quartetEnable) = StringInterningPool.internEncodedChunk(part, VerificationValue.__encodeStringChunk)
 
             # Append Result
             result.append((valuePartNumber, int(verifLevel), convertedDataValue, quartetEnable))
@@ -378,3 +504,57 @@ class VerificationValue:
 
         # Converted String
         return result
+
+    ### Encode String Part to Memory Data Value ###
+    ### Return: (Converted Data Value, Quartet Enable)
+    def __encodeStringChunk(part):
+
+        # Check String Part Length:
+        match (len(part)):
+
+            # String Value on 0 character: not allowed
+            # String Value on 1 character (Padding + 2 x 4bits)
+            case 1:
+                # Converted Data Value
+                convertedDataValue = "0000000000000000" + ''.join(format(ord(char), VerificationValue.MEM_STRING_CHAR_BIT_LENGTH_FORMAT) for char in part)
+                quartetEnable = VerificationValue.MEM_QUARTET_2_ENABLE
+
+            # String Value on 2 characters (Padding + 4 x 4bits)
+            case 2:
+                # Converted Data Value
+                convertedDataValue = "00000000" + ''.join(format(ord(char), VerificationValue.MEM_STRING_CHAR_BIT_LENGTH_FORMAT) for char in part)
+                quartetEnable = VerificationValue.MEM_QUARTET_4_ENABLE
+
+            # String Value on 3 characters (6 x 4bits)
+            case _:
+                # Converted Data Value
+                convertedDataValue = ''.join(format(ord(char), VerificationValue.MEM_STRING_CHAR_BIT_LENGTH_FORMAT) for char in part)
+                quartetEnable = VerificationValue.MEM_QUARTET_6_ENABLE
+
+        return (convertedDataValue, quartetEnable)
+
+    ### Verify all Values Format & Length at once (Values joined for one Pattern Match) ###
+    ### Return: True if all Values are valid
+    def __checkAllValues(values, maxValueLength, valueFormat):
+
+        # No Value
+        if (len(values) == 0):
+            return True
+
+        # Joined Values (one Value per Line, Line Number must match Value Number)
+        joinedValues = "\n".join(values)
+        if (valueFormat != FieldFormatEnum.STRING) and (joinedValues.count("\n") != len(values) - 1):
+            return False
+
+        match valueFormat:
+            case FieldFormatEnum.NUMBER:
+                return (re.fullmatch(r'[0-9]+(\n[0-9]+)*', joinedValues) != None) and (max(map(int, values)) <= maxValueLength)
+
+            case FieldFormatEnum.HEX:
+                return re.fullmatch(r'[0-9a-fA-F]{1,%d}(\n[0-9a-fA-F]{1,%d})*' % (maxValueLength, maxValueLength), joinedValues) != None
+
+            case FieldFormatEnum.STRING:
+                return max(map(len, values)) <= maxValueLength
+
+            case _:
+                return False
@@ -374,7 +374,9 @@ GENERIC(
 	-- Memory Configurations (Address Length, Address Max Index, Address Count Max)
 	MEMORY_ADDR_LENGTH: INTEGER := 1;
 	MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
-	MEMORY_ADDR_MAX_COUNT: INTEGER := 0
+	MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
+	-- Memory Data Length
+	MEMORY_DATA_LENGTH: INTEGER := MEM_TOTAL_DATA_LENGTH
 );
 PORT(
 	i_sys_clock: IN STD_LOGIC;
@@ -390,8 +392,8 @@ PORT(
 	o_mem_enb: OUT STD_LOGIC;
 	o_mem_addra: OUT STD_LOGIC_VECTOR(MEMORY_ADDR_LENGTH-1 downto 0);
 	o_mem_addrb: OUT STD_LOGIC_VECTOR(MEMORY_ADDR_LENGTH-1 downto 0);
-	i_mem_dataa: IN STD_LOGIC_VECTOR(MEM_TOTAL_DATA_LENGTH-1 downto 0);
-	i_mem_datab: IN STD_LOGIC_VECTOR(MEM_TOTAL_DATA_LENGTH-1 downto 0);
+	i_mem_dataa: IN STD_LOGIC_VECTOR(MEMORY_DATA_LENGTH-1 downto 0);
+	i_mem_datab: IN STD_LOGIC_VECTOR(MEMORY_DATA_LENGTH-1 downto 0);
 
 	-- Memory Controller Outputs
 	o_mem_no_data: OUT STD_LOGIC;
@@ -400,6 +402,7 @@ PORT(
 	o_mem_data_en: OUT STD_LOGIC_VECTOR(MEM_DATA_QUARTET_ENABLE_LENGTH-1 downto 0);
 	o_mem_data_verif_level: OUT STD_LOGIC;
 	o_mem_data_part_number: OUT UNSIGNED(MEM_DATA_PART_NUMBER_LENGTH-1 downto 0);
+	o_mem_data_high: OUT UNSIGNED(MEMORY_DATA_LENGTH-MEM_TOTAL_DATA_LENGTH-1 downto 0);
 	o_mem_data_last: OUT STD_LOGIC
 );
 END COMPONENT;
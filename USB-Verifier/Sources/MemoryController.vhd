@@ -20,11 +20,13 @@
 --			- Verification Value Quartet Enable
 --			- Verification Level
 --			- Verification Part Number
+--			- Verification High Data Value (Range Memory only)
 --
 -- Generics:
 --		MEMORY_ADDR_LENGTH: Define the Memory Address Bus Length (in line with the maximum index value)
 --		MEMORY_ADDR_MAX_INDEX: Define the Memory Maximum Address (in line with the maximum index value)
 --		MEMORY_ADDR_MAX_COUNT: Define the Memory Maximum Address Count (in line with the maximum count value)
+--		MEMORY_DATA_LENGTH: Define the Memory Data Bus Length (MEM_TOTAL_DATA_LENGTH, or MEM_RANGE_TOTAL_DATA_LENGTH for Range Memory)
 --
 -- Ports
 --		Input 	-	i_sys_clock: System Input Clock
@@ -46,6 +48,7 @@
 --		Output 	-	o_mem_data_en: Memory Data Quartet Enable ('0': Disabled Quartet, '1': Enabled Quartet)
 --		Output 	-	o_mem_data_verif_level: Memory Data Verification Level ('0': Optional, '1': Mandatory)
 --		Output 	-	o_mem_data_part_number: Memory Data Part Number
+--		Output 	-	o_mem_data_high: Memory High Data (Range Memory only, empty otherwise)
 --		Output 	-	o_mem_data_last: Memory Last Data ('0': Not Last Data, '1': Last Data)
 ------------------------------------------------------------------------
 
@@ -63,7 +66,9 @@ GENERIC(
 	-- Memory Configurations (Address Length, Address Max Index, Address Count Max)
 	MEMORY_ADDR_LENGTH: INTEGER := 1;
 	MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
-	MEMORY_ADDR_MAX_COUNT: INTEGER := 0
+	MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
+	-- Memory Data Length
+	MEMORY_DATA_LENGTH: INTEGER := MEM_TOTAL_DATA_LENGTH
 );
 
 PORT(
@@ -80,8 +85,8 @@ PORT(
 	o_mem_enb: OUT STD_LOGIC;
 	o_mem_addra: OUT STD_LOGIC_VECTOR(MEMORY_ADDR_LENGTH-1 downto 0);
 	o_mem_addrb: OUT STD_LOGIC_VECTOR(MEMORY_ADDR_LENGTH-1 downto 0);
-	i_mem_dataa: IN STD_LOGIC_VECTOR(MEM_TOTAL_DATA_LENGTH-1 downto 0);
-	i_mem_datab: IN STD_LOGIC_VECTOR(MEM_TOTAL_DATA_LENGTH-1 downto 0);
+	i_mem_dataa: IN STD_LOGIC_VECTOR(MEMORY_DATA_LENGTH-1 downto 0);
+	i_mem_datab: IN STD_LOGIC_VECTOR(MEMORY_DATA_LENGTH-1 downto 0);
 
 	-- Memory Controller Outputs
 	o_mem_no_data: OUT STD_LOGIC;
@@ -90,6 +95,7 @@ PORT(
 	o_mem_data_en: OUT STD_LOGIC_VECTOR(MEM_DATA_QUARTET_ENABLE_LENGTH-1 downto 0);
 	o_mem_data_verif_level: OUT STD_LOGIC;
 	o_mem_data_part_number: OUT UNSIGNED(MEM_DATA_PART_NUMBER_LENGTH-1 downto 0);
+	o_mem_data_high: OUT UNSIGNED(MEMORY_DATA_LENGTH-MEM_TOTAL_DATA_LENGTH-1 downto 0);
 	o_mem_data_last: OUT STD_LOGIC
 );
 
@@ -111,15 +117,15 @@ signal mem_enb: STD_LOGIC := '0';
 signal mem_addr_count: UNSIGNED(MEMORY_ADDR_LENGTH-1 downto 0) := (others => '0');
 signal mem_addra_reg: UNSIGNED(MEMORY_ADDR_LENGTH-1 downto 0) := (others => '0');
 signal mem_addrb_reg: UNSIGNED(MEMORY_ADDR_LENGTH-1 downto 0) := (others => '0');
-signal mem_data_rega: STD_LOGIC_VECTOR(MEM_TOTAL_DATA_LENGTH-1 downto 0) := (others => '0');
-signal mem_data_regb: STD_LOGIC_VECTOR(MEM_TOTAL_DATA_LENGTH-1 downto 0) := (others => '0');
+signal mem_data_rega: STD_LOGIC_VECTOR(MEMORY_DATA_LENGTH-1 downto 0) := (others => '0');
+signal mem_data_regb: STD_LOGIC_VECTOR(MEMORY_DATA_LENGTH-1 downto 0) := (others => '0');
 
 -- Memory Last Data Register
 signal mem_data_last_reg: STD_LOGIC := '0';
 
 -- Memory Data Outputs
 signal mem_data_out_ready_reg: STD_LOGIC := '0';
-signal mem_data_out_reg: UNSIGNED(MEM_TOTAL_DATA_LENGTH-1 downto 0) := (others => '0');
+signal mem_data_out_reg: UNSIGNED(MEMORY_DATA_LENGTH-1 downto 0) := (others => '0');
 signal mem_data_out_last_reg: STD_LOGIC := '0';
 
 ------------------------------------------------------------------------
@@ -363,7 +369,9 @@ begin
 	o_mem_data <= mem_data_out_reg(MEM_DATA_MSB_INDEX downto MEM_DATA_LSB_INDEX);
 	o_mem_data_en <= STD_LOGIC_VECTOR(mem_data_out_reg(MEM_DATA_QUARTET_ENABLE_MSB_INDEX downto MEM_DATA_QUARTET_ENABLE_LSB_INDEX));
 	o_mem_data_verif_level <= mem_data_out_reg(MEM_DATA_VERIF_LEVEL_INDEX);
-	o_mem_data_part_number <= mem_data_out_reg(MEM_DATA_PART_NUMBER_MSB_INDEX downto MEM_DATA_PART_NUMBER_LSB_INDEX);
+	-- Part Number always in the Memory Data MSB (High Data between Part Number and Data for Range Memory)
+	o_mem_data_part_number <= mem_data_out_reg(MEMORY_DATA_LENGTH-1 downto MEMORY_DATA_LENGTH-MEM_DATA_PART_NUMBER_LENGTH);
+	o_mem_data_high <= mem_data_out_reg(MEMORY_DATA_LENGTH-MEM_DATA_PART_NUMBER_LENGTH-1 downto MEM_DATA_MSB_INDEX+1);
 	o_mem_data_last <= mem_data_out_last_reg;
 
 end Behavioral;
\ No newline at end of file
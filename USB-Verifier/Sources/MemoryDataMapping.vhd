@@ -4,6 +4,7 @@
 -- Package Name: MemoryDataMapping
 -- Description:
 --		Package defining Memory DataFormat: Value Part Number (8 bits) - Expected Value (24 bits) - Quartet Enable (6 bits) - Verification Level (1 bit)
+--		Package defining Range Memory DataFormat (Between Operator): Value Part Number (8 bits) - High Expected Value (24 bits) - Low Expected Value (24 bits) - Quartet Enable (6 bits) - Verification Level (1 bit)
 --		Package defining Memory Data Bit Lengths & Indexes (Part Number, Expected Value, Quartet Enable, Verification Level)
 --		Package defining Memory Unknown Address Index & Count Values
 ------------------------------------------------------------------------
@@ -20,6 +21,9 @@ PACKAGE MemoryDataMapping is
 	-- Memory Data Total Length
 	constant MEM_TOTAL_DATA_LENGTH: INTEGER := USB_DESCRIPTOR_VALUE_TOTAL_BIT_LENGTH;
 
+	-- Range Memory Data Total Length (High Expected Value before the Low Expected Value)
+	constant MEM_RANGE_TOTAL_DATA_LENGTH: INTEGER := USB_DESCRIPTOR_VALUE_TOTAL_BIT_LENGTH + USB_DESCRIPTOR_VALUE_DATA_BIT_LENGTH;
+
 	-- Memory Data Part Number Length & Indexes
 	constant MEM_DATA_PART_NUMBER_LENGTH: INTEGER := USB_DESCRIPTOR_VALUE_PART_NUMBER_BIT_LENGTH;
 	constant MEM_DATA_PART_NUMBER_MSB_INDEX: INTEGER := 38;
@@ -29,6 +29,7 @@
 --		GREATER_EQUALS_OPERATOR_ENABLE: Define if the GreaterEquals Operator is Enable/Disable ('0': Disabled, '1': Enabled)
 --		LESS_OPERATOR_ENABLE: Define if the Less Operator is Enable/Disable ('0': Disabled, '1': Enabled)
 --		LESS_EQUALS_OPERATOR_ENABLE: Define if the LessEquals Operator is Enable/Disable ('0': Disabled, '1': Enabled)
+--		BETWEEN_OPERATOR_ENABLE: Define if the Between Operator is Enable/Disable ('0': Disabled, '1': Enabled)
 --		STARTS_WITH_OPERATOR_ENABLE: Define if the StartsWith Operator is Enable/Disable ('0': Disabled, '1': Enabled)
 --		ENDS_WITH_OPERATOR_ENABLE: Define if the EndsWith Operator is Enable/Disable ('0': Disabled, '1': Enabled)
 --		CONTAINS_OPERATOR_ENABLE: Define if the Contains Operator is Enable/Disable ('0': Disabled, '1': Enabled)
@@ -779,6 +780,130 @@
 --		LESS_EQUALS_OTHER_SPEED_BMAXPOWER_INDEX: Other Speed Descriptor Max Power USB Field Index for LessEquals Operator
 --		LESS_EQUALS_OTHER_SPEED_BMAXPOWER_COUNT: Other Speed Descriptor Max Power USB Field Count for LessEquals Operator
 --
+--		BETWEEN_MEMORY_ADDR_LENGTH: Define the Memory Address Bus Length for Between Operator (in line with the maximum index value)
+--		BETWEEN_MEMORY_ADDR_MAX_INDEX: Define the Memory Maximum Address for Between Operator (in line with the maximum index value)
+--		BETWEEN_MEMORY_ADDR_MAX_COUNT: Define the Memory Maximum Address Count for Between Operator (in line with the maximum count value)
+--		BETWEEN_DEVICE_BLENGTH_INDEX: Device Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BLENGTH_COUNT: Device Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_DEVICE_BCDUSB_INDEX: Device Descriptor USB Release Number Field Index for Between Operator
+--		BETWEEN_DEVICE_BCDUSB_COUNT: Device Descriptor USB Release Number Field Count for Between Operator
+--		BETWEEN_DEVICE_BDEVICECLASS_INDEX: Device Descriptor Device Class USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BDEVICECLASS_COUNT: Device Descriptor Device Class USB Field Count for Between Operator
+--		BETWEEN_DEVICE_BDEVICESUBCLASS_INDEX: Device Descriptor Device Sub Class USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BDEVICESUBCLASS_COUNT: Device Descriptor Device Sub Class USB Field Count for Between Operator
+--		BETWEEN_DEVICE_BDEVICEPROTOCOL_INDEX: Device Descriptor Device Protocol USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BDEVICEPROTOCOL_COUNT: Device Descriptor Device Protocol USB Field Count for Between Operator
+--		BETWEEN_DEVICE_BMAXPACKETSIZE0_INDEX: Device Descriptor Max Packet Size0 USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BMAXPACKETSIZE0_COUNT: Device Descriptor Max Packet Size0 USB Field Count for Between Operator
+--		BETWEEN_DEVICE_IDVENDOR_INDEX: Device Descriptor Vendor USB Field Index for Between Operator
+--		BETWEEN_DEVICE_IDVENDOR_COUNT: Device Descriptor Vendor USB Field Count for Between Operator
+--		BETWEEN_DEVICE_IDPRODUCT_INDEX: Device Descriptor Product USB Field Index for Between Operator
+--		BETWEEN_DEVICE_IDPRODUCT_COUNT: Device Descriptor Product USB Field Count for Between Operator
+--		BETWEEN_DEVICE_BCDDEVICE_INDEX: Device Descriptor Device Release Number USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BCDDEVICE_COUNT: Device Descriptor Device Release Number USB Field Count for Between Operator
+--		BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_INDEX: Device Descriptor String Manufacturer Length USB Field Index for Between Operator
+--		BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_COUNT: Device Descriptor String Manufacturer Length USB Field Count for Between Operator
+--		BETWEEN_DEVICE_IMANUFACTURER_INDEX: Device Descriptor String Manufacturer USB Field Index for Between Operator
+--		BETWEEN_DEVICE_IMANUFACTURER_COUNT: Device Descriptor String Manufacturer USB Field Count for Between Operator
+--		BETWEEN_DEVICE_IPRODUCT_BLENGTH_INDEX: Device Descriptor String Product Length USB Field Index for Between Operator
+--		BETWEEN_DEVICE_IPRODUCT_BLENGTH_COUNT: Device Descriptor String Product Length USB Field Count for Between Operator
+--		BETWEEN_DEVICE_IPRODUCT_INDEX: Device Descriptor String Product USB Field Index for Between Operator
+--		BETWEEN_DEVICE_IPRODUCT_COUNT: Device Descriptor String Product USB Field Count for Between Operator
+--		BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_INDEX: Device Descriptor String Serial Number Length USB Field Index for Between Operator
+--		BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_COUNT: Device Descriptor String Serial Number Length USB Field Count for Between Operator
+--		BETWEEN_DEVICE_ISERIALNUMBER_INDEX: Device Descriptor String Serial Number USB Field Index for Between Operator
+--		BETWEEN_DEVICE_ISERIALNUMBER_COUNT: Device Descriptor String Serial Number USB Field Count for Between Operator
+--		BETWEEN_DEVICE_BNUMCONFIGURATIONS_INDEX: Device Descriptor Num Configuration USB Field Index for Between Operator
+--		BETWEEN_DEVICE_BNUMCONFIGURATIONS_COUNT: Device Descriptor Num Configuration USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_BLENGTH_INDEX: Configuration Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_BLENGTH_COUNT: Configuration Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_WTOTALLENGTH_INDEX: Configuration Descriptor Total Length USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_WTOTALLENGTH_COUNT: Configuration Descriptor Total Length USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_BNUMINTERFACES_INDEX: Configuration Descriptor Num Interfaces USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_BNUMINTERFACES_COUNT: Configuration Descriptor Num Interfaces USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_INDEX: Configuration Descriptor Configuration Value USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_COUNT: Configuration Descriptor Configuration Value USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX: Configuration Descriptor String Configuration Length USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT: Configuration Descriptor String Configuration Length USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_ICONFIGURATION_INDEX: Configuration Descriptor String Configuration USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_ICONFIGURATION_COUNT: Configuration Descriptor String Configuration USB Field Coubt for Between Operator
+--		BETWEEN_CONFIGURATION_BMATTRIBUTES_INDEX: Configuration Descriptor Attributes USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_BMATTRIBUTES_COUNT: Configuration Descriptor Attributes USB Field Count for Between Operator
+--		BETWEEN_CONFIGURATION_BMAXPOWER_INDEX: Configuration Descriptor Max Power USB Field Index for Between Operator
+--		BETWEEN_CONFIGURATION_BMAXPOWER_COUNT: Configuration Descriptor Max Power USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BLENGTH_INDEX: Interface Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BLENGTH_COUNT: Interface Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACENUMBER_INDEX: Interface Descriptor Interface Number USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACENUMBER_COUNT: Interface Descriptor Interface Number USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BALTERNATESETTING_INDEX: Interface Descriptor Alternate Setting USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BALTERNATESETTING_COUNT: Interface Descriptor Alternate Setting USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BNUMENDPOINTS_INDEX: Interface Descriptor Num Endpoints USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BNUMENDPOINTS_COUNT: Interface Descriptor Num Endpoints USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACECLASS_INDEX: Interface Descriptor Interface Class USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACECLASS_COUNT: Interface Descriptor Interface Class USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACESUBCLASS_INDEX: Interface Descriptor Interface Sub Class USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACESUBCLASS_COUNT: Interface Descriptor Interface Sub Class USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACEPROTOCOL_INDEX: Interface Descriptor Interface Protocol USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_BINTERFACEPROTOCOL_COUNT: Interface Descriptor Interface Protocol USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_IINTERFACE_BLENGTH_INDEX: Interface Descriptor String Interface Length USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_IINTERFACE_BLENGTH_COUNT: Interface Descriptor String Interface Length USB Field Count for Between Operator
+--		BETWEEN_INTERFACE_IINTERFACE_INDEX: Interface Descriptor String Interface USB Field Index for Between Operator
+--		BETWEEN_INTERFACE_IINTERFACE_COUNT: Interface Descriptor String Interface USB Field Count for Between Operator
+--		BETWEEN_HID_BLENGTH_INDEX: HID Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_HID_BLENGTH_COUNT: HID Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_HID_BCDHID_INDEX: HID Descriptor HID USB Field Index for Between Operator
+--		BETWEEN_HID_BCDHID_COUNT: HID Descriptor HID USB Field Count for Between Operator
+--		BETWEEN_HID_BCOUNTRYCODE_INDEX: HID Descriptor Country Code USB Field Index for Between Operator
+--		BETWEEN_HID_BCOUNTRYCODE_COUNT: HID Descriptor Country Code USB Field Count for Between Operator
+--		BETWEEN_HID_BNUMDESCRIPTORS_INDEX: HID Descriptor Num Descriptors USB Field Index for Between Operator
+--		BETWEEN_HID_BNUMDESCRIPTORS_COUNT: HID Descriptor Num Descriptors USB Field Count for Between Operator
+--		BETWEEN_HID_BDESCRIPTORTYPE_INDEX: HID Descriptor Descriptor Type USB Field Index for Between Operator
+--		BETWEEN_HID_BDESCRIPTORTYPE_COUNT: HID Descriptor Descriptor Type USB Field Count for Between Operator
+--		BETWEEN_HID_WDESCRIPTORLENGTH_INDEX: HID Descriptor Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_HID_WDESCRIPTORLENGTH_COUNT: HID Descriptor Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_ENDPOINT_BLENGTH_INDEX: Endpoint Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_ENDPOINT_BLENGTH_COUNT: Endpoint Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_ENDPOINT_BENDPOINTADDRESS_INDEX: Endpoint Descriptor Endpoint Address USB Field Index for Between Operator
+--		BETWEEN_ENDPOINT_BENDPOINTADDRESS_COUNT: Endpoint Descriptor Endpoint Address USB Field Count for Between Operator
+--		BETWEEN_ENDPOINT_BMATTRIBUTES_INDEX: Endpoint Descriptor Attributes USB Field Index for Between Operator
+--		BETWEEN_ENDPOINT_BMATTRIBUTES_COUNT: Endpoint Descriptor Attributes USB Field Count for Between Operator
+--		BETWEEN_ENDPOINT_WMAXPACKETSIZE_INDEX: Endpoint Descriptor Max Packet Size USB Field Index for Between Operator
+--		BETWEEN_ENDPOINT_WMAXPACKETSIZE_COUNT: Endpoint Descriptor Max Packet Size USB Field Count for Between Operator
+--		BETWEEN_ENDPOINT_BINTERVAL_INDEX: Endpoint Descriptor Interval USB Field Index for Between Operator
+--		BETWEEN_ENDPOINT_BINTERVAL_COUNT: Endpoint Descriptor Interval USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BLENGTH_INDEX: Device Qualifier Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BLENGTH_COUNT: Device Qualifier Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BCDUSB_INDEX: Device Qualifier Descriptor USB Release Number Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BCDUSB_COUNT: Device Qualifier Descriptor USB Release Number Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_INDEX: Device Qualifier Descriptor Device Class USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_COUNT: Device Qualifier Descriptor Device Class USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX: Device Qualifier Descriptor Device Sub Class USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT: Device Qualifier Descriptor Device Sub Class USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX: Device Qualifier Descriptor Device Protocol USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT: Device Qualifier Descriptor Device Protocol USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX: Device Qualifier Descriptor Max Packet Size0 USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT: Device Qualifier Descriptor Max Packet Size0 USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX: Device Qualifier Descriptor Num Configuration USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT: Device Qualifier Descriptor Num Configuration USB Field Count for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BRESERVED_INDEX: Device Qualifier Descriptor Reserved USB Field Index for Between Operator
+--		BETWEEN_DEVICE_QUALIFIER_BRESERVED_COUNT: Device Qualifier Descriptor Reserved USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_BLENGTH_INDEX: Other Speed Descriptor Length USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_BLENGTH_COUNT: Other Speed Descriptor Length USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_WTOTALLENGTH_INDEX: Other Speed Descriptor Total Length USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_WTOTALLENGTH_COUNT: Other Speed Descriptor Total Length USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_BNUMINTERFACES_INDEX: Other Speed Descriptor Num Interfaces USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_BNUMINTERFACES_COUNT: Other Speed Descriptor Num Interfaces USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_INDEX: Other Speed Descriptor Configuration Value USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_COUNT: Other Speed Descriptor Configuration Value USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX: Other Speed Descriptor String Configuration Length USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT: Other Speed Descriptor String Configuration Length USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_ICONFIGURATION_INDEX: Other Speed Descriptor String Configuration USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_ICONFIGURATION_COUNT: Other Speed Descriptor String Configuration USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_BMATTRIBUTES_INDEX: Other Speed Descriptor Attributes USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_BMATTRIBUTES_COUNT: Other Speed Descriptor Attributes USB Field Count for Between Operator
+--		BETWEEN_OTHER_SPEED_BMAXPOWER_INDEX: Other Speed Descriptor Max Power USB Field Index for Between Operator
+--		BETWEEN_OTHER_SPEED_BMAXPOWER_COUNT: Other Speed Descriptor Max Power USB Field Count for Between Operator
+--
 --		STARTS_WITH_MEMORY_ADDR_LENGTH: Define the Memory Address Bus Length for StartsWith Operator (in line with the maximum index value)
 --		STARTS_WITH_MEMORY_ADDR_MAX_INDEX: Define the Memory Maximum Address for StartsWith Operator (in line with the maximum index value)
 --		STARTS_WITH_MEMORY_ADDR_MAX_COUNT: Define the Memory Maximum Address Count for StartsWith Operator (in line with the maximum count value)
@@ -1311,6 +1436,7 @@ GENERIC(
 	GREATER_EQUALS_OPERATOR_ENABLE: STD_LOGIC := '1';
 	LESS_OPERATOR_ENABLE: STD_LOGIC := '1';
 	LESS_EQUALS_OPERATOR_ENABLE: STD_LOGIC := '1';
+	BETWEEN_OPERATOR_ENABLE: STD_LOGIC := '1';
 	STARTS_WITH_OPERATOR_ENABLE: STD_LOGIC := '1';
 	ENDS_WITH_OPERATOR_ENABLE: STD_LOGIC := '1';
 	CONTAINS_OPERATOR_ENABLE: STD_LOGIC := '1';
@@ -2061,6 +2187,130 @@ GENERIC(
 	LESS_EQUALS_OTHER_SPEED_BMAXPOWER_INDEX: INTEGER := 0;
 	LESS_EQUALS_OTHER_SPEED_BMAXPOWER_COUNT: INTEGER := 0;
 
+	BETWEEN_MEMORY_ADDR_LENGTH: INTEGER := 1;
+	BETWEEN_MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
+	BETWEEN_MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BCDUSB_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BCDUSB_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICECLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICECLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICESUBCLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICESUBCLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICEPROTOCOL_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICEPROTOCOL_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BMAXPACKETSIZE0_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BMAXPACKETSIZE0_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IDVENDOR_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IDVENDOR_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IDPRODUCT_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IDPRODUCT_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BCDDEVICE_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BCDDEVICE_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BNUMCONFIGURATIONS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BNUMCONFIGURATIONS_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_WTOTALLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_WTOTALLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BNUMINTERFACES_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BNUMINTERFACES_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMATTRIBUTES_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMATTRIBUTES_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMAXPOWER_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMAXPOWER_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACENUMBER_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACENUMBER_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BALTERNATESETTING_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BALTERNATESETTING_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BNUMENDPOINTS_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BNUMENDPOINTS_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACECLASS_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACECLASS_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACESUBCLASS_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACESUBCLASS_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACEPROTOCOL_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACEPROTOCOL_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_COUNT: INTEGER := 0;
+	BETWEEN_HID_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_HID_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_HID_BCDHID_INDEX: INTEGER := 0;
+	BETWEEN_HID_BCDHID_COUNT: INTEGER := 0;
+	BETWEEN_HID_BCOUNTRYCODE_INDEX: INTEGER := 0;
+	BETWEEN_HID_BCOUNTRYCODE_COUNT: INTEGER := 0;
+	BETWEEN_HID_BNUMDESCRIPTORS_INDEX: INTEGER := 0;
+	BETWEEN_HID_BNUMDESCRIPTORS_COUNT: INTEGER := 0;
+	BETWEEN_HID_BDESCRIPTORTYPE_INDEX: INTEGER := 0;
+	BETWEEN_HID_BDESCRIPTORTYPE_COUNT: INTEGER := 0;
+	BETWEEN_HID_WDESCRIPTORLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_HID_WDESCRIPTORLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BENDPOINTADDRESS_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BENDPOINTADDRESS_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BMATTRIBUTES_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BMATTRIBUTES_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_WMAXPACKETSIZE_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_WMAXPACKETSIZE_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BINTERVAL_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BINTERVAL_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BCDUSB_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BCDUSB_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BRESERVED_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BRESERVED_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_WTOTALLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_WTOTALLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BNUMINTERFACES_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BNUMINTERFACES_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMATTRIBUTES_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMATTRIBUTES_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMAXPOWER_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMAXPOWER_COUNT: INTEGER := 0;
+
 	STARTS_WITH_MEMORY_ADDR_LENGTH: INTEGER := 1;
 	STARTS_WITH_MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
 	STARTS_WITH_MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
@@ -3492,6 +3742,158 @@ PORT(
 );
 END COMPONENT;
 
+-- Between Operator
+COMPONENT BetweenOperator is
+GENERIC(
+	-- Memory Configurations (Address Length, Address Max Index, Address Count Max)
+	MEMORY_ADDR_LENGTH: INTEGER := 1;
+	MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
+	MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
+	-- Device Descriptor
+	DEVICE_BLENGTH_INDEX: INTEGER := 0;
+	DEVICE_BLENGTH_COUNT: INTEGER := 0;
+	DEVICE_BCDUSB_INDEX: INTEGER := 0;
+	DEVICE_BCDUSB_COUNT: INTEGER := 0;
+	DEVICE_BDEVICECLASS_INDEX: INTEGER := 0;
+	DEVICE_BDEVICECLASS_COUNT: INTEGER := 0;
+	DEVICE_BDEVICESUBCLASS_INDEX: INTEGER := 0;
+	DEVICE_BDEVICESUBCLASS_COUNT: INTEGER := 0;
+	DEVICE_BDEVICEPROTOCOL_INDEX: INTEGER := 0;
+	DEVICE_BDEVICEPROTOCOL_COUNT: INTEGER := 0;
+	DEVICE_BMAXPACKETSIZE0_INDEX: INTEGER := 0;
+	DEVICE_BMAXPACKETSIZE0_COUNT: INTEGER := 0;
+	DEVICE_IDVENDOR_INDEX: INTEGER := 0;
+	DEVICE_IDVENDOR_COUNT: INTEGER := 0;
+	DEVICE_IDPRODUCT_INDEX: INTEGER := 0;
+	DEVICE_IDPRODUCT_COUNT: INTEGER := 0;
+	DEVICE_BCDDEVICE_INDEX: INTEGER := 0;
+	DEVICE_BCDDEVICE_COUNT: INTEGER := 0;
+	DEVICE_IMANUFACTURER_BLENGTH_INDEX: INTEGER := 0;
+	DEVICE_IMANUFACTURER_BLENGTH_COUNT: INTEGER := 0;
+	DEVICE_IMANUFACTURER_INDEX: INTEGER := 0;
+	DEVICE_IMANUFACTURER_COUNT: INTEGER := 0;
+	DEVICE_IPRODUCT_BLENGTH_INDEX: INTEGER := 0;
+	DEVICE_IPRODUCT_BLENGTH_COUNT: INTEGER := 0;
+	DEVICE_IPRODUCT_INDEX: INTEGER := 0;
+	DEVICE_IPRODUCT_COUNT: INTEGER := 0;
+	DEVICE_ISERIALNUMBER_BLENGTH_INDEX: INTEGER := 0;
+	DEVICE_ISERIALNUMBER_BLENGTH_COUNT: INTEGER := 0;
+	DEVICE_ISERIALNUMBER_INDEX: INTEGER := 0;
+	DEVICE_ISERIALNUMBER_COUNT: INTEGER := 0;
+	DEVICE_BNUMCONFIGURATIONS_INDEX: INTEGER := 0;
+	DEVICE_BNUMCONFIGURATIONS_COUNT: INTEGER := 0;
+	-- Configuration Descriptor
+	CONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	CONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	CONFIGURATION_WTOTALLENGTH_INDEX: INTEGER := 0;
+	CONFIGURATION_WTOTALLENGTH_COUNT: INTEGER := 0;
+	CONFIGURATION_BNUMINTERFACES_INDEX: INTEGER := 0;
+	CONFIGURATION_BNUMINTERFACES_COUNT: INTEGER := 0;
+	CONFIGURATION_BCONFIGURATIONVALUE_INDEX: INTEGER := 0;
+	CONFIGURATION_BCONFIGURATIONVALUE_COUNT: INTEGER := 0;
+	CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	CONFIGURATION_ICONFIGURATION_INDEX: INTEGER := 0;
+	CONFIGURATION_ICONFIGURATION_COUNT: INTEGER := 0;
+	CONFIGURATION_BMATTRIBUTES_INDEX: INTEGER := 0;
+	CONFIGURATION_BMATTRIBUTES_COUNT: INTEGER := 0;
+	CONFIGURATION_BMAXPOWER_INDEX: INTEGER := 0;
+	CONFIGURATION_BMAXPOWER_COUNT: INTEGER := 0;
+	-- Interface Descriptor
+	INTERFACE_BLENGTH_INDEX: INTEGER := 0;
+	INTERFACE_BLENGTH_COUNT: INTEGER := 0;
+	INTERFACE_BINTERFACENUMBER_INDEX: INTEGER := 0;
+	INTERFACE_BINTERFACENUMBER_COUNT: INTEGER := 0;
+	INTERFACE_BALTERNATESETTING_INDEX: INTEGER := 0;
+	INTERFACE_BALTERNATESETTING_COUNT: INTEGER := 0;
+	INTERFACE_BNUMENDPOINTS_INDEX: INTEGER := 0;
+	INTERFACE_BNUMENDPOINTS_COUNT: INTEGER := 0;
+	INTERFACE_BINTERFACECLASS_INDEX: INTEGER := 0;
+	INTERFACE_BINTERFACECLASS_COUNT: INTEGER := 0;
+	INTERFACE_BINTERFACESUBCLASS_INDEX: INTEGER := 0;
+	INTERFACE_BINTERFACESUBCLASS_COUNT: INTEGER := 0;
+	INTERFACE_BINTERFACEPROTOCOL_INDEX: INTEGER := 0;
+	INTERFACE_BINTERFACEPROTOCOL_COUNT: INTEGER := 0;
+	INTERFACE_IINTERFACE_BLENGTH_INDEX: INTEGER := 0;
+	INTERFACE_IINTERFACE_BLENGTH_COUNT: INTEGER := 0;
+	INTERFACE_IINTERFACE_INDEX: INTEGER := 0;
+	INTERFACE_IINTERFACE_COUNT: INTEGER := 0;
+	-- HID Descriptor
+	HID_BLENGTH_INDEX: INTEGER := 0;
+	HID_BLENGTH_COUNT: INTEGER := 0;
+	HID_BCDHID_INDEX: INTEGER := 0;
+	HID_BCDHID_COUNT: INTEGER := 0;
+	HID_BCOUNTRYCODE_INDEX: INTEGER := 0;
+	HID_BCOUNTRYCODE_COUNT: INTEGER := 0;
+	HID_BNUMDESCRIPTORS_INDEX: INTEGER := 0;
+	HID_BNUMDESCRIPTORS_COUNT: INTEGER := 0;
+	HID_BDESCRIPTORTYPE_INDEX: INTEGER := 0;
+	HID_BDESCRIPTORTYPE_COUNT: INTEGER := 0;
+	HID_WDESCRIPTORLENGTH_INDEX: INTEGER := 0;
+	HID_WDESCRIPTORLENGTH_COUNT: INTEGER := 0;
+	-- Endpoint Descriptor
+	ENDPOINT_BLENGTH_INDEX: INTEGER := 0;
+	ENDPOINT_BLENGTH_COUNT: INTEGER := 0;
+	ENDPOINT_BENDPOINTADDRESS_INDEX: INTEGER := 0;
+	ENDPOINT_BENDPOINTADDRESS_COUNT: INTEGER := 0;
+	ENDPOINT_BMATTRIBUTES_INDEX: INTEGER := 0;
+	ENDPOINT_BMATTRIBUTES_COUNT: INTEGER := 0;
+	ENDPOINT_WMAXPACKETSIZE_INDEX: INTEGER := 0;
+	ENDPOINT_WMAXPACKETSIZE_COUNT: INTEGER := 0;
+	ENDPOINT_BINTERVAL_INDEX: INTEGER := 0;
+	ENDPOINT_BINTERVAL_COUNT: INTEGER := 0;
+	-- Device Qualifier Descriptor
+	DEVICE_QUALIFIER_BLENGTH_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BLENGTH_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BCDUSB_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BCDUSB_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BDEVICECLASS_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BDEVICECLASS_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT: INTEGER := 0;
+	DEVICE_QUALIFIER_BRESERVED_INDEX: INTEGER := 0;
+	DEVICE_QUALIFIER_BRESERVED_COUNT: INTEGER := 0;
+	-- Other Speed Descriptor
+	OTHER_SPEED_BLENGTH_INDEX: INTEGER := 0;
+	OTHER_SPEED_BLENGTH_COUNT: INTEGER := 0;
+	OTHER_SPEED_WTOTALLENGTH_INDEX: INTEGER := 0;
+	OTHER_SPEED_WTOTALLENGTH_COUNT: INTEGER := 0;
+	OTHER_SPEED_BNUMINTERFACES_INDEX: INTEGER := 0;
+	OTHER_SPEED_BNUMINTERFACES_COUNT: INTEGER := 0;
+	OTHER_SPEED_BCONFIGURATIONVALUE_INDEX: INTEGER := 0;
+	OTHER_SPEED_BCONFIGURATIONVALUE_COUNT: INTEGER := 0;
+	OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	OTHER_SPEED_ICONFIGURATION_INDEX: INTEGER := 0;
+	OTHER_SPEED_ICONFIGURATION_COUNT: INTEGER := 0;
+	OTHER_SPEED_BMATTRIBUTES_INDEX: INTEGER := 0;
+	OTHER_SPEED_BMATTRIBUTES_COUNT: INTEGER := 0;
+	OTHER_SPEED_BMAXPOWER_INDEX: INTEGER := 0;
+	OTHER_SPEED_BMAXPOWER_COUNT: INTEGER := 0
+);
+
+PORT(
+	i_sys_clock: IN STD_LOGIC;
+	i_enable: IN STD_LOGIC;
+	i_descriptor_field: IN UNSIGNED(USB_DESCRIPTOR_FIELD_BIT_LENGTH-1 downto 0);
+	i_descriptor_field_available: IN STD_LOGIC;
+	i_descriptor_value: IN UNSIGNED(USB_DESCRIPTOR_VALUE_DATA_BIT_LENGTH-1 downto 0);
+	i_descriptor_value_en: IN STD_LOGIC_VECTOR(USB_DESCRIPTOR_VALUE_QUARTET_EN_BIT_LENGTH-1 downto 0);
+    i_descriptor_value_total_part_number: IN UNSIGNED(USB_DESCRIPTOR_VALUE_PART_NUMBER_BIT_LENGTH-1 downto 0);
+	i_descriptor_value_part_number: IN UNSIGNED(USB_DESCRIPTOR_VALUE_PART_NUMBER_BIT_LENGTH-1 downto 0);
+	i_descriptor_value_new_part: IN STD_LOGIC;
+	o_descriptor_value_next_part_request: OUT STD_LOGIC;
+	o_ready: OUT STD_LOGIC;
+	o_result: OUT STD_LOGIC
+);
+END COMPONENT;
+
 -- StartsWith Operator
 COMPONENT StartsWithOperator is
 GENERIC(
@@ -4123,7 +4525,7 @@ END COMPONENT;
 -- Constant Declarations
 ------------------------------------------------------------------------
 -- Total Available Operators
-constant TOTAL_OPERATORS_NUMBER: INTEGER := 10;
+constant TOTAL_OPERATORS_NUMBER: INTEGER := 11;
 
 -- Equals Index
 constant EQUALS_OPERATOR_INDEX: INTEGER := TOTAL_OPERATORS_NUMBER-1;
@@ -4155,6 +4557,9 @@ constant CONTAINS_OPERATOR_INDEX: INTEGER := TOTAL_OPERATORS_NUMBER-9;
 -- NotContains Index
 constant NOT_CONTAINS_OPERATOR_INDEX: INTEGER := TOTAL_OPERATORS_NUMBER-10;
 
+-- Between Index
+constant BETWEEN_OPERATOR_INDEX: INTEGER := TOTAL_OPERATORS_NUMBER-11;
+
 ------------------------------------------------------------------------
 -- Signal Declarations
 ------------------------------------------------------------------------
@@ -5091,6 +5496,160 @@ begin
 		);
 	end generate;
 
+	----------------------
+	-- Between Operator --
+	----------------------
+	betweenOperator_en: if (BETWEEN_OPERATOR_ENABLE = '1') generate
+		betweenOperator_inst: BetweenOperator
+			GENERIC MAP (
+				-- Memory Configurations (Address Length, Address Max Index, Address Count Max)
+				MEMORY_ADDR_LENGTH => BETWEEN_MEMORY_ADDR_LENGTH,
+				MEMORY_ADDR_MAX_INDEX => BETWEEN_MEMORY_ADDR_MAX_INDEX,
+				MEMORY_ADDR_MAX_COUNT => BETWEEN_MEMORY_ADDR_MAX_COUNT,
+				-- Device Descriptor
+				DEVICE_BLENGTH_INDEX => BETWEEN_DEVICE_BLENGTH_INDEX,
+				DEVICE_BLENGTH_COUNT => BETWEEN_DEVICE_BLENGTH_COUNT,
+				DEVICE_BCDUSB_INDEX => BETWEEN_DEVICE_BCDUSB_INDEX,
+				DEVICE_BCDUSB_COUNT => BETWEEN_DEVICE_BCDUSB_COUNT,
+				DEVICE_BDEVICECLASS_INDEX => BETWEEN_DEVICE_BDEVICECLASS_INDEX,
+				DEVICE_BDEVICECLASS_COUNT => BETWEEN_DEVICE_BDEVICECLASS_COUNT,
+				DEVICE_BDEVICESUBCLASS_INDEX => BETWEEN_DEVICE_BDEVICESUBCLASS_INDEX,
+				DEVICE_BDEVICESUBCLASS_COUNT => BETWEEN_DEVICE_BDEVICESUBCLASS_COUNT,
+				DEVICE_BDEVICEPROTOCOL_INDEX => BETWEEN_DEVICE_BDEVICEPROTOCOL_INDEX,
+				DEVICE_BDEVICEPROTOCOL_COUNT => BETWEEN_DEVICE_BDEVICEPROTOCOL_COUNT,
+				DEVICE_BMAXPACKETSIZE0_INDEX => BETWEEN_DEVICE_BMAXPACKETSIZE0_INDEX,
+				DEVICE_BMAXPACKETSIZE0_COUNT => BETWEEN_DEVICE_BMAXPACKETSIZE0_COUNT,
+				DEVICE_IDVENDOR_INDEX => BETWEEN_DEVICE_IDVENDOR_INDEX,
+				DEVICE_IDVENDOR_COUNT => BETWEEN_DEVICE_IDVENDOR_COUNT,
+				DEVICE_IDPRODUCT_INDEX => BETWEEN_DEVICE_IDPRODUCT_INDEX,
+				DEVICE_IDPRODUCT_COUNT => BETWEEN_DEVICE_IDPRODUCT_COUNT,
+				DEVICE_BCDDEVICE_INDEX => BETWEEN_DEVICE_BCDDEVICE_INDEX,
+				DEVICE_BCDDEVICE_COUNT => BETWEEN_DEVICE_BCDDEVICE_COUNT,
+				DEVICE_IMANUFACTURER_BLENGTH_INDEX => BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_INDEX,
+				DEVICE_IMANUFACTURER_BLENGTH_COUNT => BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_COUNT,
+				DEVICE_IMANUFACTURER_INDEX => BETWEEN_DEVICE_IMANUFACTURER_INDEX,
+				DEVICE_IMANUFACTURER_COUNT => BETWEEN_DEVICE_IMANUFACTURER_COUNT,
+				DEVICE_IPRODUCT_BLENGTH_INDEX => BETWEEN_DEVICE_IPRODUCT_BLENGTH_INDEX,
+				DEVICE_IPRODUCT_BLENGTH_COUNT => BETWEEN_DEVICE_IPRODUCT_BLENGTH_COUNT,
+				DEVICE_IPRODUCT_INDEX => BETWEEN_DEVICE_IPRODUCT_INDEX,
+				DEVICE_IPRODUCT_COUNT => BETWEEN_DEVICE_IPRODUCT_COUNT,
+				DEVICE_ISERIALNUMBER_BLENGTH_INDEX => BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_INDEX,
+				DEVICE_ISERIALNUMBER_BLENGTH_COUNT => BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_COUNT,
+				DEVICE_ISERIALNUMBER_INDEX => BETWEEN_DEVICE_ISERIALNUMBER_INDEX,
+				DEVICE_ISERIALNUMBER_COUNT => BETWEEN_DEVICE_ISERIALNUMBER_COUNT,
+				DEVICE_BNUMCONFIGURATIONS_INDEX => BETWEEN_DEVICE_BNUMCONFIGURATIONS_INDEX,
+				DEVICE_BNUMCONFIGURATIONS_COUNT => BETWEEN_DEVICE_BNUMCONFIGURATIONS_COUNT,
+				-- Configuration Descriptor
+				CONFIGURATION_BLENGTH_INDEX => BETWEEN_CONFIGURATION_BLENGTH_INDEX,
+				CONFIGURATION_BLENGTH_COUNT => BETWEEN_CONFIGURATION_BLENGTH_COUNT,
+				CONFIGURATION_WTOTALLENGTH_INDEX => BETWEEN_CONFIGURATION_WTOTALLENGTH_INDEX,
+				CONFIGURATION_WTOTALLENGTH_COUNT => BETWEEN_CONFIGURATION_WTOTALLENGTH_COUNT,
+				CONFIGURATION_BNUMINTERFACES_INDEX => BETWEEN_CONFIGURATION_BNUMINTERFACES_INDEX,
+				CONFIGURATION_BNUMINTERFACES_COUNT => BETWEEN_CONFIGURATION_BNUMINTERFACES_COUNT,
+				CONFIGURATION_BCONFIGURATIONVALUE_INDEX => BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_INDEX,
+				CONFIGURATION_BCONFIGURATIONVALUE_COUNT => BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_COUNT,
+				CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX => BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX,
+				CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT => BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT,
+				CONFIGURATION_ICONFIGURATION_INDEX => BETWEEN_CONFIGURATION_ICONFIGURATION_INDEX,
+				CONFIGURATION_ICONFIGURATION_COUNT => BETWEEN_CONFIGURATION_ICONFIGURATION_COUNT,
+				CONFIGURATION_BMATTRIBUTES_INDEX => BETWEEN_CONFIGURATION_BMATTRIBUTES_INDEX,
+				CONFIGURATION_BMATTRIBUTES_COUNT => BETWEEN_CONFIGURATION_BMATTRIBUTES_COUNT,
+				CONFIGURATION_BMAXPOWER_INDEX => BETWEEN_CONFIGURATION_BMAXPOWER_INDEX,
+				CONFIGURATION_BMAXPOWER_COUNT => BETWEEN_CONFIGURATION_BMAXPOWER_COUNT,
+				-- Interface Descriptor
+				INTERFACE_BLENGTH_INDEX => BETWEEN_INTERFACE_BLENGTH_INDEX,
+				INTERFACE_BLENGTH_COUNT => BETWEEN_INTERFACE_BLENGTH_COUNT,
+				INTERFACE_BINTERFACENUMBER_INDEX => BETWEEN_INTERFACE_BINTERFACENUMBER_INDEX,
+				INTERFACE_BINTERFACENUMBER_COUNT => BETWEEN_INTERFACE_BINTERFACENUMBER_COUNT,
+				INTERFACE_BALTERNATESETTING_INDEX => BETWEEN_INTERFACE_BALTERNATESETTING_INDEX,
+				INTERFACE_BALTERNATESETTING_COUNT => BETWEEN_INTERFACE_BALTERNATESETTING_COUNT,
+				INTERFACE_BNUMENDPOINTS_INDEX => BETWEEN_INTERFACE_BNUMENDPOINTS_INDEX,
+				INTERFACE_BNUMENDPOINTS_COUNT => BETWEEN_INTERFACE_BNUMENDPOINTS_COUNT,
+				INTERFACE_BINTERFACECLASS_INDEX => BETWEEN_INTERFACE_BINTERFACECLASS_INDEX,
+				INTERFACE_BINTERFACECLASS_COUNT => BETWEEN_INTERFACE_BINTERFACECLASS_COUNT,
+				INTERFACE_BINTERFACESUBCLASS_INDEX => BETWEEN_INTERFACE_BINTERFACESUBCLASS_INDEX,
+				INTERFACE_BINTERFACESUBCLASS_COUNT => BETWEEN_INTERFACE_BINTERFACESUBCLASS_COUNT,
+				INTERFACE_BINTERFACEPROTOCOL_INDEX => BETWEEN_INTERFACE_BINTERFACEPROTOCOL_INDEX,
+				INTERFACE_BINTERFACEPROTOCOL_COUNT => BETWEEN_INTERFACE_BINTERFACEPROTOCOL_COUNT,
+				INTERFACE_IINTERFACE_BLENGTH_INDEX => BETWEEN_INTERFACE_IINTERFACE_BLENGTH_INDEX,
+				INTERFACE_IINTERFACE_BLENGTH_COUNT => BETWEEN_INTERFACE_IINTERFACE_BLENGTH_COUNT,
+				INTERFACE_IINTERFACE_INDEX => BETWEEN_INTERFACE_IINTERFACE_INDEX,
+				INTERFACE_IINTERFACE_COUNT => BETWEEN_INTERFACE_IINTERFACE_COUNT,
+				-- HID Descriptor
+				HID_BLENGTH_INDEX => BETWEEN_HID_BLENGTH_INDEX,
+				HID_BLENGTH_COUNT => BETWEEN_HID_BLENGTH_COUNT,
+				HID_BCDHID_INDEX => BETWEEN_HID_BCDHID_INDEX,
+				HID_BCDHID_COUNT => BETWEEN_HID_BCDHID_COUNT,
+				HID_BCOUNTRYCODE_INDEX => BETWEEN_HID_BCOUNTRYCODE_INDEX,
+				HID_BCOUNTRYCODE_COUNT => BETWEEN_HID_BCOUNTRYCODE_COUNT,
+				HID_BNUMDESCRIPTORS_INDEX => BETWEEN_HID_BNUMDESCRIPTORS_INDEX,
+				HID_BNUMDESCRIPTORS_COUNT => BETWEEN_HID_BNUMDESCRIPTORS_COUNT,
+				HID_BDESCRIPTORTYPE_INDEX => BETWEEN_HID_BDESCRIPTORTYPE_INDEX,
+				HID_BDESCRIPTORTYPE_COUNT => BETWEEN_HID_BDESCRIPTORTYPE_COUNT,
+				HID_WDESCRIPTORLENGTH_INDEX => BETWEEN_HID_WDESCRIPTORLENGTH_INDEX,
+				HID_WDESCRIPTORLENGTH_COUNT => BETWEEN_HID_WDESCRIPTORLENGTH_COUNT,
+				-- Endpoint Descriptor
+				ENDPOINT_BLENGTH_INDEX => BETWEEN_ENDPOINT_BLENGTH_INDEX,
+				ENDPOINT_BLENGTH_COUNT => BETWEEN_ENDPOINT_BLENGTH_COUNT,
+				ENDPOINT_BENDPOINTADDRESS_INDEX => BETWEEN_ENDPOINT_BENDPOINTADDRESS_INDEX,
+				ENDPOINT_BENDPOINTADDRESS_COUNT => BETWEEN_ENDPOINT_BENDPOINTADDRESS_COUNT,
+				ENDPOINT_BMATTRIBUTES_INDEX => BETWEEN_ENDPOINT_BMATTRIBUTES_INDEX,
+				ENDPOINT_BMATTRIBUTES_COUNT => BETWEEN_ENDPOINT_BMATTRIBUTES_COUNT,
+				ENDPOINT_WMAXPACKETSIZE_INDEX => BETWEEN_ENDPOINT_WMAXPACKETSIZE_INDEX,
+				ENDPOINT_WMAXPACKETSIZE_COUNT => BETWEEN_ENDPOINT_WMAXPACKETSIZE_COUNT,
+				ENDPOINT_BINTERVAL_INDEX => BETWEEN_ENDPOINT_BINTERVAL_INDEX,
+				ENDPOINT_BINTERVAL_COUNT => BETWEEN_ENDPOINT_BINTERVAL_COUNT,
+				-- Device Qualifier Descriptor
+				DEVICE_QUALIFIER_BLENGTH_INDEX => BETWEEN_DEVICE_QUALIFIER_BLENGTH_INDEX,
+				DEVICE_QUALIFIER_BLENGTH_COUNT => BETWEEN_DEVICE_QUALIFIER_BLENGTH_COUNT,
+				DEVICE_QUALIFIER_BCDUSB_INDEX => BETWEEN_DEVICE_QUALIFIER_BCDUSB_INDEX,
+				DEVICE_QUALIFIER_BCDUSB_COUNT => BETWEEN_DEVICE_QUALIFIER_BCDUSB_COUNT,
+				DEVICE_QUALIFIER_BDEVICECLASS_INDEX => BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_INDEX,
+				DEVICE_QUALIFIER_BDEVICECLASS_COUNT => BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_COUNT,
+				DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX => BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX,
+				DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT => BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT,
+				DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX => BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX,
+				DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT => BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT,
+				DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX => BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX,
+				DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT => BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT,
+				DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX => BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX,
+				DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT => BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT,
+				DEVICE_QUALIFIER_BRESERVED_INDEX => BETWEEN_DEVICE_QUALIFIER_BRESERVED_INDEX,
+				DEVICE_QUALIFIER_BRESERVED_COUNT => BETWEEN_DEVICE_QUALIFIER_BRESERVED_COUNT,
+				-- Other Speed Descriptor
+				OTHER_SPEED_BLENGTH_INDEX => BETWEEN_OTHER_SPEED_BLENGTH_INDEX,
+				OTHER_SPEED_BLENGTH_COUNT => BETWEEN_OTHER_SPEED_BLENGTH_COUNT,
+				OTHER_SPEED_WTOTALLENGTH_INDEX => BETWEEN_OTHER_SPEED_WTOTALLENGTH_INDEX,
+				OTHER_SPEED_WTOTALLENGTH_COUNT => BETWEEN_OTHER_SPEED_WTOTALLENGTH_COUNT,
+				OTHER_SPEED_BNUMINTERFACES_INDEX => BETWEEN_OTHER_SPEED_BNUMINTERFACES_INDEX,
+				OTHER_SPEED_BNUMINTERFACES_COUNT => BETWEEN_OTHER_SPEED_BNUMINTERFACES_COUNT,
+				OTHER_SPEED_BCONFIGURATIONVALUE_INDEX => BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_INDEX,
+				OTHER_SPEED_BCONFIGURATIONVALUE_COUNT => BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_COUNT,
+				OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX => BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX,
+				OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT => BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT,
+				OTHER_SPEED_ICONFIGURATION_INDEX => BETWEEN_OTHER_SPEED_ICONFIGURATION_INDEX,
+				OTHER_SPEED_ICONFIGURATION_COUNT => BETWEEN_OTHER_SPEED_ICONFIGURATION_COUNT,
+				OTHER_SPEED_BMATTRIBUTES_INDEX => BETWEEN_OTHER_SPEED_BMATTRIBUTES_INDEX,
+				OTHER_SPEED_BMATTRIBUTES_COUNT => BETWEEN_OTHER_SPEED_BMATTRIBUTES_COUNT,
+				OTHER_SPEED_BMAXPOWER_INDEX => BETWEEN_OTHER_SPEED_BMAXPOWER_INDEX,
+				OTHER_SPEED_BMAXPOWER_COUNT => BETWEEN_OTHER_SPEED_BMAXPOWER_COUNT
+			)
+			PORT MAP (
+				i_sys_clock => i_sys_clock,
+				i_enable => i_enable,
+				i_descriptor_field => i_descriptor_field,
+				i_descriptor_field_available => i_descriptor_field_available,
+				i_descriptor_value => i_descriptor_value,
+				i_descriptor_value_en => i_descriptor_value_en,
+				i_descriptor_value_total_part_number => i_descriptor_value_total_part_number,
+				i_descriptor_value_part_number => i_descriptor_value_part_number,
+				i_descriptor_value_new_part => i_descriptor_value_new_part,
+				o_descriptor_value_next_part_request => operators_next_part_request(BETWEEN_OPERATOR_INDEX),
+				o_ready => operators_ready(BETWEEN_OPERATOR_INDEX),
+				o_result => operators_result(BETWEEN_OPERATOR_INDEX)
+		);
+	end generate;
+
 	-------------------------
 	-- StartsWith Operator --
 	-------------------------
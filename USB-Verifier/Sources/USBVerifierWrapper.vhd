@@ -64,6 +64,7 @@ GENERIC(
 	GREATER_EQUALS_OPERATOR_ENABLE: STD_LOGIC := '1';
 	LESS_OPERATOR_ENABLE: STD_LOGIC := '1';
 	LESS_EQUALS_OPERATOR_ENABLE: STD_LOGIC := '1';
+	BETWEEN_OPERATOR_ENABLE: STD_LOGIC := '1';
 	STARTS_WITH_OPERATOR_ENABLE: STD_LOGIC := '1';
 	ENDS_WITH_OPERATOR_ENABLE: STD_LOGIC := '1';
 	CONTAINS_OPERATOR_ENABLE: STD_LOGIC := '1';
@@ -814,6 +815,130 @@ GENERIC(
 	LESS_EQUALS_OTHER_SPEED_BMAXPOWER_INDEX: INTEGER := 0;
 	LESS_EQUALS_OTHER_SPEED_BMAXPOWER_COUNT: INTEGER := 0;
 
+	BETWEEN_MEMORY_ADDR_LENGTH: INTEGER := 1;
+	BETWEEN_MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
+	BETWEEN_MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BCDUSB_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BCDUSB_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICECLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICECLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICESUBCLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICESUBCLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICEPROTOCOL_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BDEVICEPROTOCOL_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BMAXPACKETSIZE0_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BMAXPACKETSIZE0_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IDVENDOR_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IDVENDOR_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IDPRODUCT_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IDPRODUCT_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BCDDEVICE_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BCDDEVICE_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IMANUFACTURER_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_IPRODUCT_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_ISERIALNUMBER_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_BNUMCONFIGURATIONS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_BNUMCONFIGURATIONS_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_WTOTALLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_WTOTALLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BNUMINTERFACES_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BNUMINTERFACES_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_ICONFIGURATION_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMATTRIBUTES_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMATTRIBUTES_COUNT: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMAXPOWER_INDEX: INTEGER := 0;
+	BETWEEN_CONFIGURATION_BMAXPOWER_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACENUMBER_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACENUMBER_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BALTERNATESETTING_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BALTERNATESETTING_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BNUMENDPOINTS_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BNUMENDPOINTS_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACECLASS_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACECLASS_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACESUBCLASS_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACESUBCLASS_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACEPROTOCOL_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_BINTERFACEPROTOCOL_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_INDEX: INTEGER := 0;
+	BETWEEN_INTERFACE_IINTERFACE_COUNT: INTEGER := 0;
+	BETWEEN_HID_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_HID_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_HID_BCDHID_INDEX: INTEGER := 0;
+	BETWEEN_HID_BCDHID_COUNT: INTEGER := 0;
+	BETWEEN_HID_BCOUNTRYCODE_INDEX: INTEGER := 0;
+	BETWEEN_HID_BCOUNTRYCODE_COUNT: INTEGER := 0;
+	BETWEEN_HID_BNUMDESCRIPTORS_INDEX: INTEGER := 0;
+	BETWEEN_HID_BNUMDESCRIPTORS_COUNT: INTEGER := 0;
+	BETWEEN_HID_BDESCRIPTORTYPE_INDEX: INTEGER := 0;
+	BETWEEN_HID_BDESCRIPTORTYPE_COUNT: INTEGER := 0;
+	BETWEEN_HID_WDESCRIPTORLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_HID_WDESCRIPTORLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BENDPOINTADDRESS_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BENDPOINTADDRESS_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BMATTRIBUTES_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BMATTRIBUTES_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_WMAXPACKETSIZE_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_WMAXPACKETSIZE_COUNT: INTEGER := 0;
+	BETWEEN_ENDPOINT_BINTERVAL_INDEX: INTEGER := 0;
+	BETWEEN_ENDPOINT_BINTERVAL_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BCDUSB_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BCDUSB_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BRESERVED_INDEX: INTEGER := 0;
+	BETWEEN_DEVICE_QUALIFIER_BRESERVED_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_WTOTALLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_WTOTALLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BNUMINTERFACES_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BNUMINTERFACES_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_ICONFIGURATION_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMATTRIBUTES_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMATTRIBUTES_COUNT: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMAXPOWER_INDEX: INTEGER := 0;
+	BETWEEN_OTHER_SPEED_BMAXPOWER_COUNT: INTEGER := 0;
+
 	STARTS_WITH_MEMORY_ADDR_LENGTH: INTEGER := 1;
 	STARTS_WITH_MEMORY_ADDR_MAX_INDEX: INTEGER := 0;
 	STARTS_WITH_MEMORY_ADDR_MAX_COUNT: INTEGER := 0;
@@ -1344,6 +1469,7 @@ begin
 			GREATER_EQUALS_OPERATOR_ENABLE => '1',
 			LESS_OPERATOR_ENABLE => '1',
 			LESS_EQUALS_OPERATOR_ENABLE => '1',
+			BETWEEN_OPERATOR_ENABLE => '1',
 			STARTS_WITH_OPERATOR_ENABLE => '1',
 			ENDS_WITH_OPERATOR_ENABLE => '1',
 			CONTAINS_OPERATOR_ENABLE => '1',
@@ -2094,6 +2220,130 @@ begin
 			LESS_EQUALS_OTHER_SPEED_BMAXPOWER_INDEX => 0,
 			LESS_EQUALS_OTHER_SPEED_BMAXPOWER_COUNT => 0,
 
+			BETWEEN_MEMORY_ADDR_LENGTH => 1,
+			BETWEEN_MEMORY_ADDR_MAX_INDEX => 0,
+			BETWEEN_MEMORY_ADDR_MAX_COUNT => 0,
+			BETWEEN_DEVICE_BLENGTH_INDEX => 0,
+			BETWEEN_DEVICE_BLENGTH_COUNT => 0,
+			BETWEEN_DEVICE_BCDUSB_INDEX => 0,
+			BETWEEN_DEVICE_BCDUSB_COUNT => 0,
+			BETWEEN_DEVICE_BDEVICECLASS_INDEX => 0,
+			BETWEEN_DEVICE_BDEVICECLASS_COUNT => 0,
+			BETWEEN_DEVICE_BDEVICESUBCLASS_INDEX => 0,
+			BETWEEN_DEVICE_BDEVICESUBCLASS_COUNT => 0,
+			BETWEEN_DEVICE_BDEVICEPROTOCOL_INDEX => 0,
+			BETWEEN_DEVICE_BDEVICEPROTOCOL_COUNT => 0,
+			BETWEEN_DEVICE_BMAXPACKETSIZE0_INDEX => 0,
+			BETWEEN_DEVICE_BMAXPACKETSIZE0_COUNT => 0,
+			BETWEEN_DEVICE_IDVENDOR_INDEX => 0,
+			BETWEEN_DEVICE_IDVENDOR_COUNT => 0,
+			BETWEEN_DEVICE_IDPRODUCT_INDEX => 0,
+			BETWEEN_DEVICE_IDPRODUCT_COUNT => 0,
+			BETWEEN_DEVICE_BCDDEVICE_INDEX => 0,
+			BETWEEN_DEVICE_BCDDEVICE_COUNT => 0,
+			BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_INDEX => 0,
+			BETWEEN_DEVICE_IMANUFACTURER_BLENGTH_COUNT => 0,
+			BETWEEN_DEVICE_IMANUFACTURER_INDEX => 0,
+			BETWEEN_DEVICE_IMANUFACTURER_COUNT => 0,
+			BETWEEN_DEVICE_IPRODUCT_BLENGTH_INDEX => 0,
+			BETWEEN_DEVICE_IPRODUCT_BLENGTH_COUNT => 0,
+			BETWEEN_DEVICE_IPRODUCT_INDEX => 0,
+			BETWEEN_DEVICE_IPRODUCT_COUNT => 0,
+			BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_INDEX => 0,
+			BETWEEN_DEVICE_ISERIALNUMBER_BLENGTH_COUNT => 0,
+			BETWEEN_DEVICE_ISERIALNUMBER_INDEX => 0,
+			BETWEEN_DEVICE_ISERIALNUMBER_COUNT => 0,
+			BETWEEN_DEVICE_BNUMCONFIGURATIONS_INDEX => 0,
+			BETWEEN_DEVICE_BNUMCONFIGURATIONS_COUNT => 0,
+			BETWEEN_CONFIGURATION_BLENGTH_INDEX => 0,
+			BETWEEN_CONFIGURATION_BLENGTH_COUNT => 0,
+			BETWEEN_CONFIGURATION_WTOTALLENGTH_INDEX => 0,
+			BETWEEN_CONFIGURATION_WTOTALLENGTH_COUNT => 0,
+			BETWEEN_CONFIGURATION_BNUMINTERFACES_INDEX => 0,
+			BETWEEN_CONFIGURATION_BNUMINTERFACES_COUNT => 0,
+			BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_INDEX => 0,
+			BETWEEN_CONFIGURATION_BCONFIGURATIONVALUE_COUNT => 0,
+			BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_INDEX => 0,
+			BETWEEN_CONFIGURATION_ICONFIGURATION_BLENGTH_COUNT => 0,
+			BETWEEN_CONFIGURATION_ICONFIGURATION_INDEX => 0,
+			BETWEEN_CONFIGURATION_ICONFIGURATION_COUNT => 0,
+			BETWEEN_CONFIGURATION_BMATTRIBUTES_INDEX => 0,
+			BETWEEN_CONFIGURATION_BMATTRIBUTES_COUNT => 0,
+			BETWEEN_CONFIGURATION_BMAXPOWER_INDEX => 0,
+			BETWEEN_CONFIGURATION_BMAXPOWER_COUNT => 0,
+			BETWEEN_INTERFACE_BLENGTH_INDEX => 0,
+			BETWEEN_INTERFACE_BLENGTH_COUNT => 0,
+			BETWEEN_INTERFACE_BINTERFACENUMBER_INDEX => 0,
+			BETWEEN_INTERFACE_BINTERFACENUMBER_COUNT => 0,
+			BETWEEN_INTERFACE_BALTERNATESETTING_INDEX => 0,
+			BETWEEN_INTERFACE_BALTERNATESETTING_COUNT => 0,
+			BETWEEN_INTERFACE_BNUMENDPOINTS_INDEX => 0,
+			BETWEEN_INTERFACE_BNUMENDPOINTS_COUNT => 0,
+			BETWEEN_INTERFACE_BINTERFACECLASS_INDEX => 0,
+			BETWEEN_INTERFACE_BINTERFACECLASS_COUNT => 0,
+			BETWEEN_INTERFACE_BINTERFACESUBCLASS_INDEX => 0,
+			BETWEEN_INTERFACE_BINTERFACESUBCLASS_COUNT => 0,
+			BETWEEN_INTERFACE_BINTERFACEPROTOCOL_INDEX => 0,
+			BETWEEN_INTERFACE_BINTERFACEPROTOCOL_COUNT => 0,
+			BETWEEN_INTERFACE_IINTERFACE_BLENGTH_INDEX => 0,
+			BETWEEN_INTERFACE_IINTERFACE_BLENGTH_COUNT => 0,
+			BETWEEN_INTERFACE_IINTERFACE_INDEX => 0,
+			BETWEEN_INTERFACE_IINTERFACE_COUNT => 0,
+			BETWEEN_HID_BLENGTH_INDEX => 0,
+			BETWEEN_HID_BLENGTH_COUNT => 0,
+			BETWEEN_HID_BCDHID_INDEX => 0,
+			BETWEEN_HID_BCDHID_COUNT => 0,
+			BETWEEN_HID_BCOUNTRYCODE_INDEX => 0,
+			BETWEEN_HID_BCOUNTRYCODE_COUNT => 0,
+			BETWEEN_HID_BNUMDESCRIPTORS_INDEX => 0,
+			BETWEEN_HID_BNUMDESCRIPTORS_COUNT => 0,
+			BETWEEN_HID_BDESCRIPTORTYPE_INDEX => 0,
+			BETWEEN_HID_BDESCRIPTORTYPE_COUNT => 0,
+			BETWEEN_HID_WDESCRIPTORLENGTH_INDEX => 0,
+			BETWEEN_HID_WDESCRIPTORLENGTH_COUNT => 0,
+			BETWEEN_ENDPOINT_BLENGTH_INDEX => 0,
+			BETWEEN_ENDPOINT_BLENGTH_COUNT => 0,
+			BETWEEN_ENDPOINT_BENDPOINTADDRESS_INDEX => 0,
+			BETWEEN_ENDPOINT_BENDPOINTADDRESS_COUNT => 0,
+			BETWEEN_ENDPOINT_BMATTRIBUTES_INDEX => 0,
+			BETWEEN_ENDPOINT_BMATTRIBUTES_COUNT => 0,
+			BETWEEN_ENDPOINT_WMAXPACKETSIZE_INDEX => 0,
+			BETWEEN_ENDPOINT_WMAXPACKETSIZE_COUNT => 0,
+			BETWEEN_ENDPOINT_BINTERVAL_INDEX => 0,
+			BETWEEN_ENDPOINT_BINTERVAL_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BLENGTH_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BLENGTH_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BCDUSB_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BCDUSB_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BDEVICECLASS_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BDEVICESUBCLASS_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BDEVICEPROTOCOL_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BMAXPACKETSIZE0_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BNUMCONFIGURATIONS_COUNT => 0,
+			BETWEEN_DEVICE_QUALIFIER_BRESERVED_INDEX => 0,
+			BETWEEN_DEVICE_QUALIFIER_BRESERVED_COUNT => 0,
+			BETWEEN_OTHER_SPEED_BLENGTH_INDEX => 0,
+			BETWEEN_OTHER_SPEED_BLENGTH_COUNT => 0,
+			BETWEEN_OTHER_SPEED_WTOTALLENGTH_INDEX => 0,
+			BETWEEN_OTHER_SPEED_WTOTALLENGTH_COUNT => 0,
+			BETWEEN_OTHER_SPEED_BNUMINTERFACES_INDEX => 0,
+			BETWEEN_OTHER_SPEED_BNUMINTERFACES_COUNT => 0,
+			BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_INDEX => 0,
+			BETWEEN_OTHER_SPEED_BCONFIGURATIONVALUE_COUNT => 0,
+			BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_INDEX => 0,
+			BETWEEN_OTHER_SPEED_ICONFIGURATION_BLENGTH_COUNT => 0,
+			BETWEEN_OTHER_SPEED_ICONFIGURATION_INDEX => 0,
+			BETWEEN_OTHER_SPEED_ICONFIGURATION_COUNT => 0,
+			BETWEEN_OTHER_SPEED_BMATTRIBUTES_INDEX => 0,
+			BETWEEN_OTHER_SPEED_BMATTRIBUTES_COUNT => 0,
+			BETWEEN_OTHER_SPEED_BMAXPOWER_INDEX => 0,
+			BETWEEN_OTHER_SPEED_BMAXPOWER_COUNT => 0,
+
 			STARTS_WITH_MEMORY_ADDR_LENGTH => 1,
 			STARTS_WITH_MEMORY_ADDR_MAX_INDEX => 0,
 			STARTS_WITH_MEMORY_ADDR_MAX_COUNT => 0,